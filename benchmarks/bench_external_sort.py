@@ -0,0 +1,51 @@
+"""Compare external_sort with an in-memory sort.
+
+Run with ``python benchmarks/bench_external_sort.py``; times are the best of
+three runs, in milliseconds.  The input is a list of (int, str) records
+sorted by their first field, so the merge has ties to keep stable.  The
+runs go to the default temporary directory; pass another one with
+*tmpdir* to measure a different disk.
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from more_abc import PickleCodec, external_sort  # noqa: E402
+
+N = 500_000
+
+
+def first(record):
+    return record[0]
+
+
+def best(func, number=1):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e3
+
+
+def main():
+    rng = random.Random(0)
+    records = [(rng.randrange(N // 10), f"record {i}") for i in range(N)]
+    print(f"{N} records")
+    print(f"{'case':48} {'time':>10}")
+    ms = best(lambda: sorted(records, key=first))
+    print(f"{'sorted()':48} {ms:>8.1f}ms")
+    ms = best(lambda: list(external_sort(records, key=first, run_size=N + 1)))
+    print(f"{'external_sort, one run (no disk)':48} {ms:>8.1f}ms")
+    for run_size in (10_000, 50_000, 250_000):
+        for batch_size in (64, 1024, 8192):
+            codec = PickleCodec(batch_size=batch_size)
+            ms = best(lambda: list(external_sort(records, key=first, run_size=run_size,
+                                                 codec=codec)))
+            label = f"external_sort, run_size={run_size}, batch_size={batch_size}"
+            print(f"{label:48} {ms:>8.1f}ms")
+    ms = best(lambda: list(external_sort(records, key=first, run_size=10_000, fan_in=4)))
+    print(f"{'external_sort, run_size=10000, fan_in=4':48} {ms:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
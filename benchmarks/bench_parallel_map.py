@@ -0,0 +1,56 @@
+"""Compare Transformable.map with and without a pool.
+
+Run with ``python benchmarks/bench_parallel_map.py``; times are the best of
+three runs, in milliseconds.  The function hashes its input a few hundred
+times, so the work per element dominates the cost of shipping it to the
+pool.  Speed-ups from the process pool need more than one CPU.
+"""
+
+import os
+import sys
+import timeit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from hashlib import sha256
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from more_abc import PersistentVector, parallel_map  # noqa: E402
+
+N = 5_000
+
+
+def work(x):
+    digest = x.to_bytes(8, "little")
+    for _ in range(200):
+        digest = sha256(digest).digest()
+    return digest[0]
+
+
+def cheap(x):
+    return x + 1
+
+
+def best(func, number=1):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e3
+
+
+def main():
+    items = PersistentVector(range(N))
+    print(f"{os.cpu_count()} CPU(s), {N} elements")
+    print(f"{'case':52} {'time':>10}")
+    for label, func in (("cpu-bound", work), ("trivial", cheap)):
+        print(f"{label + ', map()':52} {best(lambda: items.map(func)):>8.1f}ms")
+        with ThreadPoolExecutor() as pool:
+            ms = best(lambda: items.map(func, executor=pool))
+            print(f"{label + ', map(executor=threads)':52} {ms:>8.1f}ms")
+        with ProcessPoolExecutor() as pool:
+            for chunksize in (1, 64, 1024):
+                ms = best(lambda: items.map(func, executor=pool, chunksize=chunksize))
+                print(f"{label + f', map(executor=processes, chunksize={chunksize})':52} "
+                      f"{ms:>8.1f}ms")
+            ms = best(lambda: list(parallel_map(func, range(N), pool, ordered=False)))
+            print(f"{label + ', parallel_map(ordered=False)':52} {ms:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Compare RingBufferedReader with io.BufferedReader over the same file.
+
+Run with ``python benchmarks/bench_ring_reader.py``; throughput is the best
+of three passes over a 64 MiB temporary file (mostly served from the page
+cache after the first pass).  "parse" rows do a little work per chunk, which
+is where prefetching on a second thread can overlap with the reads; that
+needs more than one CPU to pay off.
+"""
+
+import io
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from more_abc import RingBufferedReader  # noqa: E402
+
+SIZE = 64 << 20
+CHUNK = 64 << 10
+CAPACITY = 1 << 20
+
+
+def drain_read(f):
+    while f.read(CHUNK):
+        pass
+
+
+def drain_read1(f):
+    while f.read1(CHUNK):
+        pass
+
+
+def drain_read1_view(f):
+    while len(f.read1_view(CHUNK)):
+        pass
+
+
+def drain_readinto(f):
+    buf = bytearray(CHUNK)
+    while f.readinto(buf):
+        pass
+
+
+def drain_lines(f):
+    for _ in f:
+        pass
+
+
+def parse_read1(f):
+    while chunk := f.read1(CHUNK):
+        chunk.count(b"\n")
+
+
+def parse_read1_view(f):
+    while len(view := f.read1_view(CHUNK)):
+        view.tobytes().count(b"\n")
+
+
+def main():
+    fd, path = tempfile.mkstemp()
+    line = b"x" * 99 + b"\n"
+    with os.fdopen(fd, "wb") as f:
+        f.write(line * (SIZE // len(line)))
+
+    openers = {
+        "io.BufferedReader": lambda: io.BufferedReader(io.FileIO(path), CAPACITY),
+        "RingBufferedReader": lambda: RingBufferedReader(io.FileIO(path), CAPACITY),
+        "RingBufferedReader(prefetch)": lambda: RingBufferedReader(io.FileIO(path), CAPACITY,
+                                                                   prefetch=True),
+    }
+    cases = [("read(64k)", drain_read), ("read1(64k)", drain_read1),
+             ("readinto(64k)", drain_readinto), ("lines", drain_lines),
+             ("read1_view(64k)", drain_read1_view), ("parse read1", parse_read1),
+             ("parse read1_view", parse_read1_view)]
+    try:
+        print(f"{SIZE >> 20} MiB, capacity {CAPACITY >> 10} KiB, {os.cpu_count()} CPU(s)")
+        print(f"{'case':18} {'reader':30} {'MiB/s':>8}")
+        for label, func in cases:
+            for name, opener in openers.items():
+                if "view" in label and not name.startswith("Ring"):
+                    continue
+
+                def run():
+                    with opener() as f:
+                        func(f)
+
+                seconds = min(timeit.repeat(run, number=1, repeat=3))
+                print(f"{label:18} {name:30} {SIZE / 2**20 / seconds:>8.0f}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare the memory and creation time of ABCMixin and SlottedABCMixin instances.
+
+Run with ``python benchmarks/bench_slotted_memory.py [N]`` (default one
+million instances per class).  Memory is what :mod:`tracemalloc` sees
+allocated while the instances are alive, divided by *N*, so it covers the
+objects themselves and their ``__dict__`` but not the shared values.
+Creation times are the best of three runs.
+"""
+
+import gc
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from more_abc import ABCMixin, SlottedABCMixin  # noqa: E402
+
+
+class Plain(ABCMixin):
+    def __init__(self, x, y, name):
+        self.x, self.y, self.name = x, y, name
+
+    def initialize(self):
+        pass
+
+    def validate(self):
+        return True
+
+    def to_dict(self):
+        return {"x": self.x, "y": self.y, "name": self.name}
+
+
+class Slotted(SlottedABCMixin):
+    x: int
+    y: int
+    name: str
+
+    def __init__(self, x, y, name):
+        self.x, self.y, self.name = x, y, name
+
+    def initialize(self):
+        pass
+
+    def validate(self):
+        return True
+
+    def to_dict(self):
+        return {"x": self.x, "y": self.y, "name": self.name}
+
+
+def measure(cls, n):
+    gc.collect()
+    tracemalloc.start()
+    objs = [cls(1, 2, "n") for _ in range(n)]
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list holding the instances is the same for both classes.
+    size -= sys.getsizeof(objs)
+    del objs
+    return size / n, peak
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n} instances per class")
+    print(f"{'class':16} {'bytes/object':>14} {'peak':>10} {'create':>10}")
+    for cls in (Plain, Slotted):
+        per_object, peak = measure(cls, n)
+        ms = min(timeit.repeat(lambda: [cls(1, 2, "n") for _ in range(n)],
+                               number=1, repeat=3)) * 1e3
+        print(f"{cls.__name__:16} {per_object:>14.1f} {peak / 2**20:>8.1f}MB {ms:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Compare writev() with one write() per buffer and with joining the buffers.
+
+Run with ``python benchmarks/bench_vectored_io.py``.  Every record is a
+header, a payload and a trailer, written to a temporary file.  Times are
+the best of three runs; the syscall column counts the ``os.write`` and
+``os.writev`` calls of one run (the raw stream below calls ``os.write``
+directly, and ``writev`` looks up ``os.writev`` on every call, so wrapping
+both counts them).  The last rows read the same bytes back with readv().
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from more_abc import AbstractRawIO  # noqa: E402
+
+RECORDS = 100_000
+BATCH = 1_000  # records per call in the batched cases
+
+
+class FdRaw(AbstractRawIO):
+    def __init__(self, fd):
+        self.fd = fd
+
+    def fileno(self):
+        return self.fd
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return True
+
+    def read(self, size=-1):
+        return os.read(self.fd, size)
+
+    def readinto(self, b):
+        return os.readv(self.fd, [b])
+
+    def write(self, b):
+        return os.write(self.fd, b)
+
+
+class NoFdRaw(FdRaw):
+    """The same stream without fileno(), so writev() loops over write()."""
+
+    def fileno(self):
+        raise OSError("no descriptor")
+
+
+def records():
+    out = []
+    for i in range(RECORDS):
+        payload = b"x" * (20 + i % 200)
+        out.append((len(payload).to_bytes(4, "little"), payload, b"\n"))
+    return out
+
+
+def count_syscalls(func):
+    counts = {"write": 0, "writev": 0, "readv": 0}
+    originals = {name: getattr(os, name) for name in counts}
+
+    def counting(name):
+        original = originals[name]
+
+        def wrapper(*args):
+            counts[name] += 1
+            return original(*args)
+        return wrapper
+
+    for name in counts:
+        setattr(os, name, counting(name))
+    try:
+        func()
+    finally:
+        for name, original in originals.items():
+            setattr(os, name, original)
+    return sum(counts.values())
+
+
+def main():
+    data = records()
+    flat = [part for record in data for part in record]
+    total = sum(map(len, flat))
+    fd, path = tempfile.mkstemp()
+    try:
+        raw, no_fd = FdRaw(fd), NoFdRaw(fd)
+
+        def rewind(func):
+            def run():
+                os.lseek(fd, 0, os.SEEK_SET)
+                func()
+            return run
+
+        def write_each():
+            for part in flat:
+                raw.write(part)
+
+        def write_joined():
+            for i in range(0, len(flat), 3 * BATCH):
+                raw.write(b"".join(flat[i:i + 3 * BATCH]))
+
+        def writev_batches():
+            for i in range(0, len(flat), 3 * BATCH):
+                raw.writev(flat[i:i + 3 * BATCH])
+
+        def writev_without_fd():
+            for i in range(0, len(flat), 3 * BATCH):
+                no_fd.writev(flat[i:i + 3 * BATCH])
+
+        bufs = [bytearray(len(part)) for part in flat]
+
+        def readv_batches():
+            for i in range(0, len(bufs), 3 * BATCH):
+                raw.readv(bufs[i:i + 3 * BATCH])
+
+        print(f"{RECORDS} records, {len(flat)} buffers, {total / 2**20:.1f} MiB")
+        print(f"{'case':34} {'syscalls':>9} {'time':>10} {'MiB/s':>8}")
+        for label, func in (("write() per buffer", write_each),
+                            ("join + write() per batch", write_joined),
+                            ("writev() per batch", writev_batches),
+                            ("writev() per batch, no fileno", writev_without_fd),
+                            ("readv() per batch", readv_batches)):
+            func = rewind(func)
+            calls = count_syscalls(func)
+            seconds = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{label:34} {calls:>9} {seconds * 1e3:>8.1f}ms "
+                  f"{total / 2**20 / seconds:>8.0f}")
+    finally:
+        os.close(fd)
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
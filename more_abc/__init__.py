@@ -16,6 +16,8 @@ Public symbols
 --------------
 From this package:
     ABCMixin              -- ABC mixin with abstract initialize/validate/to_dict
+    SlottedABCMixin       -- ABCMixin variant whose subclasses get __slots__ from annotations
+    FastABCMeta           -- ABCMeta with a per-class, bounded isinstance/issubclass table
     ABCclassType          -- type alias: type(ABC)
     ABCMetaclassType      -- type alias: type(ABCMeta)
     ABCException          -- abstract base for custom exceptions
@@ -23,6 +25,10 @@ From this package:
     abstract_class        -- decorator that turns a class into an ABC with specified abstract methods
     abstractproperty      -- decorator that defines an abstract property (read-only or read-write)
     abstractdataclass     -- @dataclass + ABCMeta combined decorator
+    RecordTable           -- columnar, array-backed storage for abstractdataclass records
+    validate_many         -- batch is_valid() over many ABCMixin objects, optionally on a pool
+    to_dicts              -- batch to_dict() over many ABCMixin objects
+    to_columns            -- columnar (dict of lists) export of many ABCMixin objects
     
     ABCEnumMeta           -- combined ABCMeta + EnumMeta metaclass
     ABCEnum               -- Enum base class with abstract-method support
@@ -37,6 +43,8 @@ From this package:
     AbstractRawIO         -- abstract base for io.RawIOBase
     AbstractBufferedIO    -- abstract base for io.BufferedIOBase
     AbstractTextIO        -- abstract base for io.TextIOBase
+    AbstractAsyncRawIO    -- awaitable counterpart of AbstractRawIO
+    AbstractAsyncTextIO   -- awaitable counterpart of AbstractTextIO
 
     AbstractJSONDecoder   -- abstract base for json.JSONDecoder
     AbstractJSONEncoder   -- abstract base for json.JSONEncoder
@@ -50,62 +58,141 @@ From this package:
     BaseTransformable     -- minimal abstract interface for transformable containers
     TransformableMixin    -- concrete map() helper
     Transformable         -- final ABC combining BaseTransformable + TransformableMixin
+    structural_hook       -- __subclasshook__ factory for duck-typed ABCs
+    external_sort         -- bounded-memory sort of any iterable through temporary files
+    PickleCodec           -- default run codec for external_sort
+    LazyPipeline          -- fused, lazily evaluated filter/reject/map chain
+    F                     -- field factory for declarative predicates (F.age >= 18)
+    Field                 -- a record field named in a predicate
+    Predicate             -- base of declarative, index-friendly predicates
+    parallel_map          -- chunked, bounded map over a thread or process pool
+    BaseAsyncFilterable   -- minimal abstract interface for async filterable containers
+    AsyncFilterableMixin  -- concrete afilter()/areject() helpers
+    AsyncFilterable       -- final ABC combining BaseAsyncFilterable + AsyncFilterableMixin
+    BaseAsyncTransformable -- minimal abstract interface for async transformable containers
+    AsyncTransformableMixin -- concrete amap() helper
+    AsyncTransformable    -- final ABC combining BaseAsyncTransformable + AsyncTransformableMixin
+    async_filter          -- ordered async filter with bounded concurrency
+    async_map             -- ordered async map with bounded concurrency
+
+    SortedList            -- always-sorted list implementing Sortable/Filterable/Transformable
+    IndexedFilterable     -- Filterable records with hash/sorted indexes for F predicates
+    ArrayContainer        -- numeric container, vectorized with NumPy when available
+    AsyncStream           -- one-shot async stream implementing AsyncFilterable/AsyncTransformable
+    PersistentVector      -- structurally shared sequence with O(1) copies and O(log n) edits
+
+    MmapRawIO             -- AbstractRawIO over a memory-mapped file, with zero-copy views
+    RingBufferedReader    -- ring-buffer AbstractBufferedIO with memoryview reads and prefetch
+    AsyncRawIOAdapter     -- AbstractAsyncRawIO running a blocking raw stream in a thread pool
+    AsyncStreamIO         -- AbstractAsyncRawIO over asyncio StreamReader/StreamWriter
 
 Re-exported from `abc` module:
     ABC, ABCMeta, abstractmethod, get_cache_token
+
+Submodules (imported on first access, e.g. `more_abc.abc_io`):
+    more, abc_dataclasses, abc_enum, abc_loogging, abc_io, abc_json,
+    collections_abc, containers, streams
 """
 
 import sys
 import abc
+from importlib import import_module
 from abc import (ABC,
                  ABCMeta,
                  abstractmethod,
                  get_cache_token)  # `get_cache_token`? What it this?
 
-# Do you know why there are still many other extensions 
+# Submodules are imported on first attribute access (PEP 562), so that
+# `import more_abc` does not pull in logging, json, io, enum and dataclasses.
+# Do you know why there are still many other extensions
 # in my code even though there is clearly a `more.py` file?
-from .more import (ABCMixin,
-                   ABCclassType,
-                   ABCMetaclassType,
-                   ABCException,
-                   ABCWarning,
-                   abstract_class,
-                   abstractproperty)  # New one
-from .abc_dataclasses import abstractdataclass
-
-# It is unclear whether the code contained 
-# in this file overlaps with that of other developers.
-from .abc_enum import (ABCEnumMeta, 
-                       ABCEnum, 
-                       ABCIntEnum, 
-                       ABCFlag, 
-                       ABCIntFlag)
-from .abc_loogging import (AbstractLogFilter, 
-                           AbstractLogFormatter, 
-                           AbstractLogHandler)
-from .abc_io import (AbstractBufferedIO, 
-                     AbstractRawIO, 
-                     AbstractTextIO)
-from .abc_json import (AbstractJSONDecoder,
-                       AbstractJSONEncoder)
-from .collections_abc import (BaseSortable, 
-                              SortableMixin, 
-                              Sortable,
-                              BaseFilterable, 
-                              FilterableMixin, 
-                              Filterable,
-                              BaseTransformable, 
-                              TransformableMixin,
-                              Transformable)
+_submodule_exports = {
+    ".more": ("ABCMixin",
+              "SlottedABCMixin",
+              "FastABCMeta",
+              "ABCclassType",
+              "ABCMetaclassType",
+              "ABCException",
+              "ABCWarning",
+              "abstract_class",
+              "abstractproperty",  # New one
+              "validate_many",
+              "to_dicts",
+              "to_columns"),
+    ".abc_dataclasses": ("abstractdataclass",
+                         "RecordTable"),
+    # It is unclear whether the code contained
+    # in this file overlaps with that of other developers.
+    ".abc_enum": ("ABCEnumMeta",
+                  "ABCEnum",
+                  "ABCIntEnum",
+                  "ABCFlag",
+                  "ABCIntFlag"),
+    ".abc_loogging": ("AbstractLogFilter",
+                      "AbstractLogFormatter",
+                      "AbstractLogHandler"),
+    ".abc_io": ("AbstractBufferedIO",
+                "AbstractRawIO",
+                "AbstractTextIO",
+                "AbstractAsyncRawIO",
+                "AbstractAsyncTextIO"),
+    ".abc_json": ("AbstractJSONDecoder",
+                  "AbstractJSONEncoder"),
+    ".collections_abc": ("BaseSortable",
+                         "SortableMixin",
+                         "Sortable",
+                         "BaseFilterable",
+                         "FilterableMixin",
+                         "Filterable",
+                         "BaseTransformable",
+                         "TransformableMixin",
+                         "Transformable",
+                         "structural_hook",
+                         "external_sort",
+                         "PickleCodec",
+                         "LazyPipeline",
+                         "F",
+                         "Field",
+                         "Predicate",
+                         "parallel_map",
+                         "BaseAsyncFilterable",
+                         "AsyncFilterableMixin",
+                         "AsyncFilterable",
+                         "BaseAsyncTransformable",
+                         "AsyncTransformableMixin",
+                         "AsyncTransformable",
+                         "async_filter",
+                         "async_map"),
+    ".containers": ("SortedList",
+                    "IndexedFilterable",
+                    "ArrayContainer",
+                    "AsyncStream",
+                    "PersistentVector"),
+    ".streams": ("MmapRawIO",
+                 "RingBufferedReader",
+                 "AsyncRawIOAdapter",
+                 "AsyncStreamIO"),
+}
+_lazy_attrs = {name: module
+               for module, names in _submodule_exports.items()
+               for name in names}
+# `more_abc.abc_io` and friends work without an explicit import, too.
+_submodules = frozenset(module[1:] for module in _submodule_exports)
 
 __all__ = ["ABCMixin",
+           "SlottedABCMixin",
+           "FastABCMeta",
            "ABCclassType",
            "ABCMetaclassType",
            "ABCException",
            "ABCWarning",
            "abstract_class",
            "abstractproperty",
+           "validate_many",
+           "to_dicts",
+           "to_columns",
            "abstractdataclass",
+           "RecordTable",
            "ABCEnumMeta",
            "ABCEnum",
            "ABCIntEnum",
@@ -117,6 +204,8 @@ __all__ = ["ABCMixin",
            "AbstractRawIO",
            "AbstractBufferedIO",
            "AbstractTextIO",
+           "AbstractAsyncRawIO",
+           "AbstractAsyncTextIO",
            "AbstractJSONEncoder",
            "AbstractJSONDecoder",
            # collections_abc
@@ -129,6 +218,33 @@ __all__ = ["ABCMixin",
            "BaseTransformable", 
            "TransformableMixin", 
            "Transformable",
+           "structural_hook",
+           "external_sort",
+           "PickleCodec",
+           "LazyPipeline",
+           "F",
+           "Field",
+           "Predicate",
+           "parallel_map",
+           "BaseAsyncFilterable",
+           "AsyncFilterableMixin",
+           "AsyncFilterable",
+           "BaseAsyncTransformable",
+           "AsyncTransformableMixin",
+           "AsyncTransformable",
+           "async_filter",
+           "async_map",
+           # containers
+           "SortedList",
+           "IndexedFilterable",
+           "ArrayContainer",
+           "AsyncStream",
+           "PersistentVector",
+           # streams
+           "MmapRawIO",
+           "RingBufferedReader",
+           "AsyncRawIOAdapter",
+           "AsyncStreamIO",
            # re-exported from abc
            "ABC",
            "ABCMeta",
@@ -151,9 +267,8 @@ class ABCCompat(object):
     """Compatibility shim that mirrors all public symbols from :mod:`abc`.
 
     All non-underscore attributes of the standard :mod:`abc` module are copied
-    onto this class, then injected into the ``more_abc`` namespace via
-    ``sys.modules``.  This lets users import everything ABC-related from a
-    single package.
+    onto this class, then injected into the ``more_abc`` namespace.  This lets
+    users import everything ABC-related from a single package.
     """
 
 for attr in dir(abc):
@@ -165,4 +280,21 @@ if sys.version_info >= (3, 4):
 else:
     ABCCompat.ABC = abc.ABC # type: ignore
 
-sys.modules[__name__].__dict__.update(ABCCompat.__dict__)
\ No newline at end of file
+globals().update({k: v for k, v in vars(ABCCompat).items()
+                  if not k.startswith('_')})
+
+
+def __getattr__(name):
+    module = _lazy_attrs.get(name)
+    if module is None:
+        if name in _submodules:
+            # Importing binds the submodule here, so this runs only once.
+            return import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attrs) | _submodules)
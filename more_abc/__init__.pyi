@@ -2,17 +2,32 @@ from abc import (ABC as ABC,
                  ABCMeta as ABCMeta,
                  abstractmethod as abstractmethod,
                  get_cache_token as get_cache_token)
+from . import (abc_dataclasses as abc_dataclasses,
+               abc_enum as abc_enum,
+               abc_io as abc_io,
+               abc_json as abc_json,
+               abc_loogging as abc_loogging,
+               collections_abc as collections_abc,
+               containers as containers,
+               more as more,
+               streams as streams)
 from .more import (ABCMixin,
+                   SlottedABCMixin,
+                   FastABCMeta,
                    ABCclassType,
                    ABCMetaclassType,
                    ABCException,
                    ABCWarning,
                    abstract_class,
-                   abstractproperty)
-from .abc_dataclasses import abstractdataclass
+                   abstractproperty,
+                   validate_many,
+                   to_dicts,
+                   to_columns)
+from .abc_dataclasses import abstractdataclass, RecordTable
 from .abc_enum import ABCEnumMeta, ABCEnum, ABCIntEnum, ABCFlag, ABCIntFlag
 from .abc_loogging import AbstractLogFilter, AbstractLogFormatter, AbstractLogHandler
-from .abc_io import AbstractBufferedIO, AbstractRawIO, AbstractTextIO
+from .abc_io import (AbstractAsyncRawIO, AbstractAsyncTextIO, AbstractBufferedIO, AbstractRawIO,
+                     AbstractTextIO)
 from .abc_json import AbstractJSONDecoder, AbstractJSONEncoder
 from .collections_abc import (BaseSortable, 
                               SortableMixin, 
@@ -22,16 +37,44 @@ from .collections_abc import (BaseSortable,
                               Filterable,
                               BaseTransformable, 
                               TransformableMixin,
-                              Transformable)
+                              Transformable,
+                              structural_hook,
+                              external_sort,
+                              PickleCodec,
+                              LazyPipeline,
+                              F,
+                              Field,
+                              Predicate,
+                              parallel_map,
+                              BaseAsyncFilterable,
+                              AsyncFilterableMixin,
+                              AsyncFilterable,
+                              BaseAsyncTransformable,
+                              AsyncTransformableMixin,
+                              AsyncTransformable,
+                              async_filter,
+                              async_map)
+from .containers import (SortedList,
+                         IndexedFilterable,
+                         ArrayContainer,
+                         AsyncStream,
+                         PersistentVector)
+from .streams import AsyncRawIOAdapter, AsyncStreamIO, MmapRawIO, RingBufferedReader
 
 __all__ = ["ABCMixin",
+           "SlottedABCMixin",
+           "FastABCMeta",
            "ABCclassType",
            "ABCMetaclassType",
            "ABCException",
            "ABCWarning",
            "abstract_class",
            "abstractproperty",
+           "validate_many",
+           "to_dicts",
+           "to_columns",
            "abstractdataclass",
+           "RecordTable",
            "ABCEnumMeta",
            "ABCEnum",
            "ABCIntEnum",
@@ -43,6 +86,8 @@ __all__ = ["ABCMixin",
            "AbstractRawIO",
            "AbstractBufferedIO",
            "AbstractTextIO",
+           "AbstractAsyncRawIO",
+           "AbstractAsyncTextIO",
            "AbstractJSONEncoder",
            "AbstractJSONDecoder",
            # collections_abc
@@ -55,6 +100,33 @@ __all__ = ["ABCMixin",
            "BaseTransformable", 
            "TransformableMixin", 
            "Transformable",
+           "structural_hook",
+           "external_sort",
+           "PickleCodec",
+           "LazyPipeline",
+           "F",
+           "Field",
+           "Predicate",
+           "parallel_map",
+           "BaseAsyncFilterable",
+           "AsyncFilterableMixin",
+           "AsyncFilterable",
+           "BaseAsyncTransformable",
+           "AsyncTransformableMixin",
+           "AsyncTransformable",
+           "async_filter",
+           "async_map",
+           # containers
+           "SortedList",
+           "IndexedFilterable",
+           "ArrayContainer",
+           "AsyncStream",
+           "PersistentVector",
+           # streams
+           "MmapRawIO",
+           "RingBufferedReader",
+           "AsyncRawIOAdapter",
+           "AsyncStreamIO",
            # re-exported from abc
            "ABC",
            "ABCMeta",
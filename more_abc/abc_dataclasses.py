@@ -1,21 +1,211 @@
 """This submodule is an extension of the ABC functionality within the `dataclasses` module."""
 
-from dataclasses import dataclass
+import dataclasses
+from array import array
+from dataclasses import MISSING, Field, InitVar, dataclass, fields, is_dataclass
 from abc import ABC, ABCMeta
+from itertools import chain, filterfalse, starmap
+from operator import attrgetter
 
-def _ensure_abcmeta(cls):
-    """Rebuild *cls* with ABCMeta as its metaclass if it doesn't already use one."""
+__all__ = ["abstractdataclass", "RecordTable"]
+
+def _get_slots(cls):
+    slots = cls.__dict__.get("__slots__", ())
+    return (slots,) if isinstance(slots, str) else slots
+
+
+def _dataclass_getstate(self):
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _dataclass_setstate(self, state):
+    for f, value in zip(fields(self), state):
+        # Frozen dataclasses block normal attribute assignment.
+        object.__setattr__(self, f.name, value)
+
+
+def _has_slot_only_default(cls):
+    """Whether a dataclass field of *cls* has ``init=False`` and a plain default.
+
+    ``dataclass(slots=False)`` leaves such defaults on the class instead of
+    assigning them in ``__init__``, which does not work once they are slots.
+    """
+    candidates = [v for v in cls.__dict__.values() if isinstance(v, Field)]
+    for base in cls.__mro__[1:]:
+        candidates.extend(getattr(base, "__dataclass_fields__", {}).values())
+    return any(not f.init and f.default is not MISSING for f in candidates)
+
+
+def _ensure_abcmeta(cls, slots=False, weakref_slot=False, frozen=False):
+    """Rebuild *cls* with ABCMeta as its metaclass if it doesn't already use one.
+
+    With *slots*, *cls* must already be a dataclass; the rebuilt class also
+    gets ``__slots__`` for its fields, mirroring ``dataclass(slots=True)``,
+    so that the ABC and the slotted layout come out of a single class
+    construction.
+    """
     if isinstance(cls, ABCMeta):
-        return cls
-    bases = cls.__bases__
-    # Replace bare `object` with ABC to avoid a metaclass conflict.
-    new_bases = tuple(ABC if b is object else b for b in bases)
-    if not any(isinstance(b, ABCMeta) for b in new_bases):
-        new_bases = (ABC,) + new_bases
+        if not slots:
+            return cls
+        metaclass, new_bases = type(cls), cls.__bases__
+    else:
+        metaclass = ABCMeta
+        bases = cls.__bases__
+        # Replace bare `object` with ABC to avoid a metaclass conflict.
+        new_bases = tuple(ABC if b is object else b for b in bases)
+        if not any(isinstance(b, ABCMeta) for b in new_bases):
+            new_bases = (ABC,) + new_bases
     ns = {k: v for k, v in cls.__dict__.items()
           if k not in ("__dict__", "__weakref__")}
-    return ABCMeta(cls.__name__, new_bases, ns)
+    ns["__qualname__"] = cls.__qualname__
+
+    if slots:
+        if "__slots__" in cls.__dict__:
+            raise TypeError(f"{cls.__name__} already specifies __slots__")
+        field_names = tuple(f.name for f in fields(cls))
+        inherited_slots = set(chain.from_iterable(map(_get_slots, cls.__mro__[1:-1])))
+        ns["__slots__"] = tuple(filterfalse(
+            inherited_slots.__contains__,
+            chain(field_names, ("__weakref__",) if weakref_slot else ()),
+        ))
+        for name in field_names:
+            # Defaults already live in the generated __init__.
+            ns.pop(name, None)
+        if frozen:
+            # Needed for pickling frozen classes with slots.
+            ns.setdefault("__getstate__", _dataclass_getstate)
+            ns.setdefault("__setstate__", _dataclass_setstate)
+
+    return metaclass(cls.__name__, new_bases, ns)
+
+
+
+# ======================================================================
+# Bulk constructors attached to every abstractdataclass.
+
+# Placeholder default for init fields that have a default_factory.
+_HAS_DEFAULT_FACTORY = object()
 
+# The marker dataclass() sets on the pseudo-fields of InitVar annotations.
+_FIELD_INITVAR = getattr(dataclasses, "_FIELD_INITVAR", object())
+
+
+def _has_initvars(cls):
+    for f in cls.__dataclass_fields__.values():
+        t = f.type
+        if t is InitVar or isinstance(t, InitVar) or getattr(t, "__origin__", None) is InitVar:
+            return True
+        # String annotations (``from __future__ import annotations``) stay
+        # unresolved on the field; dataclass() has already classified them.
+        if isinstance(t, str) and getattr(f, "_field_type", None) is _FIELD_INITVAR:
+            return True
+    return False
+
+
+def _bulk_builder(cls):
+    """Return (and cache on *cls*) an ``__init__`` replacement that skips ``__post_init__``.
+
+    The function takes the same parameters as the dataclass ``__init__`` and
+    returns a new instance.
+    """
+    builder = cls.__dict__.get("_bulk_builder")
+    if builder is not None:
+        return builder
+    frozen = cls.__dataclass_params__.frozen
+    namespace = {"__dataclass_cls__": cls,
+                 "__dataclass_new__": object.__new__,
+                 "__dataclass_setattr__": object.__setattr__,
+                 "__dataclass_HAS_DEFAULT_FACTORY__": _HAS_DEFAULT_FACTORY}
+    params, kw_params, body = [], [], []
+    for f in fields(cls):
+        default = f"__dataclass_dflt_{f.name}__"
+        if f.default_factory is not MISSING:
+            namespace[default] = f.default_factory
+            if f.init:
+                value = (f"{default}() if {f.name} is "
+                         f"__dataclass_HAS_DEFAULT_FACTORY__ else {f.name}")
+            else:
+                value = f"{default}()"
+        elif f.init:
+            value = f.name
+            if f.default is not MISSING:
+                namespace[default] = f.default
+        elif f.default is not MISSING:
+            namespace[default] = f.default
+            value = default
+        else:
+            continue
+        if f.init:
+            param = f.name
+            if f.default_factory is not MISSING:
+                param += "=__dataclass_HAS_DEFAULT_FACTORY__"
+            elif f.default is not MISSING:
+                param += f"={default}"
+            (kw_params if f.kw_only else params).append(param)
+        if frozen:
+            body.append(f"__dataclass_setattr__(__dataclass_self__, {f.name!r}, {value})")
+        else:
+            body.append(f"__dataclass_self__.{f.name} = {value}")
+    if kw_params:
+        params += ["*"] + kw_params
+    source = (f"def __create__({', '.join(params)}):\n"
+              "    __dataclass_self__ = __dataclass_new__(__dataclass_cls__)\n"
+              + "".join(f"    {line}\n" for line in body)
+              + "    return __dataclass_self__\n")
+    exec(source, namespace)
+    builder = namespace["__create__"]
+    builder.__qualname__ = f"{cls.__qualname__}.__create__"
+    type.__setattr__(cls, "_bulk_builder", builder)
+    return builder
+
+
+def _constructor(cls, post_init):
+    # The generated __init__ is already straight-line code, so calling the
+    # class is the fastest way to build an instance; only skipping
+    # __post_init__ needs a separate function.
+    if post_init or not hasattr(cls, "__post_init__"):
+        return cls
+    if _has_initvars(cls):
+        raise ValueError(f"{cls.__name__} has InitVar fields, which only __post_init__ "
+                         "receives; post_init=False is not supported")
+    return _bulk_builder(cls)
+
+
+def _from_tuples(cls, rows, post_init=True):
+    """Create one instance per tuple of positional ``__init__`` arguments.
+
+    Pass ``post_init=False`` to skip ``__post_init__``; classes with
+    ``InitVar`` fields raise :class:`ValueError` for it.
+    """
+    return list(starmap(_constructor(cls, post_init), rows))
+
+
+def _from_dicts(cls, rows, post_init=True):
+    """Create one instance per mapping of ``__init__`` keyword arguments."""
+    build = _constructor(cls, post_init)
+    return [build(**row) for row in rows]
+
+
+def _from_columns(cls, columns, post_init=True):
+    """Create instances from a mapping of field name to equally long sequences."""
+    build = _constructor(cls, post_init)
+    names = tuple(columns)
+    values = [columns[name] for name in names]
+    if not values:
+        return []
+    lengths = {name: len(v) for name, v in zip(names, values)}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"all columns must have the same length, got {lengths}")
+    positional = tuple(f.name for f in fields(cls) if f.init and not f.kw_only)
+    if names == positional[:len(names)]:
+        return list(map(build, *values))
+    return [build(**dict(zip(names, row))) for row in zip(*values)]
+
+
+_BULK_CONSTRUCTORS = {"from_tuples": _from_tuples,
+                      "from_dicts": _from_dicts,
+                      "from_columns": _from_columns}
+# ======================================================================
 
 
 def abstractdataclass(cls=None, /, *, init=True, repr=True, eq=True, order=False,
@@ -27,21 +217,233 @@ def abstractdataclass(cls=None, /, *, init=True, repr=True, eq=True, order=False
     The decorated class gains ``ABCMeta`` as its metaclass automatically, so
     you can declare :func:`~abc.abstractmethod` members without manually
     inheriting from :class:`~abc.ABC`.
+
+    The class also gains the classmethods ``from_tuples(rows)``,
+    ``from_dicts(rows)`` and ``from_columns(mapping)`` (unless it already has
+    attributes with those names).  They build instances in bulk without a
+    Python-level loop per row, work with ``frozen`` and ``slots``, and accept
+    ``post_init=False`` to skip ``__post_init__`` (where dataclasses usually
+    validate their fields; not supported with ``InitVar`` fields).
+
+    With ``slots=True`` the dataclass methods are generated on the original
+    class first and the final ABC + ``__slots__`` class is built once, instead
+    of rebuilding the class for ABCMeta and again for the slots.  Classes
+    with an ``init=False`` field that has a plain default keep the two-step
+    path, because only ``dataclass(slots=True)`` initialises such fields.
     """
+    if weakref_slot and not slots:
+        raise TypeError("weakref_slot is True but slots is False")
+
     def wrap(c):
-        c = _ensure_abcmeta(c)
-        return dataclass(c, 
-                        init=init, 
-                        repr=repr, 
-                        eq=eq, 
-                        order=order, 
-                        unsafe_hash=unsafe_hash,
-                        frozen=frozen, 
-                        match_args=match_args, 
-                        kw_only=kw_only, 
-                        slots=slots,
-                        weakref_slot=weakref_slot) # type: ignore
+        single_pass = slots and not _has_slot_only_default(c)
+        if not single_pass:
+            c = _ensure_abcmeta(c)
+        c = dataclass(c,
+                      init=init,
+                      repr=repr,
+                      eq=eq,
+                      order=order,
+                      unsafe_hash=unsafe_hash,
+                      frozen=frozen,
+                      match_args=match_args,
+                      kw_only=kw_only,
+                      slots=slots and not single_pass,
+                      weakref_slot=weakref_slot and not single_pass) # type: ignore
+        if single_pass:
+            c = _ensure_abcmeta(c, slots=True, weakref_slot=weakref_slot, frozen=frozen)
+        for name, func in _BULK_CONSTRUCTORS.items():
+            if not hasattr(c, name):
+                setattr(c, name, classmethod(func))
+        return c
 
     if cls is None:
         return wrap
     return wrap(cls)
+
+
+# ======================================================================
+# Columnar storage for abstractdataclass records.
+
+# Field annotations that get a typed `array.array` column; everything else
+# is stored in a plain list.
+_TYPECODES = {int: "q", float: "d", "int": "q", "float": "d"}
+
+
+def _numpy():
+    """Return the numpy module, or None when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _field_property(name):
+    def fget(self):
+        return self._table._columns[name][self._index]
+
+    def fset(self, value):
+        self._table._columns[name][self._index] = value
+
+    return property(fget, fset)
+
+
+def _view_record(self):
+    """Copy the row into a real instance of the record class (no ``__init__``)."""
+    record = object.__new__(self._record_type)
+    columns, index = self._table._columns, self._index
+    for name in columns:
+        object.__setattr__(record, name, columns[name][index])
+    return record
+
+
+def _view_comparison(name):
+    def compare(self, other):
+        if type(other) is type(self):
+            other = other._record()
+        return getattr(self._record(), name)(other)
+
+    compare.__name__ = name
+    return compare
+
+
+def _view_repr(self):
+    return repr(self._record())
+
+
+def _view_hash(self):
+    return hash(self._record())
+
+
+def _row_view_type(row_type):
+    """Return (and cache on *row_type*) the row view class of a RecordTable."""
+    view_type = row_type.__dict__.get("_record_view")
+    if view_type is None:
+        ns = {"__slots__": ("_table", "_index"),
+              "__qualname__": f"{row_type.__qualname__}View",
+              "__module__": row_type.__module__,
+              "_record_type": row_type,
+              "_record": _view_record}
+        for f in fields(row_type):
+            ns[f.name] = _field_property(f.name)
+        # Dataclass comparisons and repr check or print the exact class, so
+        # run them on a materialized record instead.
+        for name in ("__eq__", "__lt__", "__le__", "__gt__", "__ge__"):
+            if getattr(row_type, name) is not getattr(object, name):
+                ns[name] = _view_comparison(name)
+        if "__eq__" in ns:
+            ns["__hash__"] = None if row_type.__hash__ is None else _view_hash
+        if row_type.__repr__ is not object.__repr__:
+            ns["__repr__"] = _view_repr
+        view_type = type(row_type)(f"{row_type.__name__}View", (row_type,), ns)
+        type.__setattr__(row_type, "_record_view", view_type)
+    return view_type
+
+
+def _tuple_getter(names):
+    """Return a function mapping a record to the tuple of its *names* values."""
+    if len(names) > 1:
+        return attrgetter(*names)
+    if names:
+        get = attrgetter(names[0])
+        return lambda row: (get(row),)
+    return lambda row: ()
+
+
+class RecordTable:
+    """
+    Column store for the records of a dataclass built with :func:`abstractdataclass`.
+
+    Every ``int`` and ``float`` field is kept in an :class:`array.array`
+    (8 bytes per value); other fields are kept in lists.  Indexing or
+    iterating the table yields lightweight views: instances of a subclass of
+    *row_type* whose fields read from (and, unless the dataclass is frozen,
+    write to) the columns, so the record's own methods work on them.  A
+    view compares, orders and reprs like a *row_type* instance with the
+    same field values.  Abstract row types are rejected, as they could not
+    be instantiated.
+
+    :meth:`column` gives vectorized access to one field: a NumPy array sharing
+    the column's memory when NumPy is installed, a :class:`memoryview`
+    otherwise.  While such a view is alive the column cannot grow, so
+    :meth:`append` and :meth:`extend` raise :exc:`BufferError`.
+    """
+
+    def __init__(self, row_type, rows=()):
+        if not is_dataclass(row_type):
+            raise TypeError(f"{row_type!r} is not a dataclass")
+        abstract = getattr(row_type, "__abstractmethods__", ())
+        if abstract:
+            raise TypeError(
+                f"Can't create a RecordTable of abstract class {row_type.__name__} "
+                f"with abstract methods {', '.join(sorted(abstract))}"
+            )
+        self.row_type = row_type
+        self._view_type = _row_view_type(row_type)
+        self._names = tuple(f.name for f in fields(row_type))
+        self._columns = {}
+        for f in fields(row_type):
+            typecode = _TYPECODES.get(f.type)
+            self._columns[f.name] = array(typecode) if typecode else []
+        self._astuple = _tuple_getter(self._names)
+        self.extend(rows)
+
+    def __len__(self):
+        return len(self._columns[self._names[0]]) if self._names else 0
+
+    def _row(self, row):
+        if isinstance(row, tuple):
+            if len(row) != len(self._names):
+                raise ValueError(
+                    f"expected {len(self._names)} values per row, got {len(row)}"
+                )
+            return row
+        return self._astuple(row)
+
+    def append(self, row):
+        """Append one record, given as a *row_type* instance or a tuple of field values."""
+        self.extend((row,))
+
+    def extend(self, rows):
+        """Append many records, given as *row_type* instances or tuples of field values."""
+        rows = [self._row(row) for row in rows]
+        if not rows:
+            return
+        size = len(self)
+        columns = [self._columns[name] for name in self._names]
+        try:
+            for column, values in zip(columns, zip(*rows)):
+                column.extend(values)
+        except BaseException:
+            for column in columns:
+                del column[size:]
+            raise
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("RecordTable index out of range")
+        view = object.__new__(self._view_type)
+        object.__setattr__(view, "_table", self)
+        object.__setattr__(view, "_index", index)
+        return view
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def column(self, name):
+        """Return the values of field *name* for vectorized access."""
+        values = self._columns[name]
+        np = _numpy()
+        if isinstance(values, array):
+            return memoryview(values) if np is None else np.frombuffer(values, dtype=values.typecode)
+        return list(values) if np is None else np.array(values, dtype=object)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.row_type.__name__}, {len(self)} rows)"
+# ======================================================================
@@ -1,10 +1,14 @@
-from typing import Callable, TypeVar, overload
+from array import array
+from typing import (Any, Callable, Generic, Iterable, Iterator, Mapping, Sequence, TypeVar,
+                    Union, overload)
 
-__all__ = ["abstractdataclass"]
+__all__ = ["abstractdataclass", "RecordTable"]
 
 _T = TypeVar("_T")
 
-def _ensure_abcmeta(cls: type) -> type: ...
+def _ensure_abcmeta(
+    cls: type, slots: bool = ..., weakref_slot: bool = ..., frozen: bool = ...
+) -> type: ...
 
 @overload
 def abstractdataclass(cls: type[_T], /) -> type[_T]: ...
@@ -25,3 +29,22 @@ def abstractdataclass(
     weakref_slot: bool = ...,
 ) -> Callable[[type[_T]], type[_T]]: ...
 
+# abstractdataclass attaches these to the class as the classmethods
+# from_tuples, from_dicts and from_columns.
+def _from_tuples(cls: type[_T], rows: Iterable[Iterable[Any]], post_init: bool = ...) -> list[_T]: ...
+def _from_dicts(cls: type[_T], rows: Iterable[Mapping[str, Any]], post_init: bool = ...) -> list[_T]: ...
+def _from_columns(cls: type[_T], columns: Mapping[str, Sequence[Any]], post_init: bool = ...) -> list[_T]: ...
+
+
+class RecordTable(Generic[_T]):
+    row_type: type[_T]
+    def __init__(self, row_type: type[_T], rows: Iterable[Union[_T, tuple[Any, ...]]] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def append(self, row: Union[_T, tuple[Any, ...]]) -> None: ...
+    def extend(self, rows: Iterable[Union[_T, tuple[Any, ...]]]) -> None: ...
+    @overload
+    def __getitem__(self, index: int) -> _T: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[_T]: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def column(self, name: str) -> Any: ...
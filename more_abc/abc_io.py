@@ -1,14 +1,128 @@
 """This submodule is an extension of the ABC functionality within the `io` module."""
 
 import abc
+import codecs
+import errno
 import io
+import operator
+import os
 
 __all__ = [
     "AbstractRawIO",
     "AbstractBufferedIO",
     "AbstractTextIO",
+    "AbstractAsyncRawIO",
+    "AbstractAsyncTextIO",
 ]
 
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
+_nbytes = operator.attrgetter("nbytes")
+_plain_buffers = frozenset((bytes, bytearray))
+
+
+def _size(buffers):
+    """Total byte size of *buffers*."""
+    if _plain_buffers.issuperset(map(type, buffers)):
+        return sum(map(len, buffers))  # len() is the byte count; skip memoryviews
+    return sum(map(_nbytes, map(memoryview, buffers)))
+
+
+def _split_lines(text):
+    """Split *text* after each "\n", keeping the line ends."""
+    lines = text.splitlines(True)
+    # splitlines() also breaks on "\r", "\x0c", "\u2028", ...; if it found
+    # exactly as many lines as there are "\n", it broke on those alone.
+    if len(lines) == text.count("\n") + (not text.endswith("\n")):
+        return lines
+    lines = text.split("\n")
+    last = lines.pop()
+    lines = [line + "\n" for line in lines]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _byte_views(buffers):
+    """Flat byte views of *buffers*, with the empty ones dropped."""
+    views = []
+    for b in buffers:
+        view = memoryview(b)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        if view.nbytes:
+            views.append(view)
+    return views
+
+
+def _transfer(stream, buffers, vector, single):
+    """
+    Move *buffers* through ``os.<vector>(fd, batch)``, or through
+    ``single(view)`` one buffer at a time when that call or a descriptor is
+    unavailable, resuming after partial transfers.
+
+    Stops early at EOF (a 0 return) or when a non-blocking stream would block;
+    returns the byte count, or None if it would block before moving anything.
+    """
+    if not isinstance(buffers, (list, tuple)):
+        buffers = list(buffers)
+    vector = getattr(os, vector, None)
+    fd = None
+    if vector is not None:
+        try:
+            fd = stream.fileno()
+        except (OSError, ValueError):  # includes io.UnsupportedOperation
+            pass
+    # Common case: every call moves its whole batch (up to IOV_MAX buffers
+    # for the vectored call, one for the fallback).
+    step = 1 if fd is None else _IOV_MAX
+    total = start = 0
+    while start < len(buffers):
+        batch = buffers[start:start + step]
+        try:
+            n = single(batch[0]) if fd is None else vector(fd, batch)
+        except BlockingIOError:
+            n = None
+        if n is None:
+            return total or None
+        total += n
+        if n != _size(batch):
+            break
+        start += step
+    else:
+        return total
+    if not n:
+        return total
+    views = _byte_views(buffers[start:])
+    start = 0
+    while True:
+        while start < len(views) and n >= views[start].nbytes:
+            n -= views[start].nbytes
+            start += 1
+        if start == len(views):
+            break
+        if n:
+            views[start] = views[start][n:]
+        try:
+            if fd is None:
+                n = single(views[start])
+            else:
+                n = vector(fd, views[start:start + _IOV_MAX])
+        except BlockingIOError:
+            n = None
+        if n is None:
+            return total or None
+        if not n:
+            break
+        total += n
+    return total
+
 
 class AbstractRawIO(io.RawIOBase, metaclass=abc.ABCMeta):
     """Abstract base class for raw binary I/O, extending io.RawIOBase.
@@ -16,6 +130,12 @@ class AbstractRawIO(io.RawIOBase, metaclass=abc.ABCMeta):
     All custom raw I/O implementations should subclass this to guarantee a
     consistent interface.  Subclasses must implement :meth:`read`,
     :meth:`readinto`, and :meth:`write`.
+
+    :meth:`writev` and :meth:`readv` hand a whole list of buffers to a
+    single ``os.writev``/``os.readv`` call when :meth:`fileno` returns a
+    descriptor, and fall back to :meth:`write`/:meth:`readinto` otherwise.
+    A subclass whose bytes do not go straight to its descriptor (or that
+    keeps its own position) should override both.
     """
 
     @abc.abstractmethod
@@ -39,6 +159,26 @@ class AbstractRawIO(io.RawIOBase, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError("Subclasses must implement write()")
 
+    def writev(self, buffers):
+        """
+        Write every buffer in *buffers* in order, without joining them.
+
+        Returns the number of bytes written; this is short only when a
+        non-blocking stream would block (None if nothing was written).
+        """
+        self._checkClosed()
+        return _transfer(self, buffers, "writev", self.write)
+
+    def readv(self, buffers):
+        """
+        Fill the writable buffers in *buffers* in order until EOF.
+
+        Returns the number of bytes read; this is short at EOF or when a
+        non-blocking stream would block (None if nothing was read).
+        """
+        self._checkClosed()
+        return _transfer(self, buffers, "readv", self.readinto)
+
 
 class AbstractBufferedIO(io.BufferedIOBase, metaclass=abc.ABCMeta):
     """
@@ -47,6 +187,10 @@ class AbstractBufferedIO(io.BufferedIOBase, metaclass=abc.ABCMeta):
     All custom buffered I/O implementations should subclass this to guarantee
     a consistent interface.  Subclasses must implement :meth:`read`,
     :meth:`read1`, and :meth:`write`.
+
+    :meth:`writev` sends large batches of buffers past the buffer with one
+    vectored write to ``self.raw`` when the stream is write-only and has
+    one; everything else goes through :meth:`write` and :meth:`readinto`.
     """
 
     @abc.abstractmethod
@@ -70,6 +214,60 @@ class AbstractBufferedIO(io.BufferedIOBase, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError("Subclasses must implement write()")
 
+    def writev(self, buffers):
+        """
+        Write every buffer in *buffers* in order, without joining them.
+
+        Batches smaller than ``io.DEFAULT_BUFFER_SIZE`` are copied into the
+        buffer by :meth:`write`.  Larger ones on a write-only stream with a
+        ``raw`` attribute flush the buffer and go to
+        :meth:`AbstractRawIO.writev` (or the equivalent ``os.writev`` call on
+        a plain raw stream).  Returns the number of bytes written.
+        """
+        self._checkClosed()
+        views = _byte_views(buffers)
+        total = sum(view.nbytes for view in views)
+        raw = getattr(self, "raw", None)
+        if total < io.DEFAULT_BUFFER_SIZE or raw is None or self.readable():
+            written = 0
+            for view in views:
+                try:
+                    self.write(view)
+                except BlockingIOError as exc:
+                    exc.characters_written += written
+                    raise
+                written += view.nbytes
+            return written
+        self.flush()
+        writev = getattr(raw, "writev", None)
+        if writev is not None:
+            written = writev(views)
+        else:
+            written = _transfer(raw, views, "writev", raw.write)
+        if (written or 0) < total:
+            raise BlockingIOError(errno.EAGAIN, "write could not complete without blocking",
+                                  written or 0)
+        return total
+
+    def readv(self, buffers):
+        """
+        Fill the writable buffers in *buffers* in order until EOF, through
+        :meth:`readinto`.
+
+        Returns the number of bytes read (None if a non-blocking stream had
+        nothing to give).
+        """
+        self._checkClosed()
+        total = 0
+        for view in _byte_views(buffers):
+            n = self.readinto(view)
+            if n is None:
+                return total or None
+            total += n
+            if n < view.nbytes:
+                break
+        return total
+
 
 class AbstractTextIO(io.TextIOBase, metaclass=abc.ABCMeta):
     """
@@ -78,6 +276,10 @@ class AbstractTextIO(io.TextIOBase, metaclass=abc.ABCMeta):
     All custom text I/O implementations should subclass this to guarantee a
     consistent interface.  Subclasses must implement :meth:`read`,
     :meth:`readline`, and :meth:`write`.
+
+    :meth:`readlines_chunked` and :meth:`iter_lines_batched` read large
+    chunks and split them in bulk instead of calling :meth:`readline` once
+    per line.
     """
 
     @abc.abstractmethod
@@ -100,3 +302,207 @@ class AbstractTextIO(io.TextIOBase, metaclass=abc.ABCMeta):
         Write string *s* to the stream.
         """
         raise NotImplementedError("Subclasses must implement write()")
+
+    def readlines_chunked(self, chunk_size=1 << 18):
+        """
+        Yield the remaining lines as lists, one list per chunk of input.
+
+        Lines keep their ``"\n"``; a line that spans chunks is completed
+        before it is yielded, and only the last one may lack its newline.
+
+        When the stream exposes the binary :attr:`buffer` it wraps together
+        with an :attr:`encoding`, *chunk_size* bytes at a time are read from
+        the buffer and decoded with an incremental decoder (so multibyte
+        characters and ``"\r\n"`` pairs may straddle chunks); newlines are
+        translated as with :class:`io.TextIOWrapper`'s default.  Text
+        already buffered by this object is bypassed, so call it before any
+        other read.  Otherwise *chunk_size* characters at a time come from
+        :meth:`read`.
+        """
+        pieces = []  # an unfinished line, possibly spanning several chunks
+        for text in self._text_chunks(chunk_size):
+            if "\n" not in text:
+                pieces.append(text)
+                continue
+            if pieces:
+                pieces.append(text)
+                text = "".join(pieces)
+                pieces = []
+            lines = _split_lines(text)
+            if not lines[-1].endswith("\n"):
+                pieces.append(lines.pop())
+            yield lines
+        if pieces:
+            yield ["".join(pieces)]
+
+    def _text_chunks(self, chunk_size):
+        """Yield the remaining text in chunks, decoding from :attr:`buffer` when possible."""
+        self._checkClosed()
+        buffer = getattr(self, "buffer", None)
+        encoding = self.encoding
+        if buffer is None or encoding is None:
+            while text := self.read(chunk_size):
+                yield text
+            return
+        decoder = codecs.getincrementaldecoder(encoding)(self.errors or "strict")
+        decoder = io.IncrementalNewlineDecoder(decoder, translate=True)
+        while True:
+            data = buffer.read(chunk_size)
+            text = decoder.decode(data, final=not data)
+            if text:
+                yield text
+            if not data:
+                return
+
+    def iter_lines_batched(self, batch_size=1024, chunk_size=1 << 18):
+        """
+        Yield the remaining lines in lists of *batch_size* (the last list
+        may be shorter), read as described in :meth:`readlines_chunked`.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        pending = []
+        for lines in self.readlines_chunked(chunk_size):
+            if pending:
+                pending.extend(lines)
+                lines, pending = pending, []
+            end = len(lines) - len(lines) % batch_size
+            for start in range(0, end, batch_size):
+                yield lines[start:start + batch_size]
+            pending = lines[end:]
+        if pending:
+            yield pending
+
+
+class _AsyncIOBase(metaclass=abc.ABCMeta):
+    """Closing, ``async with`` and ``async for`` shared by the async I/O ABCs."""
+
+    _closed = False
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def _checkClosed(self):
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def readable(self):
+        return False
+
+    def writable(self):
+        return False
+
+    async def close(self):
+        """
+        Close the stream; later operations raise :class:`ValueError`.
+        Subclasses that hold resources should release them and then await
+        ``super().close()``.
+        """
+        self._closed = True
+
+    async def __aenter__(self):
+        self._checkClosed()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __aiter__(self):
+        self._checkClosed()
+        return self
+
+    async def __anext__(self):
+        line = await self.readline()
+        if not line:
+            raise StopAsyncIteration
+        return line
+
+
+class AbstractAsyncRawIO(_AsyncIOBase):
+    """
+    Abstract base class for asyncio raw binary I/O, the awaitable
+    counterpart of :class:`AbstractRawIO`.
+
+    Subclasses must implement the coroutines :meth:`read`,
+    :meth:`readinto`, and :meth:`write`.  :meth:`readline` (a byte at a
+    time, as in :class:`io.RawIOBase`), :meth:`readall`, ``async for`` over
+    lines and ``async with`` are built on them; override :meth:`readline`
+    and :meth:`close` where the stream can do better.
+    """
+
+    @abc.abstractmethod
+    async def read(self, size=-1):
+        """
+        Read and return up to *size* bytes.
+        """
+        raise NotImplementedError("Subclasses must implement read()")
+
+    @abc.abstractmethod
+    async def readinto(self, b):
+        """
+        Read bytes into a pre-allocated buffer *b*.
+        """
+        raise NotImplementedError("Subclasses must implement readinto()")
+
+    @abc.abstractmethod
+    async def write(self, b):
+        """
+        Write bytes *b* to the stream.
+        """
+        raise NotImplementedError("Subclasses must implement write()")
+
+    async def readline(self, size=-1):
+        """
+        Read until newline or EOF and return a single line.
+        """
+        line = bytearray()
+        while size is None or size < 0 or len(line) < size:
+            b = await self.read(1)
+            if not b:
+                break
+            line += b
+            if b == b"\n":
+                break
+        return bytes(line)
+
+    async def readall(self):
+        """
+        Read and return all bytes until EOF.
+        """
+        chunks = []
+        while chunk := await self.read(io.DEFAULT_BUFFER_SIZE):
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+
+class AbstractAsyncTextIO(_AsyncIOBase):
+    """
+    Abstract base class for asyncio text I/O, the awaitable counterpart of
+    :class:`AbstractTextIO`.
+
+    Subclasses must implement the coroutines :meth:`read`,
+    :meth:`readline`, and :meth:`write`; ``async for`` over lines and
+    ``async with`` are built on them.
+    """
+
+    @abc.abstractmethod
+    async def read(self, size=-1):
+        """
+        Read and return at most *size* characters.
+        """
+        raise NotImplementedError("Subclasses must implement read()")
+
+    @abc.abstractmethod
+    async def readline(self, size=-1):
+        """
+        Read until newline or EOF and return a single line.
+        """
+        raise NotImplementedError("Subclasses must implement readline()")
+
+    @abc.abstractmethod
+    async def write(self, s):
+        """
+        Write string *s* to the stream.
+        """
+        raise NotImplementedError("Subclasses must implement write()")
@@ -1,10 +1,12 @@
 # """Type stubs for `more_abc.abc_io`."""
 
 import io
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional, TypeVar
 from _typeshed import ReadableBuffer, WriteableBuffer
 
-__all__ = ["AbstractRawIO", "AbstractBufferedIO", "AbstractTextIO"]
+_S = TypeVar("_S")
+
+__all__ = ["AbstractRawIO", "AbstractBufferedIO", "AbstractTextIO", "AbstractAsyncRawIO", "AbstractAsyncTextIO"]
 
 
 class AbstractRawIO(io.RawIOBase):
@@ -13,6 +15,8 @@ class AbstractRawIO(io.RawIOBase):
     def read(self, size: int = ...) -> bytes: ...
     def readinto(self, b: WriteableBuffer) -> int: ...
     def write(self, b: ReadableBuffer) -> int: ...
+    def writev(self, buffers: Iterable[ReadableBuffer]) -> Optional[int]: ...
+    def readv(self, buffers: Iterable[WriteableBuffer]) -> Optional[int]: ...
 
 
 class AbstractBufferedIO(io.BufferedIOBase):
@@ -21,6 +25,8 @@ class AbstractBufferedIO(io.BufferedIOBase):
     def read(self, size: Optional[int] = ...) -> bytes: ...
     def read1(self, size: int = ...) -> bytes: ...
     def write(self, b: ReadableBuffer) -> int: ...
+    def writev(self, buffers: Iterable[ReadableBuffer]) -> int: ...
+    def readv(self, buffers: Iterable[WriteableBuffer]) -> Optional[int]: ...
 
 
 class AbstractTextIO(io.TextIOBase):
@@ -29,3 +35,36 @@ class AbstractTextIO(io.TextIOBase):
     def read(self, size: Optional[int] = ...) -> str: ...
     def readline(self, size: Optional[int] = ...) -> str: ...
     def write(self, s: str) -> int: ...
+    def readlines_chunked(self, chunk_size: int = ...) -> Iterator[list[str]]: ...
+    def iter_lines_batched(self, batch_size: int = ..., chunk_size: int = ...) -> Iterator[list[str]]: ...
+
+
+class _AsyncIOBase:
+    @property
+    def closed(self) -> bool: ...
+    def readable(self) -> bool: ...
+    def writable(self) -> bool: ...
+    async def close(self) -> None: ...
+    async def __aenter__(self: _S) -> _S: ...
+    async def __aexit__(self, *exc_info: Any) -> None: ...
+    def __aiter__(self: _S) -> _S: ...
+
+
+class AbstractAsyncRawIO(_AsyncIOBase):
+    # """Abstract base class for asyncio raw binary I/O, the awaitable counterpart of AbstractRawIO."""
+
+    async def read(self, size: Optional[int] = ...) -> Optional[bytes]: ...
+    async def readinto(self, b: WriteableBuffer) -> Optional[int]: ...
+    async def write(self, b: ReadableBuffer) -> Optional[int]: ...
+    async def readline(self, size: Optional[int] = ...) -> bytes: ...
+    async def readall(self) -> bytes: ...
+    async def __anext__(self) -> bytes: ...
+
+
+class AbstractAsyncTextIO(_AsyncIOBase):
+    # """Abstract base class for asyncio text I/O, the awaitable counterpart of AbstractTextIO."""
+
+    async def read(self, size: Optional[int] = ...) -> str: ...
+    async def readline(self, size: Optional[int] = ...) -> str: ...
+    async def write(self, s: str) -> int: ...
+    async def __anext__(self) -> str: ...
@@ -1,13 +1,22 @@
 """This submodule is an extension of the ABC functionality within the `json` module."""
 
 import abc
+import codecs
+import io
 import json
+from functools import partial
+from json.decoder import WHITESPACE
+from json.scanner import make_scanner
 
 __all__ = [
     "AbstractJSONEncoder",
     "AbstractJSONDecoder",
 ]
 
+# dump_to() walks lists/dicts longer than this entry by entry, encoding runs of
+# this many entries at a time; shorter ones nested in them are encoded whole.
+_STREAM_LEN = 256
+
 
 class AbstractJSONEncoder(json.JSONEncoder, metaclass=abc.ABCMeta):
     """
@@ -38,6 +47,129 @@ class AbstractJSONEncoder(json.JSONEncoder, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError("Subclasses must implement iterencode()")
 
+    def dump_to(self, o, stream, chunk_size=1 << 16, encoding="utf-8"):
+        """
+        Serialize *o* into *stream* in pieces of about *chunk_size*
+        characters, without building the whole document in memory.
+
+        *stream* is a text file (which gets ``str``) or any binary stream:
+        an :class:`~more_abc.AbstractRawIO`, an
+        :class:`~more_abc.AbstractBufferedIO` or a binary file object, which
+        gets the pieces encoded incrementally with *encoding*; short writes
+        on raw streams are retried.  Returns the number of characters or
+        bytes written.
+
+        The fragments come from :meth:`iterencode`.  Without ``indent``,
+        the containers are walked here and their entries encoded in runs
+        with ``iterencode(run, _one_shot=True)``, which keeps the C
+        accelerator of :class:`json.JSONEncoder` in use while memory stays
+        bounded by a run instead of the whole document.  :meth:`iterencode`
+        then never sees the top-level list or dict (nor the large lists and
+        dicts inside it), only runs of their entries, so an override that
+        rewrites the document as a whole is not applied; set ``indent`` to
+        have ``iterencode(o)`` produce the whole document instead.
+        """
+        if self.indent is None:
+            fragments = self._stream_fragments(o, {} if self.check_circular else None)
+        else:
+            fragments = self.iterencode(o)
+        if isinstance(stream, io.TextIOBase):
+            encode = None
+        else:
+            encode = codecs.getincrementalencoder(encoding)().encode
+        raw = isinstance(stream, io.RawIOBase)
+        write = stream.write
+        written = 0
+        pending = []
+        size = 0
+        for fragment in fragments:
+            pending.append(fragment)
+            size += len(fragment)
+            if size >= chunk_size:
+                written += _write(write, raw, encode, "".join(pending))
+                pending.clear()
+                size = 0
+        if pending:
+            written += _write(write, raw, encode, "".join(pending))
+        if encode is not None:
+            written += _write(write, raw, None, encode("", True))
+        return written
+
+    def _stream_fragments(self, o, markers):
+        """
+        Fragments of *o*, walking lists and dicts here.  Small containers
+        (envelopes) are walked all the way down to their container values;
+        in large ones only large containers are walked, and the other
+        entries are encoded in runs.
+        """
+        if isinstance(o, (list, tuple)):
+            items, is_dict = o, False
+        elif isinstance(o, dict):
+            items, is_dict = o.items(), True
+            if self.sort_keys:
+                items = sorted(items)
+        else:
+            yield from self.iterencode(o, _one_shot=True)
+            return
+        if markers is not None:
+            if id(o) in markers:
+                raise ValueError("Circular reference detected")
+            markers[id(o)] = o
+        small = len(o) <= _STREAM_LEN
+        yield "{" if is_dict else "["
+        separator = ""
+        run = []
+        for item in items:
+            value = item[1] if is_dict else item
+            if not (isinstance(value, (list, tuple, dict)) and (small or len(value) > _STREAM_LEN)):
+                run.append(item)
+                if len(run) < _STREAM_LEN:
+                    continue
+                value = None
+            if run:
+                # Encode the run as one container and drop its brackets.
+                text = "".join(self.iterencode(dict(run) if is_dict else run, _one_shot=True))[1:-1]
+                run.clear()
+                if text:
+                    yield separator
+                    yield text
+                    separator = self.item_separator
+            if value is None:
+                continue
+            if is_dict:
+                # The key as the encoder writes it: '{"key": 0}' minus '{' and '0}'.
+                key = "".join(self.iterencode({item[0]: 0}, _one_shot=True))[1:-2]
+                if not key:
+                    continue  # dropped by skipkeys
+                yield separator
+                yield key
+            else:
+                yield separator
+            yield from self._stream_fragments(value, markers)
+            separator = self.item_separator
+        if run:
+            text = "".join(self.iterencode(dict(run) if is_dict else run, _one_shot=True))[1:-1]
+            if text:
+                yield separator
+                yield text
+        yield "}" if is_dict else "]"
+        if markers is not None:
+            del markers[id(o)]
+
+
+def _write(write, raw, encode, text):
+    """Write *text* (encoded first unless *encode* is None); raw writes may be short."""
+    data = text if encode is None else encode(text)
+    if not raw:
+        write(data)
+        return len(data)
+    view = memoryview(data)
+    while view:
+        n = write(view)
+        if n is None:
+            raise BlockingIOError("dump_to() needs a blocking stream")
+        view = view[n:]
+    return len(data)
 
 
 class AbstractJSONDecoder(json.JSONDecoder, metaclass=abc.ABCMeta):
@@ -61,3 +193,192 @@ class AbstractJSONDecoder(json.JSONDecoder, metaclass=abc.ABCMeta):
         Decode a JSON document from *s* starting at index *idx*.
         """
         raise NotImplementedError("Subclasses must implement raw_decode()")
+
+    def iter_decode(self, stream, chunk_size=1 << 20, encoding="utf-8", executor=None):
+        """
+        Yield the JSON documents of *stream* one by one: NDJSON or any
+        whitespace-separated concatenation of documents.
+
+        *stream* is a text file or a binary stream (decoded incrementally
+        with *encoding*), read *chunk_size* at a time.  Documents are decoded
+        with :meth:`raw_decode` at offsets into the current chunk, so only
+        a document that straddles two chunks is copied.
+
+        With an *executor* the input must be NDJSON (one document per
+        line): each chunk is cut after its last newline and the segments are
+        decoded on the executor (see
+        :func:`~more_abc.collections_abc.parallel_map`), in order.  A
+        process pool needs a picklable decoder; the C scanner is rebuilt on
+        unpickling.
+
+        A malformed document raises :class:`json.JSONDecodeError` with its
+        position in the whole stream, without reading ahead first.  A
+        non-blocking stream that has no data ready raises
+        :class:`BlockingIOError`.
+        """
+        chunks = _read_text(stream, chunk_size, encoding)
+        if executor is not None:
+            from .collections_abc import parallel_map
+
+            segments = parallel_map(partial(_decode_documents, self), _ndjson_segments(chunks),
+                                    executor, chunksize=1)
+            for documents, err, position in segments:
+                yield from documents
+                if err is not None:
+                    raise _stream_error(err, position)
+            return
+        raw_decode = self.raw_decode
+        skip = WHITESPACE.match
+        buf = ""
+        idx = limit = 0
+        position = _START  # where buf starts in the stream, for error messages
+        eof = False
+        while True:
+            idx = skip(buf, idx).end()
+            if idx == len(buf):
+                position = _advance(position, buf, idx)
+                buf = next(chunks, None)
+                if buf is None:
+                    return
+                idx = 0
+                limit = _after_last_whitespace(buf)
+                continue
+            try:
+                obj, end = raw_decode(buf, idx)
+            except json.JSONDecodeError as err:
+                # An error before the last whitespace of the buffer cannot be
+                # caused by the chunk boundary, except an unterminated string
+                # (reported where the string starts).
+                if eof or err.pos < limit and not err.msg.startswith("Unterminated string"):
+                    raise _stream_error(err, position) from None
+                end = None
+            # A document cut by the end of the buffer fails to decode, except
+            # a number, which is only known to be complete when whitespace
+            # follows it: read on, then decode it again.
+            if end is None or end >= limit and not eof and buf[idx] in _NUMBER_START:
+                position = _advance(position, buf, idx)
+                pending = [buf[idx:]]
+                size = 0
+                while size < len(pending[0]):  # grow geometrically for large documents
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        eof = True
+                        break
+                    pending.append(chunk)
+                    size += len(chunk)
+                buf = "".join(pending)
+                idx = 0
+                limit = _after_last_whitespace(buf)
+                continue
+            yield obj
+            idx = end
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("scan_once", None)  # a C scanner object; not picklable
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "parse_object" in state:
+            self.scan_once = make_scanner(self)
+
+
+_NUMBER_START = frozenset("-0123456789")
+
+
+def _after_last_whitespace(text):
+    """Index just past the last JSON whitespace character of *text* (0 if none)."""
+    return max(text.rfind(" "), text.rfind("\n"), text.rfind("\r"), text.rfind("\t")) + 1
+
+
+# (offset, line, column) of the start of a stream.
+_START = (0, 1, 0)
+
+
+def _advance(position, text, end):
+    """Move *position* past ``text[:end]``."""
+    offset, line, column = position
+    newlines = text.count("\n", 0, end)
+    if newlines:
+        return offset + end, line + newlines, end - text.rfind("\n", 0, end) - 1
+    return offset + end, line, column + end
+
+
+def _stream_error(err, position):
+    """Re-anchor *err*, raised on text that starts at *position* of the stream."""
+    offset, line, column = position
+    pos = offset + err.pos
+    lineno = line + err.lineno - 1
+    colno = err.colno + column if err.lineno == 1 else err.colno
+    exc = json.JSONDecodeError(err.msg, err.doc, err.pos)
+    exc.pos, exc.lineno, exc.colno = pos, lineno, colno
+    exc.args = (f"{err.msg}: line {lineno} column {colno} (char {pos})",)
+    return exc
+
+
+def _read_text(stream, chunk_size, encoding):
+    """Yield the text of *stream* in chunks, decoding bytes incrementally."""
+    decoder = None
+    if not isinstance(stream, io.TextIOBase):
+        decoder = codecs.getincrementaldecoder(encoding)()
+    while True:
+        data = stream.read(chunk_size)
+        if data is None:
+            raise BlockingIOError("iter_decode() needs a blocking stream")
+        if decoder is None:
+            if not data:
+                return
+            yield data
+            continue
+        chunk = decoder.decode(data, not data)
+        if chunk:
+            yield chunk
+        if not data:
+            return
+
+
+def _ndjson_segments(chunks):
+    """
+    Regroup text chunks into segments that end after a newline, each paired
+    with its position in the stream.
+    """
+    position = _START
+    pending = []
+    for chunk in chunks:
+        cut = chunk.rfind("\n") + 1
+        if not cut:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:cut])
+        segment = "".join(pending)
+        yield segment, position
+        position = _advance(position, segment, len(segment))
+        pending = [chunk[cut:]]
+    tail = "".join(pending)
+    if tail.strip():
+        yield tail, position
+
+
+def _decode_documents(decoder, segment):
+    """
+    Decode every whitespace-separated document of a segment (a worker task).
+
+    Returns the documents, the :class:`json.JSONDecodeError` that stopped
+    decoding (or ``None``) and the segment's position.  The error is returned
+    rather than raised so that it is re-anchored in the consuming thread:
+    a re-anchored error would not survive pickling.
+    """
+    text, position = segment
+    raw_decode = decoder.raw_decode
+    skip = WHITESPACE.match
+    documents = []
+    idx = skip(text, 0).end()
+    try:
+        while idx < len(text):
+            obj, idx = raw_decode(text, idx)
+            documents.append(obj)
+            idx = skip(text, idx).end()
+    except json.JSONDecodeError as err:
+        return documents, err, position
+    return documents, None, position
@@ -1,7 +1,10 @@
 # """Type stubs for `more_abc.abc_json`."""
 
 import json
-from typing import Any, Iterator
+from concurrent.futures import Executor
+from typing import IO, Any, Iterator, Optional, Union
+
+from .abc_io import AbstractBufferedIO, AbstractRawIO
 
 __all__ = [
     "AbstractJSONEncoder",
@@ -15,6 +18,13 @@ class AbstractJSONEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any: ...
     def encode(self, o: Any) -> str: ...
     def iterencode(self, o: Any, _one_shot: bool = ...) -> Iterator[str]: ...
+    def dump_to(
+        self,
+        o: Any,
+        stream: Union[AbstractRawIO, AbstractBufferedIO, IO[str], IO[bytes]],
+        chunk_size: int = ...,
+        encoding: str = ...,
+    ) -> int: ...
 
 
 class AbstractJSONDecoder(json.JSONDecoder):
@@ -22,3 +32,12 @@ class AbstractJSONDecoder(json.JSONDecoder):
 
     def decode(self, s: str, _w: Any = ...) -> Any: ...
     def raw_decode(self, s: str, idx: int = ...) -> tuple[Any, int]: ...
+    def iter_decode(
+        self,
+        stream: Union[AbstractRawIO, AbstractBufferedIO, IO[str], IO[bytes]],
+        chunk_size: int = ...,
+        encoding: str = ...,
+        executor: Optional[Executor] = ...,
+    ) -> Iterator[Any]: ...
+    def __getstate__(self) -> dict[str, Any]: ...
+    def __setstate__(self, state: dict[str, Any]) -> None: ...
@@ -4,13 +4,86 @@ This submodule is an extension of the ABC functionality within the `collections.
 """
 
 import abc
+import heapq
+import operator
+import os
+from collections import deque
+from functools import partial
+from itertools import filterfalse, islice
+from types import MethodType
+
+from .more import _chunked
 
 __all__ = [
     "BaseSortable", "SortableMixin", "Sortable",
     "BaseFilterable", "FilterableMixin", "Filterable",
     "BaseTransformable", "TransformableMixin", "Transformable",
+    "structural_hook",
+    "external_sort", "PickleCodec",
+    "LazyPipeline",
+    "F", "Field", "Predicate",
+    "parallel_map",
+    "BaseAsyncFilterable", "AsyncFilterableMixin", "AsyncFilterable",
+    "BaseAsyncTransformable", "AsyncTransformableMixin", "AsyncTransformable",
+    "async_filter", "async_map",
 ]
 
+
+class structural_hook:
+    """
+    Build a ``__subclasshook__`` that recognises classes by the methods they define.
+
+    Assign the result in the class body of an ABC::
+
+        class Sortable(BaseSortable, SortableMixin):
+            __subclasshook__ = structural_hook("__sort__")
+
+    A class ``C`` is reported as a subclass when every name in *required*
+    resolves on ``C`` to something other than ``None`` (setting a method to
+    ``None`` opts out, as in :mod:`collections.abc`).  The hook only answers
+    for the class it is defined on; subclasses of that ABC fall back to the
+    normal rules, exactly like the ``if cls is Sortable`` idiom.
+
+    Lookups go through the interpreter's per-type attribute cache instead of
+    walking ``C.__mro__`` in Python, so repeated checks over many classes
+    are cheap.  Results are cached by :class:`~abc.ABCMeta` as usual, and
+    ``register()`` keeps working as before.  Because of that cache, adding a
+    method to (or removing one from) a class that was already checked is
+    not seen until the ABC's cache is cleared with :meth:`invalidate`::
+
+        C.__sort__ = lambda self, reverse=False: None
+        Sortable.__subclasshook__.invalidate()
+    """
+
+    __slots__ = ("required", "owner")
+
+    def __init__(self, *required):
+        if not required:
+            raise TypeError("structural_hook() requires at least one method name")
+        self.required = required
+        self.owner = None
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+
+    def __get__(self, instance, owner=None):
+        if owner is None:
+            owner = type(instance)
+        return MethodType(self, owner)
+
+    def invalidate(self):
+        """Forget the cached subclass checks of the ABC this hook is defined on."""
+        if self.owner is not None:
+            self.owner._abc_caches_clear()
+
+    def __call__(self, cls, C):
+        if cls is not self.owner:
+            return NotImplemented
+        for name in self.required:
+            if getattr(C, name, None) is None:
+                return NotImplemented
+        return True
+
 class BaseSortable(metaclass=abc.ABCMeta):
     """
     Minimal interface for sortable containers (similar to `collections.abc.BaseIterable`),
@@ -47,18 +120,254 @@ class SortableMixin:
         """A Mixin may also declare abstract methods and require subclasses to implement them."""
         raise NotImplementedError
     
+    # The helpers below only need iteration over the container, so they work
+    # on any Sortable without copying it; containers that keep their elements
+    # ordered can override them with direct lookups.
+
+    def nsmallest(self, k, key=None):
+        """Return a list of the *k* smallest elements, in ascending order (O(n log k))."""
+        return heapq.nsmallest(k, self, key=key)  # type: ignore
+
+    def nlargest(self, k, key=None):
+        """Return a list of the *k* largest elements, in descending order (O(n log k))."""
+        return heapq.nlargest(k, self, key=key)  # type: ignore
+
+    def partition(self, k, key=None):
+        """
+        Return a list of the elements arranged so that position *k* holds the
+        element a full sort would put there, with no larger element before it
+        and no smaller one after it.  Runs in expected O(n) (quickselect).
+        """
+        items = list(self)  # type: ignore
+        n = len(items)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError("partition index out of range")
+        if key is None:
+            return _quickselect(items, k)
+        # Decorate with the position so that ties never compare the elements.
+        pool = _quickselect([(key(x), i) for i, x in enumerate(items)], k)
+        return [items[i] for _, i in pool]
+
+    def iter_sorted(self, key=None, reverse=False, external=False, **options):
+        """
+        Lazily yield the elements in sorted order (stable, like `sorted`).
+
+        Elements are partitioned only as far as needed to produce the next
+        one (incremental quicksort), so reading the first *k* elements costs
+        expected O(n + k log k) instead of a full sort.
+
+        With ``external=True`` the container is streamed through
+        :func:`external_sort` instead, which keeps memory bounded for data
+        that does not fit in RAM; *options* are passed on to it.
+        """
+        if external:
+            return external_sort(self, key=key, reverse=reverse, **options)
+        items = list(self)  # type: ignore
+        if key is None:
+            return _iter_sorted(items, None, reverse)
+        keys = list(map(key, items))
+        return map(items.__getitem__,
+                   _iter_sorted(list(range(len(items))), keys.__getitem__, reverse))
+
+
+def _quickselect(pool, k):
+    """Rearrange a copy of *pool* so that ``pool[k]`` is in its sorted position."""
+    below, above = [], []
+    # Depth limit: fall back to sorting what is left on adversarial input.
+    budget = 2 * len(pool).bit_length()
+    while len(pool) > 16 and budget:
+        budget -= 1
+        a, b, c = pool[0], pool[len(pool) // 2], pool[-1]
+        pivot = sorted((a, b, c))[1]
+        lower = [x for x in pool if x < pivot]
+        if k < len(lower):
+            above.append([x for x in pool if pivot < x])
+            above.append([x for x in pool if not (x < pivot or pivot < x)])
+            pool = lower
+            continue
+        equal = [x for x in pool if not (x < pivot or pivot < x)]
+        if k < len(lower) + len(equal):
+            below.append(lower)
+            above.append([x for x in pool if pivot < x])
+            pool = equal
+            break
+        below.append(lower)
+        below.append(equal)
+        k -= len(lower) + len(equal)
+        pool = [x for x in pool if pivot < x]
+    else:
+        pool = sorted(pool)
+    result = []
+    for part in below:
+        result.extend(part)
+    result.extend(pool)
+    for part in reversed(above):
+        result.extend(part)
+    return result
+
+
+def _iter_sorted(pool, key, reverse):
+    """Yield *pool* in sorted order, partitioning only the front segment."""
+    # Stack of (segment, already ordered, depth budget); the next segment to
+    # yield from is on top.  Each split aims its pivot at a front part about
+    # as large as what was yielded so far, so short prefixes only scan the
+    # input about once while a full iteration still does O(log n) passes.
+    # Comprehensions keep the original order within each part, which keeps
+    # the result stable.
+    stack = [(pool, False, 2 * len(pool).bit_length())]
+    produced = 0
+    while stack:
+        seg, ordered, budget = stack.pop()
+        target = max(32, produced)
+        while not ordered:
+            size = len(seg)
+            if size <= 4 * target or not budget:
+                seg = sorted(seg, key=key, reverse=reverse)
+                break
+            budget -= 1
+            sample = seg[::size // 64]
+            sample = sorted(sample if key is None else map(key, sample), reverse=reverse)
+            pivot = sample[min(len(sample) - 1, 2 * target * len(sample) // size)]
+            if key is None:
+                lower = [x for x in seg if x < pivot]
+                upper = [x for x in seg if pivot < x]
+            else:
+                lower = [x for x in seg if key(x) < pivot]
+                upper = [x for x in seg if pivot < key(x)]
+            if len(lower) + len(upper) == size - 1 and key is None:
+                equal = [pivot]
+            elif key is None:
+                equal = [x for x in seg if not (x < pivot or pivot < x)]
+            else:
+                equal = [x for x in seg if not (key(x) < pivot or pivot < key(x))]
+            if reverse:
+                lower, upper = upper, lower
+            stack.append((upper, False, budget))
+            stack.append((equal, True, 0))
+            seg = lower
+        produced += len(seg)
+        yield from seg
+
+
+class PickleCodec:
+    """
+    Codec used by :func:`external_sort` to write runs to disk and read them back.
+
+    Items are pickled in batches of *batch_size*, which keeps the per-item
+    overhead low while reading a run back only holds one batch in memory.
+    *protocol* defaults to :data:`pickle.HIGHEST_PROTOCOL`.  Any object with the same ``dump(items, fp)`` / ``load(fp)`` pair can be
+    used instead.
+    """
+
+    def __init__(self, protocol=None, batch_size=1024):
+        if protocol is None:
+            import pickle
+            protocol = pickle.HIGHEST_PROTOCOL
+        self.protocol = protocol
+        self.batch_size = batch_size
+
+    def dump(self, items, fp):
+        """Write every item of the iterable *items* to the binary file *fp*."""
+        import pickle
+
+        items = iter(items)
+        while True:
+            batch = list(islice(items, self.batch_size))
+            if not batch:
+                return
+            pickle.dump(batch, fp, self.protocol)
+
+    def load(self, fp):
+        """Yield the items written by :meth:`dump`, in order."""
+        import pickle
+
+        while True:
+            try:
+                batch = pickle.load(fp)
+            except EOFError:
+                return
+            yield from batch
+
+
+def external_sort(iterable, key=None, reverse=False, run_size=100_000,
+                  codec=None, tmpdir=None, fan_in=64):
+    """
+    Sort an iterable that may not fit in memory; return an iterator.
+
+    The input is read *run_size* items at a time.  Each run is sorted in
+    memory and spilled to an anonymous temporary file (in *tmpdir*) through
+    *codec* (a :class:`PickleCodec` by default), then the runs are k-way
+    merged with :func:`heapq.merge`.  At most *fan_in* runs are merged at
+    once; beyond that, groups of runs are first merged into longer runs.
+    Peak memory is about one run plus one codec batch per merged run.
+
+    The sort is stable, and an input that fits in a single run is sorted in
+    memory without touching the disk.  Temporary files are removed when the
+    iterator is exhausted or closed.
+    """
+    if run_size < 1:
+        raise ValueError("run_size must be at least 1")
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    if codec is None:
+        codec = PickleCodec()
+    return _external_sort(iter(iterable), key, reverse, run_size, codec, tmpdir, fan_in)
+
+
+def _external_sort(items, key, reverse, run_size, codec, tmpdir, fan_in):
+    from tempfile import TemporaryFile
+
+    opened = []
+
+    def spill(run):
+        fp = TemporaryFile(dir=tmpdir)
+        opened.append(fp)
+        codec.dump(run, fp)
+        fp.seek(0)
+        return fp
+
+    def merge(runs):
+        return heapq.merge(*[codec.load(fp) for fp in runs], key=key, reverse=reverse)
+
+    try:
+        runs = []
+        while True:
+            run = list(islice(items, run_size))
+            if not run:
+                break
+            run.sort(key=key, reverse=reverse)
+            if not runs and len(run) < run_size:
+                yield from run
+                return
+            runs.append(spill(run))
+            del run
+        # Merging groups in input order keeps the result stable.
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                if len(group) == 1:
+                    merged.append(group[0])
+                    continue
+                merged.append(spill(merge(group)))
+                for fp in group:
+                    fp.close()
+            runs = merged
+        yield from merge(runs)
+    finally:
+        for fp in opened:
+            fp.close()
+
+
 class Sortable(BaseSortable, SortableMixin):
     """
     Final exposed ABC for sortable containers
     Inherits the minimal interface + Mixin, featuring both mandatory constraints and general-purpose methods
     """
 
-    @classmethod
-    def __subclasshook__(cls, C):
-        if cls is Sortable:
-            if any("__sort__" in B.__dict__ for B in C.__mro__):
-                return True
-        return NotImplemented
+    __subclasshook__ = structural_hook("__sort__")
 
 
 class BaseFilterable(metaclass=abc.ABCMeta):
@@ -91,8 +400,14 @@ class FilterableMixin:
 
     def reject(self, predicate):
         """Return a new container with elements *not* satisfying predicate."""
+        if isinstance(predicate, Predicate):
+            return self.__filter__(~predicate)  # type: ignore
         return self.__filter__(lambda x: not predicate(x))  # type: ignore
 
+    def lazy(self):
+        """Start a :class:`LazyPipeline` over this container."""
+        return LazyPipeline(self)
+
 
 class Filterable(BaseFilterable, FilterableMixin):
     """Final exposed ABC for filterable containers.
@@ -101,12 +416,7 @@ class Filterable(BaseFilterable, FilterableMixin):
     constraints and general-purpose helpers.
     """
 
-    @classmethod
-    def __subclasshook__(cls, C):
-        if cls is Filterable:
-            if any("__filter__" in B.__dict__ for B in C.__mro__):
-                return True
-        return NotImplemented
+    __subclasshook__ = structural_hook("__filter__")
 
 
 class BaseTransformable(metaclass=abc.ABCMeta):
@@ -121,6 +431,13 @@ class BaseTransformable(metaclass=abc.ABCMeta):
     def __transform__(self, func):
         """
         Return a new container with func applied to every element.
+
+        Call *func* exactly once per element, in the order in which
+        ``__iter__`` yields them, and build the result from its return
+        values.  ``map(executor=...)`` relies on this when the container
+        has no ``__collect__(results)``: the elements are mapped on the
+        pool first, and *func* then returns the next precomputed result
+        whatever it is passed.
         """
         raise NotImplementedError(
             f"{self.__class__.__name__} must implement __transform__()"
@@ -133,9 +450,31 @@ class TransformableMixin:
     Contains only general-purpose methods; no abstract methods of its own.
     """
 
-    def map(self, func):
-        """Return a new container with func applied to every element."""
-        return self.__transform__(func)  # type: ignore
+    def map(self, func, executor=None, chunksize=1024, ordered=True):
+        """
+        Return a new container with func applied to every element.
+
+        With an *executor* (a :mod:`concurrent.futures` thread or process
+        pool) the elements are read by iterating the container and mapped
+        in chunks by :func:`parallel_map`.  A container that defines
+        ``__collect__(results)`` builds the new container from the mapped
+        values; otherwise they are handed back through ``__transform__``,
+        which must then call its function once per element in iteration
+        order.  With ``ordered=False`` results arrive in completion order,
+        which suits containers that do not keep positions (e.g. ones that
+        sort what they hold).
+        """
+        if executor is None:
+            return self.__transform__(func)  # type: ignore
+        results = parallel_map(func, self, executor, chunksize, ordered)  # type: ignore
+        collect = getattr(type(self), "__collect__", None)
+        if collect is not None:
+            return collect(self, results)
+        return self.__transform__(_Replay(results))  # type: ignore
+
+    def lazy(self):
+        """Start a :class:`LazyPipeline` over this container."""
+        return LazyPipeline(self)
 
 
 class Transformable(BaseTransformable, TransformableMixin):
@@ -146,10 +485,565 @@ class Transformable(BaseTransformable, TransformableMixin):
     constraints and general-purpose helpers.
     """
 
-    @classmethod
-    def __subclasshook__(cls, C):
-        if cls is Transformable:
-            if any("__transform__" in B.__dict__ for B in C.__mro__):
+    __subclasshook__ = structural_hook("__transform__")
+
+
+_MISSING = object()
+
+
+class LazyPipeline:
+    """
+    A deferred chain of ``filter``/``reject``/``map`` steps over a container.
+
+    Nothing runs until the pipeline is iterated or a terminal method is
+    called.  Then all steps are fused into one pass of builtin
+    ``filter``/``filterfalse``/``map`` iterators over the source, so
+    ``c.lazy().filter(p).map(f).reject(q)`` builds no intermediate
+    containers, and :meth:`first`, :meth:`take` and :meth:`any` stop
+    reading the source as soon as they have their answer.
+
+    Pipelines are immutable: every step returns a new pipeline, so a
+    partial chain can be reused.
+    """
+
+    __slots__ = ("_source", "_steps")
+
+    def __init__(self, source, steps=()):
+        self._source = source
+        self._steps = tuple(steps)
+
+    def __repr__(self):
+        steps = "".join(f".{kind}({func!r})" for kind, func in self._steps)
+        return f"{self.__class__.__name__}({self._source!r}){steps}"
+
+    def _then(self, kind, func):
+        return self.__class__(self._source, self._steps + ((kind, func),))
+
+    def filter(self, predicate):
+        """Keep elements for which predicate(elem) is true."""
+        return self._then("filter", predicate)
+
+    def reject(self, predicate):
+        """Drop elements for which predicate(elem) is true."""
+        return self._then("reject", predicate)
+
+    def map(self, func):
+        """Apply func to every element."""
+        return self._then("map", func)
+
+    def __iter__(self):
+        it = iter(self._source)
+        for kind, func in self._steps:
+            if kind == "filter":
+                it = filter(func, it)
+            elif kind == "reject":
+                it = filterfalse(func, it)
+            else:
+                it = map(func, it)
+        return it
+
+    def collect(self, factory=None):
+        """
+        Run the pipeline and return the result.
+
+        With *factory*, return ``factory(iterator)``.  Otherwise the result
+        has the source's own type where the source allows it:
+
+        * a chain of only ``filter``/``reject`` steps runs eagerly through
+          the source's own ``filter``/``reject``, so containers that
+          vectorize or index them keep doing so; declarative
+          :data:`F` predicates are combined into one ``__filter__`` call;
+        * a chain of only ``map`` steps is one ``__transform__`` call;
+        * a mixed chain is handed to the source's ``__collect__(items)``.
+
+        Sources without the matching hook give a list.
+        """
+        if factory is not None:
+            return factory(iter(self))
+        source, steps = self._source, self._steps
+        kinds = {kind for kind, _ in steps}
+        if steps and kinds <= {"filter", "reject"} and hasattr(source, "__filter__"):
+            if all(isinstance(func, Predicate) for _, func in steps):
+                return source.__filter__(
+                    _AllOf(*(func if kind == "filter" else ~func for kind, func in steps)))
+            for kind, func in steps:
+                source = _filter_step(source, kind, func)
+            return source
+        if kinds == {"map"} and hasattr(source, "__transform__"):
+            return source.__transform__(_compose([func for _, func in steps]))
+        collect = getattr(type(source), "__collect__", None)
+        if steps and collect is not None:
+            return collect(source, iter(self))
+        return list(iter(self))
+
+    def first(self, default=_MISSING):
+        """Return the first result; *default* (or ValueError) if there is none."""
+        for item in iter(self):
+            return item
+        if default is _MISSING:
+            raise ValueError("LazyPipeline.first() on an empty result")
+        return default
+
+    def take(self, n):
+        """Return a list of at most the first *n* results."""
+        return list(islice(iter(self), n))
+
+    def any(self, predicate=None):
+        """Return True if any result (or predicate(result)) is true."""
+        it = iter(self)
+        return any(it if predicate is None else map(predicate, it))
+
+
+def _filter_step(source, kind, predicate):
+    method = getattr(source, kind, None)
+    if method is not None:
+        return method(predicate)
+    if kind == "reject":
+        if isinstance(predicate, Predicate):
+            return source.__filter__(~predicate)
+        return source.__filter__(lambda x: not predicate(x))
+    return source.__filter__(predicate)
+
+
+def _compose(funcs):
+    if len(funcs) == 1:
+        return funcs[0]
+    if len(funcs) == 2:
+        first, second = funcs
+        return lambda item: second(first(item))
+
+    def composed(item):
+        for func in funcs:
+            item = func(item)
+        return item
+
+    return composed
+
+
+class Predicate:
+    """
+    Base of the declarative predicates built with :data:`F`.
+
+    A predicate is an ordinary callable, so any `Filterable` can use it to
+    scan, but it also exposes its structure: containers such as
+    `IndexedFilterable` inspect it and answer from an index instead.
+    Combine predicates with ``&``, ``|`` and ``~``.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, item):
+        raise NotImplementedError
+
+    def __and__(self, other):
+        return _AllOf(self, other)
+
+    def __or__(self, other):
+        return _AnyOf(self, other)
+
+    def __invert__(self):
+        return _Not(self)
+
+
+_COMPARISONS = {"==": operator.eq, "!=": operator.ne,
+                "<": operator.lt, "<=": operator.le,
+                ">": operator.gt, ">=": operator.ge}
+
+
+class _Compare(Predicate):
+    __slots__ = ("field", "op", "value", "_test")
+
+    def __init__(self, field, op, value):
+        self.field = field
+        self.op = op
+        self.value = value
+        self._test = _COMPARISONS[op]
+
+    def __call__(self, item):
+        return self._test(self.field.get(item), self.value)
+
+    def __repr__(self):
+        return f"({self.field!r} {self.op} {self.value!r})"
+
+
+class _Between(Predicate):
+    __slots__ = ("field", "low", "high")
+
+    def __init__(self, field, low, high):
+        self.field = field
+        self.low = low
+        self.high = high
+
+    def __call__(self, item):
+        return self.low <= self.field.get(item) <= self.high
+
+    def __repr__(self):
+        return f"{self.field!r}.between({self.low!r}, {self.high!r})"
+
+
+class _IsIn(Predicate):
+    __slots__ = ("field", "values", "_lookup")
+
+    def __init__(self, field, values):
+        self.field = field
+        self.values = tuple(values)
+        try:
+            self._lookup = frozenset(self.values)
+        except TypeError:
+            self._lookup = self.values
+
+    def __call__(self, item):
+        return self.field.get(item) in self._lookup
+
+    def __repr__(self):
+        return f"{self.field!r}.isin({list(self.values)!r})"
+
+
+class _AllOf(Predicate):
+    __slots__ = ("preds",)
+
+    def __init__(self, *preds):
+        self.preds = tuple(q for p in preds
+                           for q in (p.preds if isinstance(p, _AllOf) else (p,)))
+
+    def __call__(self, item):
+        for pred in self.preds:
+            if not pred(item):
+                return False
+        return True
+
+    def __repr__(self):
+        return "(" + " & ".join(map(repr, self.preds)) + ")"
+
+
+class _AnyOf(Predicate):
+    __slots__ = ("preds",)
+
+    def __init__(self, *preds):
+        self.preds = tuple(q for p in preds
+                           for q in (p.preds if isinstance(p, _AnyOf) else (p,)))
+
+    def __call__(self, item):
+        for pred in self.preds:
+            if pred(item):
                 return True
-        return NotImplemented
+        return False
+
+    def __repr__(self):
+        return "(" + " | ".join(map(repr, self.preds)) + ")"
+
+
+class _Not(Predicate):
+    __slots__ = ("pred",)
+
+    def __init__(self, pred):
+        self.pred = pred
+
+    def __call__(self, item):
+        return not self.pred(item)
+
+    def __invert__(self):
+        return self.pred
+
+    def __repr__(self):
+        return f"~{self.pred!r}"
+
+
+class Field:
+    """
+    A record field named in a predicate; obtained from :data:`F`.
+
+    Comparison operators, :meth:`between` and :meth:`isin` return
+    :class:`Predicate` objects instead of booleans.  ``key`` identifies the
+    field (``("attr", name)`` or ``("item", key)``) for index lookups.
+    """
+
+    __slots__ = ("key", "get")
+
+    def __init__(self, name, item=False):
+        self.key = ("item" if item else "attr", name)
+        self.get = operator.itemgetter(name) if item else operator.attrgetter(name)
+
+    def __repr__(self):
+        kind, name = self.key
+        return f"F[{name!r}]" if kind == "item" else f"F.{name}"
+
+    def __eq__(self, value):
+        return _Compare(self, "==", value)
+
+    def __ne__(self, value):
+        return _Compare(self, "!=", value)
+
+    def __lt__(self, value):
+        return _Compare(self, "<", value)
+
+    def __le__(self, value):
+        return _Compare(self, "<=", value)
+
+    def __gt__(self, value):
+        return _Compare(self, ">", value)
+
+    def __ge__(self, value):
+        return _Compare(self, ">=", value)
+
+    __hash__ = None
+
+    def between(self, low, high):
+        """Predicate ``low <= field <= high``."""
+        return _Between(self, low, high)
+
+    def isin(self, values):
+        """Predicate ``field in values``."""
+        return _IsIn(self, values)
+
+
+class _FieldFactory:
+    """``F.name`` is the attribute *name*, ``F["key"]`` the item *key*."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Field(name)
+
+    def __getitem__(self, key):
+        return Field(key, item=True)
+
+    def __repr__(self):
+        return "F"
+
+
+F = _FieldFactory()
+
+
+def _map_chunk(func, chunk):
+    return list(map(func, chunk))
+
+
+class _Replay:
+    """
+    A function that ignores its argument and returns the next result.
+
+    ``map(executor=...)`` hands one to the ``__transform__`` of containers
+    that do not define ``__collect__``; it must be called once per element,
+    in iteration order.
+    """
+
+    __slots__ = ("_next",)
+
+    def __init__(self, results):
+        self._next = iter(results).__next__
+
+    def __call__(self, _item):
+        return self._next()
+
+
+def parallel_map(func, iterable, executor=None, chunksize=1024, ordered=True):
+    """
+    Lazily yield ``func(item)`` for every item, computed on *executor*.
+
+    Items are sent to the pool in chunks of *chunksize* so that process
+    pools pay for pickling once per chunk rather than per item; *func* must
+    then be picklable (a module-level function).  At most two chunks per
+    CPU are in flight, so memory stays bounded for long inputs.  With
+    ``ordered=False`` chunks are yielded as they complete.  Without an
+    executor this is the builtin :func:`map`.
+    """
+    if executor is None:
+        return map(func, iterable)
+    return _parallel_map(partial(_map_chunk, func), _chunked(iterable, chunksize),
+                         executor, ordered)
+
+
+def _parallel_map(work, chunks, executor, ordered):
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    window = 2 * (os.cpu_count() or 1)
+    pending = deque(executor.submit(work, chunk) for chunk in islice(chunks, window))
+    try:
+        while pending:
+            if ordered:
+                done = (pending.popleft(),)
+            else:
+                done, rest = wait(pending, return_when=FIRST_COMPLETED)
+                pending = deque(rest)
+            for future in done:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.append(executor.submit(work, chunk))
+                yield from future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+class BaseAsyncFilterable(metaclass=abc.ABCMeta):
+    """
+    Minimal interface for async-iterable containers that support filtering.
+
+    Only defines the core abstract method with no concrete implementations.
+    """
+
+    @abc.abstractmethod
+    def __afilter__(self, predicate, concurrency=1):
+        """
+        Return a new async container keeping elements for which predicate(elem)
+        (awaited if it returns an awaitable) is true, evaluating at most
+        *concurrency* predicates at a time.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement __afilter__()"
+        )
+
+
+class AsyncFilterableMixin:
+    """Async filtering mixin with concrete helpers built on top of `__afilter__`."""
+
+    def afilter(self, predicate, concurrency=1):
+        """Return a new async container with elements satisfying predicate."""
+        return self.__afilter__(predicate, concurrency)  # type: ignore
+
+    def areject(self, predicate, concurrency=1):
+        """Return a new async container with elements *not* satisfying predicate."""
+        async def negated(item):
+            return not await _resolve(predicate(item))
+        return self.__afilter__(negated, concurrency)  # type: ignore
+
+
+class AsyncFilterable(BaseAsyncFilterable, AsyncFilterableMixin):
+    """Final exposed ABC for async filterable containers."""
+
+    __subclasshook__ = structural_hook("__afilter__")
+
+
+class BaseAsyncTransformable(metaclass=abc.ABCMeta):
+    """
+    Minimal interface for async-iterable containers that support element-wise
+    transformation.
+
+    Only defines the core abstract method with no concrete implementations.
+    """
+
+    @abc.abstractmethod
+    def __atransform__(self, func, concurrency=1):
+        """
+        Return a new async container with func applied to every element
+        (awaited if it returns an awaitable), running at most *concurrency*
+        calls at a time.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement __atransform__()"
+        )
+
+
+class AsyncTransformableMixin:
+    """Async transformation mixin with concrete helpers built on top of `__atransform__`."""
+
+    def amap(self, func, concurrency=1):
+        """Return a new async container with func applied to every element."""
+        return self.__atransform__(func, concurrency)  # type: ignore
+
+
+class AsyncTransformable(BaseAsyncTransformable, AsyncTransformableMixin):
+    """Final exposed ABC for async transformable containers."""
+
+    __subclasshook__ = structural_hook("__atransform__")
+
+
+async def _resolve(value):
+    if hasattr(value, "__await__"):
+        return await value
+    return value
+
+
+class _Failure:
+    __slots__ = ("exc",)
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+_DONE = object()
+
+
+async def async_map(func, aiterable, concurrency=1):
+    """
+    Yield ``func(item)`` (awaited if it is awaitable) for every item of the
+    async iterable *aiterable*, in input order.
+
+    With *concurrency* > 1, a feeder task reads the source and starts up to
+    *concurrency* calls, handing them to the consumer through a bounded
+    :class:`asyncio.Queue`; when the consumer falls behind, the feeder
+    blocks, so the source is never read more than *concurrency* items
+    ahead and memory stays constant however long the stream is.  When the
+    consumer stops early (``aclose()``, ``break`` or an error), the calls
+    still in flight are cancelled and awaited before it returns.
+    """
+    if concurrency <= 1:
+        async for item in aiterable:
+            yield await _resolve(func(item))
+        return
+
+    import asyncio
+
+    queue = asyncio.Queue(concurrency)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def call(item):
+        return await _resolve(func(item))
+
+    async def feed():
+        try:
+            async for item in aiterable:
+                await slots.acquire()
+                task = asyncio.ensure_future(call(item))
+                try:
+                    await queue.put(task)
+                except BaseException:
+                    task.cancel()
+                    raise
+        except Exception as exc:
+            await queue.put(_Failure(exc))
+        else:
+            await queue.put(_DONE)
+
+    feeder = asyncio.ensure_future(feed())
+    try:
+        while True:
+            task = await queue.get()
+            if task is _DONE:
+                break
+            if isinstance(task, _Failure):
+                raise task.exc
+            try:
+                result = await task
+            finally:
+                slots.release()
+            yield result
+    finally:
+        # Wait for the cancellations, so that no call is still running once
+        # the consumer stops (e.g. after ``aclose()`` or an error).
+        pending = [feeder]
+        while not queue.empty():
+            task = queue.get_nowait()
+            if isinstance(task, asyncio.Future):
+                pending.append(task)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def async_filter(predicate, aiterable, concurrency=1):
+    """
+    Yield the items of *aiterable* for which ``predicate(item)`` (awaited if
+    it is awaitable) is true, in input order, with the same bounded
+    concurrency as :func:`async_map`.
+    """
+    async def check(item):
+        return item, await _resolve(predicate(item))
+
+    async for item, keep in async_map(check, aiterable, concurrency):
+        if keep:
+            yield item
 
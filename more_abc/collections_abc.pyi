@@ -3,15 +3,42 @@
 # The original docstring got overwritten by this thing.
 
 from abc import ABCMeta
-from typing import Any, Callable, TypeVar
+from concurrent.futures import Executor
+from typing import (IO, Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator,
+                    Optional, Protocol, TypeVar, Union)
 
 __all__ = [
     "BaseSortable", "SortableMixin", "Sortable",
     "BaseFilterable", "FilterableMixin", "Filterable",
     "BaseTransformable", "TransformableMixin", "Transformable",
+    "structural_hook",
+    "external_sort", "PickleCodec",
+    "LazyPipeline",
+    "F", "Field", "Predicate",
+    "parallel_map",
+    "BaseAsyncFilterable", "AsyncFilterableMixin", "AsyncFilterable",
+    "BaseAsyncTransformable", "AsyncTransformableMixin", "AsyncTransformable",
+    "async_filter", "async_map",
 ]
 
 _T = TypeVar("_T")
+_U = TypeVar("_U")
+
+
+class structural_hook:
+    # """Build a ``__subclasshook__`` that recognises classes by the methods they define."""
+    required: tuple[str, ...]
+    owner: Optional[type]
+    def __init__(self, *required: str) -> None: ...
+    def __set_name__(self, owner: type, name: str) -> None: ...
+    def __get__(self, instance: Any, owner: Optional[type] = ...) -> "_BoundStructuralHook": ...
+    def invalidate(self) -> None: ...
+    def __call__(self, cls: type, C: type) -> bool: ...
+
+
+class _BoundStructuralHook(Protocol):
+    def __call__(self, C: type) -> bool: ...
+    def invalidate(self) -> None: ...
 
 
 class BaseSortable(metaclass=ABCMeta):
@@ -23,13 +50,47 @@ class SortableMixin:
     # """Concrete sort()/sorted() helpers built on __sort__."""
     def sort(self, reverse: bool = ...) -> None: ...
     def sorted(self, reverse: bool = ...) -> "SortableMixin": ...
+    def nsmallest(self, k: int, key: Optional[Callable[[Any], Any]] = ...) -> list[Any]: ...
+    def nlargest(self, k: int, key: Optional[Callable[[Any], Any]] = ...) -> list[Any]: ...
+    def partition(self, k: int, key: Optional[Callable[[Any], Any]] = ...) -> list[Any]: ...
+    def iter_sorted(
+        self,
+        key: Optional[Callable[[Any], Any]] = ...,
+        reverse: bool = ...,
+        external: bool = ...,
+        **options: Any,
+    ) -> Iterator[Any]: ...
     def __copy__(self) -> "SortableMixin": ...
 
 
+class _RunCodec(Protocol):
+    def dump(self, items: Iterable[Any], fp: IO[bytes]) -> None: ...
+    def load(self, fp: IO[bytes]) -> Iterator[Any]: ...
+
+
+class PickleCodec:
+    # """Codec used by external_sort to write runs to disk and read them back."""
+    protocol: int
+    batch_size: int
+    def __init__(self, protocol: Optional[int] = ..., batch_size: int = ...) -> None: ...
+    def dump(self, items: Iterable[Any], fp: IO[bytes]) -> None: ...
+    def load(self, fp: IO[bytes]) -> Iterator[Any]: ...
+
+
+def external_sort(
+    iterable: Iterable[_T],
+    key: Optional[Callable[[_T], Any]] = ...,
+    reverse: bool = ...,
+    run_size: int = ...,
+    codec: Optional[_RunCodec] = ...,
+    tmpdir: Optional[str] = ...,
+    fan_in: int = ...,
+) -> Iterator[_T]: ...
+
+
 class Sortable(BaseSortable, SortableMixin):
     # """Final ABC for sortable containers."""
-    @classmethod
-    def __subclasshook__(cls, C: type) -> bool: ...
+    __subclasshook__: structural_hook
 
 
 class BaseFilterable(metaclass=ABCMeta):
@@ -41,12 +102,12 @@ class FilterableMixin:
     # """Concrete filter()/reject() helpers built on __filter__."""
     def filter(self, predicate: Callable[[Any], bool]) -> "FilterableMixin": ...
     def reject(self, predicate: Callable[[Any], bool]) -> "FilterableMixin": ...
+    def lazy(self) -> "LazyPipeline": ...
 
 
 class Filterable(BaseFilterable, FilterableMixin):
     # """Final ABC for filterable containers."""
-    @classmethod
-    def __subclasshook__(cls, C: type) -> bool: ...
+    __subclasshook__: structural_hook
 
 
 class BaseTransformable(metaclass=ABCMeta):
@@ -56,10 +117,123 @@ class BaseTransformable(metaclass=ABCMeta):
 
 class TransformableMixin:
     # """Concrete map() helper built on __transform__."""
-    def map(self, func: Callable[[Any], Any]) -> "TransformableMixin": ...
+    def map(
+        self,
+        func: Callable[[Any], Any],
+        executor: Optional[Executor] = ...,
+        chunksize: int = ...,
+        ordered: bool = ...,
+    ) -> "TransformableMixin": ...
+    def lazy(self) -> "LazyPipeline": ...
 
 
 class Transformable(BaseTransformable, TransformableMixin):
     # """Final ABC for transformable containers."""
-    @classmethod
-    def __subclasshook__(cls, C: type) -> bool: ...
\ No newline at end of file
+    __subclasshook__: structural_hook
+
+
+class LazyPipeline:
+    # """A deferred chain of filter/reject/map steps over a container."""
+    def __init__(self, source: Iterable[Any], steps: Iterable[tuple[str, Callable[[Any], Any]]] = ...) -> None: ...
+    def filter(self, predicate: Callable[[Any], Any]) -> "LazyPipeline": ...
+    def reject(self, predicate: Callable[[Any], Any]) -> "LazyPipeline": ...
+    def map(self, func: Callable[[Any], Any]) -> "LazyPipeline": ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def collect(self, factory: Optional[Callable[[Iterator[Any]], _T]] = ...) -> Any: ...
+    def first(self, default: Any = ...) -> Any: ...
+    def take(self, n: int) -> list[Any]: ...
+    def any(self, predicate: Optional[Callable[[Any], Any]] = ...) -> bool: ...
+
+
+class Predicate:
+    # """Base of the declarative predicates built with F."""
+    def __call__(self, item: Any) -> bool: ...
+    def __and__(self, other: "Predicate") -> "Predicate": ...
+    def __or__(self, other: "Predicate") -> "Predicate": ...
+    def __invert__(self) -> "Predicate": ...
+
+
+class Field:
+    # """A record field named in a predicate; obtained from F."""
+    key: tuple[str, Any]
+    get: Callable[[Any], Any]
+    def __init__(self, name: Any, item: bool = ...) -> None: ...
+    def __eq__(self, value: object) -> Predicate: ...  # type: ignore[override]
+    def __ne__(self, value: object) -> Predicate: ...  # type: ignore[override]
+    def __lt__(self, value: Any) -> Predicate: ...
+    def __le__(self, value: Any) -> Predicate: ...
+    def __gt__(self, value: Any) -> Predicate: ...
+    def __ge__(self, value: Any) -> Predicate: ...
+    def between(self, low: Any, high: Any) -> Predicate: ...
+    def isin(self, values: Iterable[Any]) -> Predicate: ...
+
+
+class _FieldFactory:
+    def __getattr__(self, name: str) -> Field: ...
+    def __getitem__(self, key: Any) -> Field: ...
+
+
+F: _FieldFactory
+
+
+def parallel_map(
+    func: Callable[[_T], _U],
+    iterable: Iterable[_T],
+    executor: Optional[Executor] = ...,
+    chunksize: int = ...,
+    ordered: bool = ...,
+) -> Iterator[_U]: ...
+
+
+class BaseAsyncFilterable(metaclass=ABCMeta):
+    # """Minimal abstract interface for async filterable containers."""
+    def __afilter__(
+        self, predicate: Callable[[Any], Union[Any, Awaitable[Any]]], concurrency: int = ...
+    ) -> "BaseAsyncFilterable": ...
+
+
+class AsyncFilterableMixin:
+    # """Concrete afilter()/areject() helpers built on __afilter__."""
+    def afilter(
+        self, predicate: Callable[[Any], Union[Any, Awaitable[Any]]], concurrency: int = ...
+    ) -> "AsyncFilterableMixin": ...
+    def areject(
+        self, predicate: Callable[[Any], Union[Any, Awaitable[Any]]], concurrency: int = ...
+    ) -> "AsyncFilterableMixin": ...
+
+
+class AsyncFilterable(BaseAsyncFilterable, AsyncFilterableMixin):
+    # """Final ABC for async filterable containers."""
+    __subclasshook__: structural_hook
+
+
+class BaseAsyncTransformable(metaclass=ABCMeta):
+    # """Minimal abstract interface for async transformable containers."""
+    def __atransform__(
+        self, func: Callable[[Any], Union[Any, Awaitable[Any]]], concurrency: int = ...
+    ) -> "BaseAsyncTransformable": ...
+
+
+class AsyncTransformableMixin:
+    # """Concrete amap() helper built on __atransform__."""
+    def amap(
+        self, func: Callable[[Any], Union[Any, Awaitable[Any]]], concurrency: int = ...
+    ) -> "AsyncTransformableMixin": ...
+
+
+class AsyncTransformable(BaseAsyncTransformable, AsyncTransformableMixin):
+    # """Final ABC for async transformable containers."""
+    __subclasshook__: structural_hook
+
+
+def async_map(
+    func: Callable[[_T], Union[_U, Awaitable[_U]]],
+    aiterable: AsyncIterable[_T],
+    concurrency: int = ...,
+) -> AsyncIterator[_U]: ...
+def async_filter(
+    predicate: Callable[[_T], Union[Any, Awaitable[Any]]],
+    aiterable: AsyncIterable[_T],
+    concurrency: int = ...,
+) -> AsyncIterator[_T]: ...
+
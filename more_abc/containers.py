@@ -0,0 +1,1129 @@
+"""Concrete containers built on the ABCs of `more_abc.collections_abc`."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain, compress, islice
+from operator import ge, is_, le
+
+from .abc_dataclasses import _numpy
+from .collections_abc import (AsyncFilterable, AsyncTransformable, F, Field, Filterable,
+                              Predicate, Sortable, Transformable, async_filter, async_map,
+                              _AllOf, _AnyOf, _Between, _Compare, _IsIn, _Not)
+
+__all__ = ["SortedList", "IndexedFilterable", "ArrayContainer", "AsyncStream",
+           "PersistentVector"]
+
+
+class SortedList(Sortable, Filterable, Transformable):
+    """
+    A list that keeps its elements ordered as they are added.
+
+    Elements live in sublists of roughly ``2 * _load`` items, located with
+    :mod:`bisect`, so :meth:`add`, :meth:`remove`, :meth:`index` and
+    positional access run in O(log n) (plus a ``memmove`` of one short
+    sublist).  A Fenwick tree over the sublist lengths maps positions to
+    sublists and is rebuilt lazily after sublists are split or merged.
+
+    With *key*, each element's key is computed once when it is added and
+    stored next to it.
+
+    :meth:`sort` never reorders anything: the list is always sorted, so
+    ``sort(reverse=True)`` only flips the direction in which it is indexed
+    and iterated, and :meth:`sorted` costs one shallow copy.  :meth:`nsmallest`,
+    :meth:`nlargest`, :meth:`partition` and :meth:`iter_sorted` read the
+    stored order directly when called with the list's own key.  :meth:`filter`
+    keeps the existing order instead of re-sorting; :meth:`map` sorts the
+    mapped values.  :meth:`bisect_left` and :meth:`bisect_right` always
+    answer in ascending order.
+    """
+
+    _load = 1000
+
+    def __init__(self, iterable=(), key=None):
+        self._key = key
+        self._reverse = False
+        self._reset([], [])
+        self.update(iterable)
+
+    @property
+    def key(self):
+        """The key function, or ``None`` for natural ordering."""
+        return self._key
+
+    # -- internal layout ------------------------------------------------------
+
+    def _reset(self, values, keys):
+        """Replace the contents with *values* (and their *keys*), already sorted."""
+        load = self._load
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+        if self._key is None:
+            self._keys = self._lists
+        else:
+            self._keys = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self._maxes = [chunk[-1] for chunk in self._keys]
+        self._len = len(values)
+        self._index = None
+
+    def _build_index(self):
+        tree = [0]
+        tree.extend(map(len, self._lists))
+        size = len(tree)
+        for i in range(1, size):
+            j = i + (i & -i)
+            if j < size:
+                tree[j] += tree[i]
+        self._index = tree
+        return tree
+
+    def _index_add(self, pos, delta):
+        tree = self._index
+        if tree is None:
+            return
+        i = pos + 1
+        size = len(tree)
+        while i < size:
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, pos):
+        """Number of elements stored before sublist *pos*."""
+        tree = self._index or self._build_index()
+        total = 0
+        while pos:
+            total += tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def _locate(self, index):
+        """Map a storage (ascending) index to ``(sublist, offset)``."""
+        tree = self._index or self._build_index()
+        pos = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] <= index:
+                pos = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return pos, index
+
+    def _storage_index(self, index):
+        size = self._len
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("SortedList index out of range")
+        return size - 1 - index if self._reverse else index
+
+    def _insert(self, pos, idx, value, key):
+        self._lists[pos].insert(idx, value)
+        if self._key is not None:
+            self._keys[pos].insert(idx, key)
+        self._len += 1
+        chunk = self._keys[pos]
+        if idx == len(chunk) - 1:
+            self._maxes[pos] = key
+        if len(chunk) > 2 * self._load:
+            self._split(pos)
+        else:
+            self._index_add(pos, 1)
+
+    def _split(self, pos):
+        load = self._load
+        for sublists in ((self._lists, self._keys) if self._key is not None else (self._lists,)):
+            chunk = sublists[pos]
+            sublists[pos:pos + 1] = [chunk[:load], chunk[load:]]
+        self._maxes[pos:pos + 1] = [self._keys[pos][-1], self._keys[pos + 1][-1]]
+        self._index = None
+
+    def _delete(self, pos, idx):
+        del self._lists[pos][idx]
+        if self._key is not None:
+            del self._keys[pos][idx]
+        self._len -= 1
+        chunk = self._keys[pos]
+        if not chunk:
+            del self._lists[pos]
+            if self._key is not None:
+                del self._keys[pos]
+            del self._maxes[pos]
+            self._index = None
+            return
+        self._maxes[pos] = chunk[-1]
+        if len(chunk) < self._load // 2 and len(self._lists) > 1:
+            # Merge with a neighbour so that sublists stay reasonably full.
+            left = pos - 1 if pos else pos
+            for sublists in ((self._lists, self._keys) if self._key is not None else (self._lists,)):
+                sublists[left:left + 2] = [sublists[left] + sublists[left + 1]]
+            del self._maxes[left]
+            self._maxes[left] = self._keys[left][-1]
+            self._index = None
+            if len(self._keys[left]) > 2 * self._load:
+                self._split(left)
+        else:
+            self._index_add(pos, -1)
+
+    def _find(self, value):
+        """Return ``(sublist, offset)`` of an element equal to *value*, or ``None``."""
+        key = value if self._key is None else self._key(value)
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return None
+        idx = bisect_left(self._keys[pos], key)
+        # Several elements can share a key; scan them for an equal value.
+        while pos < len(self._lists):
+            keys, values = self._keys[pos], self._lists[pos]
+            while idx < len(keys):
+                if keys[idx] != key:
+                    return None
+                if values[idx] == value:
+                    return pos, idx
+                idx += 1
+            pos += 1
+            idx = 0
+        return None
+
+    # -- mutation ---------------------------------------------------------------
+
+    def add(self, value):
+        """Insert *value*, keeping the list sorted."""
+        key = value if self._key is None else self._key(value)
+        maxes = self._maxes
+        if not maxes:
+            self._reset([value], [key])
+            return
+        pos = bisect_right(maxes, key)
+        if pos == len(maxes):
+            pos -= 1
+            idx = len(self._keys[pos])
+        else:
+            idx = bisect_right(self._keys[pos], key)
+        self._insert(pos, idx, value, key)
+
+    def update(self, iterable):
+        """Insert every element of *iterable*."""
+        values = list(iterable)
+        if not values:
+            return
+        if len(values) * 4 < self._len:
+            for value in values:
+                self.add(value)
+            return
+        # Large batches: one sort over everything beats many insertions.
+        values = list(chain.from_iterable(self._lists)) + values
+        if self._key is None:
+            values.sort()
+            self._reset(values, values)
+        else:
+            keys = list(chain.from_iterable(self._keys))
+            keys.extend(map(self._key, values[len(keys):]))
+            order = sorted(range(len(values)), key=keys.__getitem__)
+            self._reset([values[i] for i in order], [keys[i] for i in order])
+
+    def discard(self, value):
+        """Remove one element equal to *value*, if present."""
+        found = self._find(value)
+        if found is not None:
+            self._delete(*found)
+
+    def remove(self, value):
+        """Remove one element equal to *value*; raise ValueError if absent."""
+        found = self._find(value)
+        if found is None:
+            raise ValueError(f"{value!r} not in SortedList")
+        self._delete(*found)
+
+    def pop(self, index=-1):
+        """Remove and return the element at *index* (the last one by default)."""
+        pos, idx = self._locate(self._storage_index(index))
+        value = self._lists[pos][idx]
+        self._delete(pos, idx)
+        return value
+
+    def clear(self):
+        """Remove every element."""
+        self._reset([], [])
+
+    # -- queries ----------------------------------------------------------------
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        if self._reverse:
+            return chain.from_iterable(map(reversed, reversed(self._lists)))
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        if self._reverse:
+            return chain.from_iterable(self._lists)
+        return chain.from_iterable(map(reversed, reversed(self._lists)))
+
+    def __contains__(self, value):
+        return self._find(value) is not None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1 and not self._reverse:
+                return self._slice(start, stop)
+            if step == -1 and self._reverse and start > stop:
+                # Reversed view read backwards is a forward storage slice.
+                size = self._len
+                return self._slice(size - 1 - start, size - 1 - stop)
+            return list(self)[index]
+        pos, idx = self._locate(self._storage_index(index))
+        return self._lists[pos][idx]
+
+    def _slice(self, start, stop):
+        if start >= stop:
+            return []
+        pos, idx = self._locate(start)
+        result = []
+        remaining = stop - start
+        lists = self._lists
+        while remaining > 0:
+            chunk = lists[pos][idx:idx + remaining]
+            result.extend(chunk)
+            remaining -= len(chunk)
+            pos += 1
+            idx = 0
+        return result
+
+    def index(self, value):
+        """Return the position of an element equal to *value*; raise ValueError if absent."""
+        found = self._find(value)
+        if found is None:
+            raise ValueError(f"{value!r} not in SortedList")
+        index = self._offset(found[0]) + found[1]
+        return self._len - 1 - index if self._reverse else index
+
+    def count(self, value):
+        """Return the number of elements equal to *value*."""
+        key = value if self._key is None else self._key(value)
+        lo, hi = self._bisect_key(key, bisect_left), self._bisect_key(key, bisect_right)
+        if self._key is None:
+            return hi - lo
+        return sum(1 for v in self._slice(lo, hi) if v == value)
+
+    def _bisect_key(self, key, bisect):
+        pos = bisect(self._maxes, key)
+        if pos == len(self._maxes):
+            return self._len
+        return self._offset(pos) + bisect(self._keys[pos], key)
+
+    def bisect_left(self, value):
+        """Ascending position at which *value* would be inserted before equal keys."""
+        return self._bisect_key(value if self._key is None else self._key(value), bisect_left)
+
+    def bisect_right(self, value):
+        """Ascending position at which *value* would be inserted after equal keys."""
+        return self._bisect_key(value if self._key is None else self._key(value), bisect_right)
+
+    def __repr__(self):
+        key = "" if self._key is None else f", key={self._key!r}"
+        return f"{self.__class__.__name__}({list(self)!r}{key})"
+
+    # -- Sortable / Filterable / Transformable ------------------------------------
+
+    def _empty(self):
+        new = object.__new__(self.__class__)
+        new._key = self._key
+        new._reverse = self._reverse
+        return new
+
+    def __copy__(self):
+        new = self._empty()
+        new._lists = [chunk[:] for chunk in self._lists]
+        new._keys = new._lists if self._key is None else [chunk[:] for chunk in self._keys]
+        new._maxes = self._maxes[:]
+        new._len = self._len
+        new._index = None
+        return new
+
+    def __sort__(self, reverse=False):
+        self._reverse = reverse
+
+    # The elements are already ordered by ``self.key``; other keys fall back
+    # to the generic heap and selection algorithms of SortableMixin.
+
+    def nsmallest(self, k, key=None):
+        if key is not self._key:
+            return super().nsmallest(k, key)
+        return self._slice(0, min(max(k, 0), self._len))
+
+    def nlargest(self, k, key=None):
+        if key is not self._key:
+            return super().nlargest(k, key)
+        return self._slice(self._len - min(max(k, 0), self._len), self._len)[::-1]
+
+    def partition(self, k, key=None):
+        if key is not self._key:
+            return super().partition(k, key)
+        if not -self._len <= k < self._len:
+            raise IndexError("partition index out of range")
+        return list(chain.from_iterable(self._lists))
+
+    def iter_sorted(self, key=None, reverse=False, external=False, **options):
+        if key is not self._key:
+            return super().iter_sorted(key, reverse, external, **options)
+        if reverse:
+            return chain.from_iterable(map(reversed, reversed(self._lists)))
+        return chain.from_iterable(self._lists)
+
+    def __filter__(self, predicate):
+        new = self._empty()
+        values = list(chain.from_iterable(self._lists))
+        mask = list(map(predicate, values))
+        keys = values if self._key is None else list(compress(chain.from_iterable(self._keys), mask))
+        new._reset(list(compress(values, mask)), keys)
+        return new
+
+    def __transform__(self, func):
+        return self.__collect__(map(func, chain.from_iterable(self._lists)))
+
+    def __collect__(self, items):
+        """A new SortedList of *items*, with this list's key and direction."""
+        new = self.__class__(items, key=self._key)
+        new._reverse = self._reverse
+        return new
+
+
+_AFTER = float("inf")  # sorts after every record id in ``(value, rid)`` pairs
+
+
+def _as_field(spec):
+    return spec if isinstance(spec, Field) else getattr(F, spec)
+
+
+class IndexedFilterable(Filterable):
+    """
+    A Filterable collection of records with secondary indexes.
+
+    *hash_index* and *sorted_index* name the fields to index: attribute
+    names, or :data:`F` fields such as ``F["key"]`` for mappings.  Hash
+    indexes answer ``==``, ``!=`` and ``isin``; sorted indexes (kept in
+    `SortedList`) also answer ``<``, ``<=``, ``>``, ``>=`` and ``between``,
+    and need mutually comparable values.  Indexes are updated by
+    :meth:`add`, :meth:`remove` and :meth:`discard`; after changing an
+    indexed field of a stored record in place, call :meth:`refresh`.
+
+    :meth:`filter` with a :class:`Predicate` built from ``F`` is answered
+    from the indexes without a scan, including ``&``, ``|`` and ``~``
+    combinations; parts of an ``&`` that no index covers are checked only
+    against the candidates.  Any other predicate falls back to a scan.
+    Results keep insertion order and carry the same indexes.
+    """
+
+    def __init__(self, items=(), hash_index=(), sorted_index=()):
+        self._hash_fields = tuple(map(_as_field, hash_index))
+        self._sorted_fields = tuple(map(_as_field, sorted_index))
+        fields = {}
+        for field in self._hash_fields + self._sorted_fields:
+            fields.setdefault(field.key, field)
+        self._fields = tuple(fields.values())
+        self._hash = {field.key: {} for field in self._hash_fields}
+        self._sorted = {field.key: SortedList() for field in self._sorted_fields}
+        self._items = {}    # record id -> item, in insertion order
+        self._values = {}   # record id -> values of the indexed fields
+        self._rids = {}     # id(item) -> record ids under which it is stored
+        self._next_rid = 0
+        self.extend(items)
+
+    # -- maintenance ------------------------------------------------------------
+
+    def _index(self, rid, item):
+        self._index_values(rid, tuple(field.get(item) for field in self._fields))
+
+    def _index_values(self, rid, values):
+        # Sorted indexes can reject a value (TypeError on comparison), so
+        # they go first and are rolled back; hash indexes cannot fail after
+        # the hash() check.
+        added = []
+        try:
+            for field, value in zip(self._fields, values):
+                if field.key in self._hash:
+                    hash(value)
+                order = self._sorted.get(field.key)
+                if order is not None:
+                    order.add((value, rid))
+                    added.append((order, (value, rid)))
+        except BaseException:
+            for order, entry in added:
+                order.remove(entry)
+            raise
+        for field, value in zip(self._fields, values):
+            bucket = self._hash.get(field.key)
+            if bucket is not None:
+                bucket.setdefault(value, set()).add(rid)
+        self._values[rid] = values
+
+    def _unindex(self, rid):
+        for field, value in zip(self._fields, self._values.pop(rid)):
+            bucket = self._hash.get(field.key)
+            if bucket is not None:
+                rids = bucket[value]
+                rids.discard(rid)
+                if not rids:
+                    del bucket[value]
+            order = self._sorted.get(field.key)
+            if order is not None:
+                order.remove((value, rid))
+
+    def add(self, item):
+        """Store *item* and index it."""
+        rid = self._next_rid
+        self._index(rid, item)
+        self._next_rid += 1
+        self._items[rid] = item
+        self._rids.setdefault(id(item), []).append(rid)
+
+    def extend(self, items):
+        """Store and index every item of *items*."""
+        items = list(items)
+        if len(items) * 4 < len(self._items):
+            for item in items:
+                self.add(item)
+            return
+        # Large batches: one sort per sorted index instead of an insertion
+        # per record.  New indexes are built aside and swapped in only once
+        # every value has been accepted, so a failure changes nothing.
+        fields = self._fields
+        rows = [tuple(field.get(item) for field in fields) for item in items]
+        rids = range(self._next_rid, self._next_rid + len(items))
+        orders = {}
+        for pos, field in enumerate(fields):
+            column = [row[pos] for row in rows]
+            if field.key in self._hash:
+                for value in column:
+                    hash(value)
+            order = self._sorted.get(field.key)
+            if order is not None:
+                order = order.__copy__()
+                order.update(zip(column, rids))
+                orders[field.key] = order
+        self._sorted.update(orders)
+        for pos, field in enumerate(fields):
+            bucket = self._hash.get(field.key)
+            if bucket is not None:
+                for row, rid in zip(rows, rids):
+                    bucket.setdefault(row[pos], set()).add(rid)
+        self._next_rid += len(items)
+        for rid, item, row in zip(rids, items, rows):
+            self._items[rid] = item
+            self._values[rid] = row
+            self._rids.setdefault(id(item), []).append(rid)
+
+    def _rid_of(self, item):
+        rids = self._rids.get(id(item))
+        if rids:
+            return rids[0]
+        for rid, stored in self._items.items():
+            if stored == item:
+                return rid
+        return None
+
+    def discard(self, item):
+        """Remove *item* (or an equal record), if present."""
+        rid = self._rid_of(item)
+        if rid is None:
+            return
+        self._unindex(rid)
+        stored = self._items.pop(rid)
+        rids = self._rids[id(stored)]
+        rids.remove(rid)
+        if not rids:
+            del self._rids[id(stored)]
+
+    def remove(self, item):
+        """Remove *item* (or an equal record); raise ValueError if absent."""
+        if self._rid_of(item) is None:
+            raise ValueError(f"{item!r} not in {self.__class__.__name__}")
+        self.discard(item)
+
+    def refresh(self, item):
+        """Re-index *item* after its indexed fields were changed in place.
+
+        If a new value is rejected, *item* stays indexed under its old values.
+        """
+        rids = self._rids.get(id(item), ())
+        if not rids:
+            return
+        values = tuple(field.get(item) for field in self._fields)
+        done = []
+        try:
+            for rid in rids:
+                old = self._values[rid]
+                self._unindex(rid)
+                done.append((rid, old))
+                self._index_values(rid, values)
+        except BaseException:
+            for rid, old in reversed(done):
+                if rid in self._values:
+                    self._unindex(rid)
+                self._index_values(rid, old)
+            raise
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self._items.values())!r})"
+
+    # -- querying ---------------------------------------------------------------
+
+    def _range(self, key, low, low_inclusive, high, high_inclusive):
+        order = self._sorted.get(key)
+        if order is None:
+            return None
+        try:
+            start = 0 if low is None else order.bisect_left((low,) if low_inclusive else (low, _AFTER))
+            stop = len(order) if high is None else order.bisect_right((high, _AFTER) if high_inclusive else (high,))
+        except TypeError:
+            return None
+        return {rid for _, rid in order[start:stop]}
+
+    def _equal(self, key, value):
+        bucket = self._hash.get(key)
+        if bucket is not None:
+            try:
+                return set(bucket.get(value, ()))
+            except TypeError:
+                return None
+        return self._range(key, value, True, value, True)
+
+    def _match(self, pred):
+        """Record ids matching *pred*, or ``None`` if the indexes cannot tell."""
+        if isinstance(pred, _Compare):
+            key, op, value = pred.field.key, pred.op, pred.value
+            if op == "==":
+                return self._equal(key, value)
+            if op == "!=":
+                rids = self._equal(key, value)
+                return None if rids is None else set(self._items).difference(rids)
+            if op in ("<", "<="):
+                return self._range(key, None, True, value, op == "<=")
+            return self._range(key, value, op == ">=", None, True)
+        if isinstance(pred, _Between):
+            return self._range(pred.field.key, pred.low, True, pred.high, True)
+        if isinstance(pred, _IsIn):
+            rids = set()
+            for value in pred.values:
+                matched = self._equal(pred.field.key, value)
+                if matched is None:
+                    return None
+                rids |= matched
+            return rids
+        if isinstance(pred, _AllOf):
+            answered, rest = [], []
+            for part in pred.preds:
+                rids = self._match(part)
+                if rids is None:
+                    rest.append(part)
+                else:
+                    answered.append(rids)
+            if not answered:
+                return None
+            answered.sort(key=len)
+            rids = answered[0].intersection(*answered[1:])
+            items = self._items
+            return {rid for rid in rids if all(part(items[rid]) for part in rest)} if rest else rids
+        if isinstance(pred, _AnyOf):
+            rids = set()
+            for part in pred.preds:
+                matched = self._match(part)
+                if matched is None:
+                    return None
+                rids |= matched
+            return rids
+        if isinstance(pred, _Not):
+            rids = self._match(pred.pred)
+            return None if rids is None else set(self._items).difference(rids)
+        return None
+
+    def _spawn(self, items):
+        new = object.__new__(self.__class__)
+        IndexedFilterable.__init__(new, items, self._hash_fields, self._sorted_fields)
+        return new
+
+    def __filter__(self, predicate):
+        rids = self._match(predicate) if isinstance(predicate, Predicate) else None
+        if rids is None:
+            return self._spawn(item for item in self._items.values() if predicate(item))
+        items = self._items
+        return self._spawn(items[rid] for rid in sorted(rids))
+
+    def __collect__(self, items):
+        """A new collection of *items* with the same indexes."""
+        return self._spawn(items)
+
+
+class ArrayContainer(Sortable, Filterable, Transformable):
+    """
+    A numeric container backed by a NumPy array, or by :class:`array.array`
+    when NumPy is not installed.
+
+    *typecode* is an :mod:`array` typecode (``"d"``, ``"q"``, ...), also
+    used as the NumPy dtype; by default NumPy infers it and the fallback
+    keeps the typecode of an ``array`` argument or uses ``"d"``.
+
+    With NumPy, :meth:`sort` is ``ndarray.sort`` (equal numbers are
+    indistinguishable, so stability does not matter).  :meth:`filter` and
+    :meth:`reject` accept a boolean mask or a callable; :meth:`map` takes
+    a callable.  A one-argument NumPy ufunc (``np.isfinite``, ``np.sqrt``)
+    is applied to the whole array at once.  Any other callable is applied
+    element by element, unless the container was built with
+    ``vectorize=True``: then callables are first tried on the whole array
+    (``lambda a: a > 0``), and their result is used if it is an array of
+    the same shape.  Only pass ``vectorize=True`` for callables that work
+    element-wise on arrays; ``np.cumsum`` also returns an array of the same
+    shape, but not an element-wise one.  Callables that fail on the array
+    are then applied element by element, so they may be called once more
+    than you would expect.  Results of :meth:`filter`, :meth:`map` and
+    slicing keep the setting.
+
+    :meth:`nsmallest`, :meth:`nlargest`, :meth:`partition` and
+    :meth:`iter_sorted` use ``np.partition``/``np.sort`` when no key is
+    given.  Without NumPy everything runs element by element.
+    """
+
+    def __init__(self, data=(), typecode=None, vectorize=False):
+        np = self._np = _numpy()
+        self._vectorize = vectorize
+        if np is not None:
+            self._data = np.array(data, dtype=typecode)
+        else:
+            typecode = typecode or getattr(data, "typecode", "d")
+            self._data = array(typecode, data)
+
+    def _wrap(self, data):
+        new = object.__new__(self.__class__)
+        new._np = self._np
+        new._vectorize = self._vectorize
+        new._data = data
+        return new
+
+    @property
+    def data(self):
+        """The underlying ``numpy.ndarray`` or ``array.array`` (not a copy)."""
+        return self._data
+
+    @property
+    def typecode(self):
+        data = self._data
+        return data.typecode if self._np is None else data.dtype.char
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        # Python scalars on both backends, so element-wise callables behave alike.
+        return iter(self._data if self._np is None else self._data.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            data = self._data[index]
+            return self._wrap(data.copy() if self._np is not None else data)
+        value = self._data[index]
+        return value if self._np is None else value.item()
+
+    def __array__(self, dtype=None, copy=None):
+        return _numpy().asarray(self._data, dtype=dtype)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r}, typecode={self.typecode!r})"
+
+    def __copy__(self):
+        data = self._data
+        return self._wrap(data.copy() if self._np is not None else array(data.typecode, data))
+
+    # -- vectorized helpers -----------------------------------------------------
+
+    def _vectorized(self, func):
+        """``func(array)`` if *func* may see the whole array and keeps its shape, else ``None``."""
+        np = self._np
+        if np is None:
+            return None
+        if not (self._vectorize
+                or isinstance(func, np.ufunc) and func.nin == 1 and func.nout == 1):
+            return None
+        try:
+            out = func(self._data)
+        except Exception:
+            return None
+        if isinstance(out, np.ndarray) and out.shape == self._data.shape:
+            return out
+        return None
+
+    def _mask(self, predicate):
+        if callable(predicate):
+            mask = self._vectorized(predicate)
+            return None if mask is None else mask.astype(bool, copy=False)
+        if len(predicate) != len(self._data):
+            raise ValueError("mask length does not match the container")
+        if self._np is not None:
+            return self._np.asarray(predicate, dtype=bool)
+        return list(map(bool, predicate))
+
+    def _select(self, mask):
+        if self._np is not None:
+            return self._wrap(self._data[mask])
+        return self._wrap(array(self._data.typecode, compress(self._data, mask)))
+
+    # -- Sortable / Filterable / Transformable ------------------------------------
+
+    def __sort__(self, reverse=False):
+        data = self._data
+        if self._np is None:
+            data[:] = array(data.typecode, sorted(data, reverse=reverse))
+            return
+        data.sort()
+        if reverse:
+            data[:] = data[::-1].copy()
+
+    def argsort(self, reverse=False):
+        """Positions that would sort the container (a stable argsort)."""
+        data = self._data
+        if self._np is None:
+            return sorted(range(len(data)), key=data.__getitem__, reverse=reverse)
+        order = data.argsort(kind="stable")
+        return order[::-1] if reverse else order
+
+    def __filter__(self, predicate):
+        mask = self._mask(predicate)
+        if mask is None:
+            return self._select(list(map(bool, map(predicate, self))))
+        return self._select(mask)
+
+    def reject(self, predicate):
+        mask = self._mask(predicate)
+        if mask is None:
+            return self._select([not predicate(x) for x in self])
+        if self._np is not None:
+            return self._select(~mask)
+        return self._select([not m for m in mask])
+
+    def __transform__(self, func):
+        out = self._vectorized(func)
+        if out is not None:
+            return self._wrap(out)
+        return self.__collect__(map(func, self))
+
+    def __collect__(self, items):
+        """A new ArrayContainer of *items*, with a typecode that fits them."""
+        values = list(items)
+        if self._np is not None:
+            return self._wrap(self._np.array(values))
+        try:
+            return self._wrap(array(self._data.typecode, values))
+        except (TypeError, OverflowError):
+            # e.g. an int array mapped to floats
+            return self._wrap(array("d", values))
+
+    def nsmallest(self, k, key=None):
+        np, data = self._np, self._data
+        if np is None or key is not None or k >= len(data):
+            return super().nsmallest(k, key)
+        if k <= 0:
+            return []
+        part = np.partition(data, k - 1)[:k]
+        part.sort()
+        return part.tolist()
+
+    def nlargest(self, k, key=None):
+        np, data = self._np, self._data
+        if np is None or key is not None or k >= len(data):
+            return super().nlargest(k, key)
+        if k <= 0:
+            return []
+        part = np.partition(data, len(data) - k)[len(data) - k:]
+        part.sort()
+        return part[::-1].tolist()
+
+    def partition(self, k, key=None):
+        np, data = self._np, self._data
+        if np is None or key is not None:
+            return super().partition(k, key)
+        if not -len(data) <= k < len(data):
+            raise IndexError("partition index out of range")
+        return np.partition(data, k).tolist()
+
+    def iter_sorted(self, key=None, reverse=False, external=False, **options):
+        np = self._np
+        if np is None or key is not None or external:
+            return super().iter_sorted(key, reverse, external, **options)
+        data = np.sort(self._data)
+        return iter((data[::-1] if reverse else data).tolist())
+
+
+class AsyncStream(AsyncFilterable, AsyncTransformable):
+    """
+    A one-shot async stream implementing `AsyncFilterable` and
+    `AsyncTransformable`.
+
+    *source* is an async iterable (or a plain iterable).  :meth:`afilter`,
+    :meth:`areject` and :meth:`amap` return new streams without reading
+    anything; records flow through the whole chain one at a time when the
+    result is consumed with ``async for``, so memory stays constant.
+    """
+
+    def __init__(self, source=()):
+        self._source = source if hasattr(source, "__aiter__") else _aiter_sync(source)
+
+    def __aiter__(self):
+        return self._source.__aiter__()
+
+    def __afilter__(self, predicate, concurrency=1):
+        return self.__class__(async_filter(predicate, self._source, concurrency))
+
+    def __atransform__(self, func, concurrency=1):
+        return self.__class__(async_map(func, self._source, concurrency))
+
+    async def collect(self, factory=list):
+        """Consume the stream into ``factory(items)``."""
+        return factory([item async for item in self._source])
+
+
+async def _aiter_sync(iterable):
+    for item in iterable:
+        yield item
+
+
+_WIDTH = 32  # maximum leaf length and branch fan-out of PersistentVector
+
+
+class _Branch:
+    """Immutable inner node: child nodes and their cumulative sizes."""
+
+    __slots__ = ("children", "ends")
+
+    def __init__(self, children, ends=None):
+        self.children = children
+        if ends is None:
+            total, ends = 0, []
+            for child in children:
+                total += child.ends[-1] if type(child) is _Branch else len(child)
+                ends.append(total)
+            ends = tuple(ends)
+        self.ends = ends
+
+
+def _node_size(node):
+    return node.ends[-1] if type(node) is _Branch else len(node)
+
+
+def _locate_child(node, index):
+    """Child position holding *index*, and the index within that child."""
+    j = bisect_right(node.ends, index)
+    if j == len(node.children):
+        j -= 1  # appending at the very end
+    return j, index - node.ends[j - 1] if j else index
+
+
+def _tree_from_nodes(nodes):
+    if not nodes:
+        return ()
+    while len(nodes) > 1:
+        nodes = [_Branch(tuple(nodes[i:i + _WIDTH])) for i in range(0, len(nodes), _WIDTH)]
+    return nodes[0]
+
+
+def _tree_from_items(items):
+    return _tree_from_nodes([tuple(items[i:i + _WIDTH]) for i in range(0, len(items), _WIDTH)])
+
+
+def _tree_leaves(node):
+    if type(node) is not _Branch:
+        yield node
+        return
+    for child in node.children:
+        yield from _tree_leaves(child)
+
+
+def _tree_set(node, index, value):
+    if type(node) is not _Branch:
+        return node[:index] + (value,) + node[index + 1:]
+    j, index = _locate_child(node, index)
+    children = node.children
+    return _Branch(children[:j] + (_tree_set(children[j], index, value),) + children[j + 1:], node.ends)
+
+
+def _tree_insert(node, index, value):
+    """Insert into *node*; return one node, or two after a split."""
+    if type(node) is not _Branch:
+        leaf = node[:index] + (value,) + node[index:]
+        if len(leaf) > _WIDTH:
+            half = len(leaf) // 2
+            return leaf[:half], leaf[half:]
+        return (leaf,)
+    j, index = _locate_child(node, index)
+    children = node.children
+    children = children[:j] + _tree_insert(children[j], index, value) + children[j + 1:]
+    if len(children) > _WIDTH:
+        half = len(children) // 2
+        return _Branch(children[:half]), _Branch(children[half:])
+    return (_Branch(children),)
+
+
+def _tree_delete(node, index):
+    """Delete from *node*; an emptied node comes back as ``()``."""
+    if type(node) is not _Branch:
+        return node[:index] + node[index + 1:]
+    j, index = _locate_child(node, index)
+    children = list(node.children)
+    child = _tree_delete(children[j], index)
+    if not _node_size(child):
+        del children[j]
+    else:
+        children[j] = child
+        if type(child) is not _Branch and len(child) < _WIDTH // 4 and len(children) > 1:
+            # Merge a small leaf into its neighbour (split again if too long).
+            lo = j - 1 if j else j
+            merged = children[lo] + children[lo + 1]
+            half = len(merged) // 2
+            children[lo:lo + 2] = [merged] if len(merged) <= _WIDTH else [merged[:half], merged[half:]]
+    return _Branch(tuple(children)) if children else ()
+
+
+class PersistentVector(Sortable, Filterable, Transformable):
+    """
+    A list-like sequence whose storage is shared between copies.
+
+    Elements are stored in a B-tree of immutable nodes (tuples of up to 32
+    elements at the leaves).  Edits replace only the nodes on the path to
+    the changed element, so :meth:`__copy__` is O(1), indexing, assignment,
+    :meth:`insert`, :meth:`append` and deletion are O(log n), and every copy
+    keeps seeing the elements it had - handy for handing snapshots to
+    readers while a writer carries on.
+
+    :meth:`sorted` is an O(1) copy plus a sort that is skipped when the
+    elements are already in order (then the result shares everything);
+    :meth:`filter` reuses every leaf in which nothing was dropped, and
+    :meth:`map` every leaf whose elements *func* returned unchanged.
+    """
+
+    def __init__(self, iterable=()):
+        items = list(iterable)
+        self._root = _tree_from_items(items)
+        self._len = len(items)
+
+    def _wrap(self, root):
+        new = object.__new__(self.__class__)
+        new._root = root
+        new._len = _node_size(root)
+        return new
+
+    def _index(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("PersistentVector index out of range")
+        return index
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(_tree_leaves(self._root))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__class__(list(self)[index])
+        index = self._index(index)
+        node = self._root
+        while type(node) is _Branch:
+            j, index = _locate_child(node, index)
+            node = node.children[j]
+        return node[index]
+
+    def __setitem__(self, index, value):
+        self._root = _tree_set(self._root, self._index(index), value)
+
+    def __delitem__(self, index):
+        root = _tree_delete(self._root, self._index(index))
+        while type(root) is _Branch and len(root.children) == 1:
+            root = root.children[0]
+        self._root = root
+        self._len -= 1
+
+    def insert(self, index, value):
+        """Insert *value* before position *index* (clamped like ``list.insert``)."""
+        if index < 0:
+            index = max(0, index + self._len)
+        index = min(index, self._len)
+        parts = _tree_insert(self._root, index, value)
+        self._root = parts[0] if len(parts) == 1 else _Branch(parts)
+        self._len += 1
+
+    def append(self, value):
+        """Add *value* at the end."""
+        self.insert(self._len, value)
+
+    def extend(self, iterable):
+        """Append every element of *iterable*."""
+        values = list(iterable)
+        if len(values) * 4 < self._len:
+            for value in values:
+                self.append(value)
+        else:
+            self._root = _tree_from_items(list(self) + values)
+            self._len += len(values)
+
+    def pop(self, index=-1):
+        """Remove and return the element at *index* (the last one by default)."""
+        value = self[index]
+        del self[index]
+        return value
+
+    def tolist(self):
+        """Return the elements as a new list."""
+        return list(self)
+
+    def __eq__(self, other):
+        if isinstance(other, PersistentVector):
+            return self._root is other._root or list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    # -- Sortable / Filterable / Transformable ------------------------------------
+
+    def __copy__(self):
+        return self._wrap(self._root)
+
+    def __sort__(self, reverse=False):
+        if all(map(ge if reverse else le, iter(self), islice(iter(self), 1, None))):
+            return  # already in order: keep sharing the tree
+        self._root = _tree_from_items(sorted(self, reverse=reverse))
+
+    def __filter__(self, predicate):
+        nodes, pending = [], []
+        for leaf in _tree_leaves(self._root):
+            kept = tuple(filter(predicate, leaf))
+            if len(kept) == len(leaf):
+                # Untouched leaf: flush what was collected before it, then share it.
+                nodes.extend(tuple(pending[i:i + _WIDTH]) for i in range(0, len(pending), _WIDTH))
+                pending.clear()
+                nodes.append(leaf)
+                continue
+            pending.extend(kept)
+            if len(pending) >= _WIDTH:
+                nodes.append(tuple(pending[:_WIDTH]))
+                del pending[:_WIDTH]
+        nodes.extend(tuple(pending[i:i + _WIDTH]) for i in range(0, len(pending), _WIDTH))
+        return self._wrap(_tree_from_nodes(nodes))
+
+    def __transform__(self, func):
+        nodes = []
+        for leaf in _tree_leaves(self._root):
+            mapped = tuple(map(func, leaf))
+            nodes.append(leaf if all(map(is_, mapped, leaf)) else mapped)
+        return self._wrap(_tree_from_nodes(nodes))
+
+    def __collect__(self, items):
+        """A new PersistentVector of *items*."""
+        return self._wrap(_tree_from_items(list(items)))
@@ -0,0 +1,146 @@
+# """Type stubs for `more_abc.containers`."""
+
+from array import array
+from typing import (Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Generic, Iterable,
+                    Iterator, Optional, TypeVar, Union, overload)
+
+from .collections_abc import (AsyncFilterable, AsyncTransformable, Field, Filterable, Sortable,
+                              Transformable)
+
+__all__ = ["SortedList", "IndexedFilterable", "ArrayContainer", "AsyncStream",
+           "PersistentVector"]
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+
+
+class SortedList(Sortable, Filterable, Transformable, Generic[_T]):
+    # """A list that keeps its elements ordered as they are added."""
+    _load: int
+    def __init__(self, iterable: Iterable[_T] = ..., key: Optional[Callable[[_T], Any]] = ...) -> None: ...
+    @property
+    def key(self) -> Optional[Callable[[_T], Any]]: ...
+    def add(self, value: _T) -> None: ...
+    def update(self, iterable: Iterable[_T]) -> None: ...
+    def discard(self, value: _T) -> None: ...
+    def remove(self, value: _T) -> None: ...
+    def pop(self, index: int = ...) -> _T: ...
+    def clear(self) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __reversed__(self) -> Iterator[_T]: ...
+    def __contains__(self, value: object) -> bool: ...
+    @overload
+    def __getitem__(self, index: int) -> _T: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[_T]: ...
+    def index(self, value: _T) -> int: ...
+    def count(self, value: _T) -> int: ...
+    def bisect_left(self, value: _T) -> int: ...
+    def bisect_right(self, value: _T) -> int: ...
+    def __copy__(self) -> "SortedList[_T]": ...
+    def __sort__(self, reverse: bool = ...) -> None: ...
+    def nsmallest(self, k: int, key: Optional[Callable[[_T], Any]] = ...) -> list[_T]: ...
+    def nlargest(self, k: int, key: Optional[Callable[[_T], Any]] = ...) -> list[_T]: ...
+    def partition(self, k: int, key: Optional[Callable[[_T], Any]] = ...) -> list[_T]: ...
+    def iter_sorted(
+        self,
+        key: Optional[Callable[[_T], Any]] = ...,
+        reverse: bool = ...,
+        external: bool = ...,
+        **options: Any,
+    ) -> Iterator[_T]: ...
+    def __filter__(self, predicate: Callable[[_T], Any]) -> "SortedList[_T]": ...
+    def __transform__(self, func: Callable[[_T], _U]) -> "SortedList[_U]": ...
+    def __collect__(self, items: Iterable[_U]) -> "SortedList[_U]": ...
+
+
+class IndexedFilterable(Filterable, Generic[_T]):
+    # """A Filterable collection of records with secondary indexes."""
+    def __init__(
+        self,
+        items: Iterable[_T] = ...,
+        hash_index: Iterable[Union[str, Field]] = ...,
+        sorted_index: Iterable[Union[str, Field]] = ...,
+    ) -> None: ...
+    def add(self, item: _T) -> None: ...
+    def extend(self, items: Iterable[_T]) -> None: ...
+    def discard(self, item: _T) -> None: ...
+    def remove(self, item: _T) -> None: ...
+    def refresh(self, item: _T) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    def __filter__(self, predicate: Callable[[_T], Any]) -> "IndexedFilterable[_T]": ...
+    def __collect__(self, items: Iterable[_U]) -> "IndexedFilterable[_U]": ...
+
+
+class ArrayContainer(Sortable, Filterable, Transformable):
+    # """A numeric container backed by a NumPy array, or by array.array without NumPy."""
+    def __init__(
+        self, data: Iterable[Any] = ..., typecode: Optional[str] = ..., vectorize: bool = ...
+    ) -> None: ...
+    @property
+    def data(self) -> Any: ...  # numpy.ndarray or array.array
+    @property
+    def typecode(self) -> str: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+    @overload
+    def __getitem__(self, index: slice) -> "ArrayContainer": ...
+    def __array__(self, dtype: Any = ..., copy: Optional[bool] = ...) -> Any: ...
+    def __copy__(self) -> "ArrayContainer": ...
+    def __sort__(self, reverse: bool = ...) -> None: ...
+    def argsort(self, reverse: bool = ...) -> Any: ...
+    def __filter__(self, predicate: Union[Callable[[Any], Any], Iterable[bool]]) -> "ArrayContainer": ...
+    def reject(self, predicate: Union[Callable[[Any], Any], Iterable[bool]]) -> "ArrayContainer": ...
+    def __transform__(self, func: Callable[[Any], Any]) -> "ArrayContainer": ...
+    def __collect__(self, items: Iterable[Any]) -> "ArrayContainer": ...
+    def nsmallest(self, k: int, key: Optional[Callable[[Any], Any]] = ...) -> list[Any]: ...
+    def nlargest(self, k: int, key: Optional[Callable[[Any], Any]] = ...) -> list[Any]: ...
+    def partition(self, k: int, key: Optional[Callable[[Any], Any]] = ...) -> list[Any]: ...
+    def iter_sorted(
+        self,
+        key: Optional[Callable[[Any], Any]] = ...,
+        reverse: bool = ...,
+        external: bool = ...,
+        **options: Any,
+    ) -> Iterator[Any]: ...
+
+
+class AsyncStream(AsyncFilterable, AsyncTransformable, Generic[_T]):
+    # """A one-shot async stream implementing AsyncFilterable and AsyncTransformable."""
+    def __init__(self, source: Union[AsyncIterable[_T], Iterable[_T]] = ...) -> None: ...
+    def __aiter__(self) -> AsyncIterator[_T]: ...
+    def __afilter__(
+        self, predicate: Callable[[_T], Union[Any, Awaitable[Any]]], concurrency: int = ...
+    ) -> "AsyncStream[_T]": ...
+    def __atransform__(
+        self, func: Callable[[_T], Union[_U, Awaitable[_U]]], concurrency: int = ...
+    ) -> "AsyncStream[_U]": ...
+    async def collect(self, factory: Callable[[list[_T]], Any] = ...) -> Any: ...
+
+
+class PersistentVector(Sortable, Filterable, Transformable, Generic[_T]):
+    # """A list-like sequence whose storage is shared between copies."""
+    def __init__(self, iterable: Iterable[_T] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[_T]: ...
+    @overload
+    def __getitem__(self, index: int) -> _T: ...
+    @overload
+    def __getitem__(self, index: slice) -> "PersistentVector[_T]": ...
+    def __setitem__(self, index: int, value: _T) -> None: ...
+    def __delitem__(self, index: int) -> None: ...
+    def insert(self, index: int, value: _T) -> None: ...
+    def append(self, value: _T) -> None: ...
+    def extend(self, iterable: Iterable[_T]) -> None: ...
+    def pop(self, index: int = ...) -> _T: ...
+    def tolist(self) -> list[_T]: ...
+    def __copy__(self) -> "PersistentVector[_T]": ...
+    def __sort__(self, reverse: bool = ...) -> None: ...
+    def __filter__(self, predicate: Callable[[_T], Any]) -> "PersistentVector[_T]": ...
+    def __transform__(self, func: Callable[[_T], _U]) -> "PersistentVector[_U]": ...
+    def __collect__(self, items: Iterable[_U]) -> "PersistentVector[_U]": ...
+
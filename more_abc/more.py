@@ -6,15 +6,226 @@
 # /_/_/_/\___/_/  \__/__\_,_/_.__/\__/ 
 #                   /___/              
 
-from abc import ABC, ABCMeta, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod, get_cache_token
+import sys
+from itertools import chain, islice
+from types import MethodType
+from weakref import WeakSet, ref
 
 __all__ = ["ABCMixin",
+           "SlottedABCMixin",
+           "FastABCMeta",
            "ABCclassType",
            "ABCMetaclassType",
            "ABCException",
            "ABCWarning",
            "abstract_class",
-           "abstractproperty"]
+           "abstractproperty",
+           "validate_many",
+           "to_dicts",
+           "to_columns"]
+
+# ======================================================================
+# Cache token -> weak reference to the FastABCMeta class whose register()
+# produced it, so that a stale lookup table can tell whether any
+# registration since it was filled could have changed its answers.
+_fast_abc_registrations = {}
+# A table further behind than this many registrations is simply cleared.
+_FAST_ABC_REGISTRATION_LOG = 256
+
+
+def _fast_abc_revalidate(cls, token):
+    """Bring the lookup table of *cls* up to cache token *token*.
+
+    The table survives only if every registration since it was filled went
+    through a ``FastABCMeta`` class that is not a subclass of *cls*: only
+    registrations into *cls*, its ancestors or an ABC that *cls* was
+    registered with can change ``issubclass(x, cls)``.  Checked in order,
+    each of those tests may use the table itself: as long as the earlier
+    registrations were unrelated, its answers still hold.
+    """
+    old = cls._fast_abc_token
+    cls._fast_abc_token = token
+    if token - old <= _FAST_ABC_REGISTRATION_LOG:
+        for step in range(old + 1, token + 1):
+            wr = _fast_abc_registrations.get(step)
+            registrar = None if wr is None else wr()
+            if registrar is None or issubclass(registrar, cls):
+                break
+        else:
+            return
+    cls._fast_abc_cache.clear()
+    cls._fast_abc_refs.clear()
+
+
+def _fast_abc_wrap(cls):
+    """Give *cls* a lookup table, once it has a subclass or a registration."""
+    hook = cls.__dict__["__subclasshook__"]
+    if not isinstance(hook, _FastABCHook):
+        cls._fast_abc_token = get_cache_token()
+        type.__setattr__(cls, "__subclasshook__", _FastABCHook(hook))
+
+
+def _fast_abc_store(cls, subclass, result):
+    cache, refs = cls._fast_abc_cache, cls._fast_abc_refs
+    key = id(subclass)
+
+    def forget(_):
+        cache.pop(key, None)
+        refs.pop(key, None)
+
+    try:
+        refs[key] = ref(subclass, forget)
+    except TypeError:
+        return
+    size = cls._fast_abc_cache_size
+    if size is not None and len(cache) >= size and key not in cache:
+        oldest = next(iter(cache))
+        del cache[oldest], refs[oldest]
+    cache[key] = result
+
+
+class _FastABCHook:
+    """
+    The ``__subclasshook__`` of a ``FastABCMeta`` class.
+
+    ABCMeta calls the hook right after its own caches miss.  The hook
+    answers from the lookup table, or finishes ABCMeta's check itself (the
+    wrapped hook, then the MRO, the registry and the subclasses) and
+    records the result, which ABCMeta then caches as usual.  Other
+    attributes are those of the wrapped hook (e.g. ``invalidate`` of a
+    :class:`~more_abc.collections_abc.structural_hook`).
+    """
+
+    __slots__ = ("original",)
+
+    def __init__(self, original):
+        self.original = original
+
+    def __get__(self, instance, owner=None):
+        if owner is None:
+            owner = type(instance)
+        return MethodType(self, owner)
+
+    def __getattr__(self, name):
+        return getattr(self.original, name)
+
+    def __call__(self, cls, subclass):
+        token = get_cache_token()
+        if cls._fast_abc_token != token:
+            _fast_abc_revalidate(cls, token)
+        result = cls._fast_abc_cache.get(id(subclass))
+        if result is not None:
+            return result
+        result = self.original.__get__(None, cls)(subclass)
+        if result is NotImplemented:
+            result = _fast_abc_walk(cls, subclass)
+        _fast_abc_store(cls, subclass, result)
+        return result
+
+
+def _fast_abc_walk(cls, subclass):
+    """The rest of ABCMeta's check: the MRO, the registry, the subclasses."""
+    if cls in getattr(subclass, "__mro__", ()):
+        return True
+    if cls._fast_abc_registry:
+        for rcls in cls._fast_abc_registry:
+            if issubclass(subclass, rcls):
+                return True
+    for scls in cls.__subclasses__():
+        if issubclass(subclass, scls):
+            return True
+    return False
+
+
+class FastABCMeta(ABCMeta):
+    """
+    Drop-in replacement for :class:`~abc.ABCMeta` that keeps its answers.
+
+    ``isinstance`` and ``issubclass`` go through ABCMeta's own caches
+    exactly as before, so warm checks cost the same.  What ABCMeta loses is
+    its negative cache: every ``register()`` anywhere flushes it, and the
+    next check walks the registry and every subclass again.  Each class
+    built with this metaclass that has subclasses or registrations also
+    keeps a table mapping a concrete type to the result of
+    ``issubclass(type, cls)``, consulted (through ``__subclasshook__``)
+    before that walk.
+
+    After a ``register()`` on a ``FastABCMeta`` class, only the tables of
+    the classes it is a subclass of (its ancestors and the ABCs it was
+    registered with) are cleared, the next time they are used;
+    ``register()`` on a plain :class:`~abc.ABCMeta` class clears every
+    table.  Entries hold only weak references to the checked types.
+
+    Pass ``cache_size=N`` as a class keyword to cap the table at *N* entries
+    (oldest entries are evicted first); subclasses inherit the cap unless
+    they set their own.
+
+        class User(ABCMixin, metaclass=FastABCMeta, cache_size=1024):
+            ...
+    """
+
+    def __new__(mcls, name, bases, namespace, /, cache_size=None, **kwargs):
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        if cache_size is None:
+            cache_size = getattr(cls, "_fast_abc_cache_size", None)
+        elif cache_size < 1:
+            raise ValueError("cache_size must be a positive integer or None")
+        cls._fast_abc_cache_size = cache_size
+        # id(type) -> result, and id(type) -> weak reference whose callback
+        # drops both entries before the id can be reused.
+        cls._fast_abc_cache = {}
+        cls._fast_abc_refs = {}
+        cls._fast_abc_token = get_cache_token()
+        cls._fast_abc_registry = WeakSet()
+        # A class with no subclasses and no registrations gains nothing from
+        # a table, so it keeps the plain hook until it gets one of them.
+        for base in cls.__mro__:
+            hook = base.__dict__.get("__subclasshook__")
+            if hook is not None:
+                break
+        if isinstance(hook, _FastABCHook):
+            hook = hook.original
+        type.__setattr__(cls, "__subclasshook__", hook)
+        for base in cls.__mro__[1:]:
+            if isinstance(base, FastABCMeta):
+                # The new class's hook may claim types its ancestors have
+                # already answered ``False`` for.
+                base._fast_abc_cache.clear()
+                base._fast_abc_refs.clear()
+        for base in bases:
+            if isinstance(base, FastABCMeta):
+                _fast_abc_wrap(base)
+        return cls
+
+    def register(cls, subclass):
+        """Register a virtual subclass of an ABC.
+
+        Returns the subclass, to allow usage as a class decorator.
+        """
+        before = get_cache_token()
+        subclass = super().register(subclass)
+        after = get_cache_token()
+        cls._fast_abc_registry.add(subclass)
+        _fast_abc_wrap(cls)
+        if after == before + 1:
+            _fast_abc_registrations[after] = ref(cls)
+            _fast_abc_registrations.pop(after - _FAST_ABC_REGISTRATION_LOG, None)
+        return subclass
+
+    def _abc_caches_clear(cls):
+        """Clear the caches (for debugging or testing)."""
+        cls._fast_abc_cache.clear()
+        cls._fast_abc_refs.clear()
+        super()._abc_caches_clear()
+
+    def _abc_registry_clear(cls):
+        """Clear the registry (for debugging or testing)."""
+        cls._fast_abc_registry.clear()
+        cls._fast_abc_cache.clear()
+        cls._fast_abc_refs.clear()
+        super()._abc_registry_clear()
+# ======================================================================
 
 # All the ABC classes.
 # ======================================================================
@@ -25,8 +236,33 @@ class ABCMixin(metaclass=ABCMeta):
 
     This mixin enforces implementation of core methods while providing
     common functionality that works with those abstract methods.
+
+    Subclasses may opt into :class:`FastABCMeta` with
+    ``class User(ABCMixin, metaclass=FastABCMeta)``.
+
+    Passing ``memoize=True`` as a class keyword caches the result of
+    :meth:`is_valid` and the :meth:`to_dict` snapshot used by
+    :meth:`get_info` and ``repr()``.  The cache is dropped whenever an
+    attribute is set or deleted; call :meth:`memo_clear` after mutating
+    nested state in place.  The cache lives outside the instance, so it
+    never shows up in ``vars()``, copies or pickles, and :meth:`get_info`
+    returns a shallow copy of the snapshot.
     """
 
+    __slots__ = ()
+    _abc_memoize = False
+
+    def __init_subclass__(cls, memoize=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if memoize is not None:
+            cls._abc_memoize = bool(memoize)
+        if cls._abc_memoize:
+            cls._abc_memo_stats = [0, 0]
+            if not getattr(cls.__setattr__, "__abc_memo__", False):
+                cls.__setattr__ = _memo_invalidating(cls.__setattr__)
+            if not getattr(cls.__delattr__, "__abc_memo__", False):
+                cls.__delattr__ = _memo_invalidating(cls.__delattr__)
+
     @abstractmethod
     def initialize(self):
         """Initialize the instance. Must be implemented by subclasses."""
@@ -47,6 +283,11 @@ class ABCMixin(metaclass=ABCMeta):
         Check if the instance is valid.
         Concrete method that uses the abstract validate method.
         """
+        if self._abc_memoize:
+            return self._abc_memo_get("is_valid", self._check_valid)
+        return self._check_valid()
+
+    def _check_valid(self):
         try:
             return self.validate()
         except Exception:
@@ -57,15 +298,222 @@ class ABCMixin(metaclass=ABCMeta):
         Get instance information including validation status.
         Concrete method that combines abstract methods.
         """
+        data = self._snapshot()
         return {
-            "data": self.to_dict(),
+            "data": dict(data) if self._abc_memoize else data,
             "is_valid": self.is_valid(),
             "class_name": self.__class__.__name__
         }
 
+    def _snapshot(self):
+        if self._abc_memoize:
+            return self._abc_memo_get("data", self.to_dict)
+        return self.to_dict()
+
+    def _abc_memo_get(self, key, compute):
+        entry = _abc_memos.get(id(self))
+        if entry is not None:
+            value = entry[1].get(key, _MISSING)
+            if value is not _MISSING:
+                self._abc_memo_stats[0] += 1
+                return value
+        self._abc_memo_stats[1] += 1
+        value = compute()
+        if entry is None:
+            entry = _memo_entry(self)
+            if entry is None:
+                return value
+        entry[1][key] = value
+        return value
+
+    def memo_clear(self):
+        """Drop the cached validation result and dict snapshot of this instance."""
+        _abc_memos.pop(id(self), None)
+
+    @classmethod
+    def memo_info(cls):
+        """Return the memo ``hits`` and ``misses`` counted for this class."""
+        hits, misses = getattr(cls, "_abc_memo_stats", (0, 0))
+        return {"hits": hits, "misses": misses}
+
     def __repr__(self):
         """String representation using to_dict method."""
-        return f"{self.__class__.__name__}({self.to_dict()})"
+        return f"{self.__class__.__name__}({self._snapshot()})"
+
+
+class _SlottedABCMeta(ABCMeta):
+    """ABCMeta that derives ``__slots__`` from the class annotations."""
+
+    def __new__(mcls, name, bases, namespace, /, **kwargs):
+        memoize = kwargs.get("memoize")
+        if memoize is None:
+            memoize = any(getattr(base, "_abc_memoize", False) for base in bases)
+        slots = namespace.get("__slots__")
+        if slots is None:
+            slots = []
+            for field, annotation in namespace.get("__annotations__", {}).items():
+                if _is_classvar(annotation) or any(hasattr(base, field) for base in bases):
+                    continue
+                if field in namespace:
+                    raise TypeError(
+                        f"{name}.{field} cannot have a class-level default: "
+                        f"it becomes a slot on {name} instances"
+                    )
+                slots.append(field)
+        elif isinstance(slots, str):
+            slots = [slots]
+        else:
+            slots = list(slots)
+        # The memo is keyed on a weak reference to the instance.
+        if (memoize and "__weakref__" not in slots
+                and not any(base.__weakrefoffset__ for base in bases)):
+            slots.append("__weakref__")
+        namespace["__slots__"] = tuple(slots)
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+
+def _is_classvar(annotation):
+    if isinstance(annotation, str):
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+    # A real ClassVar can only exist once `typing` has been imported; looking
+    # it up here keeps `typing` out of the import path of this module.
+    typing = sys.modules.get("typing")
+    return (typing is not None
+            and getattr(annotation, "__origin__", annotation) is typing.ClassVar)
+
+
+class SlottedABCMixin(ABCMixin, metaclass=_SlottedABCMeta):
+    """
+    Low-memory variant of :class:`ABCMixin` whose subclasses get ``__slots__``.
+
+    Every subclass that does not declare ``__slots__`` itself receives one
+    slot per annotated attribute, so instances carry no ``__dict__``.
+    ``ClassVar`` annotations are skipped, and annotated attributes must not
+    have class-level defaults.  Abstract-method enforcement, ``memoize=True``,
+    :meth:`~ABCMixin.get_info` and ``repr()`` behave as on :class:`ABCMixin`;
+    ``memoize=True`` adds a ``__weakref__`` slot if no base has one.
+
+        class Point(SlottedABCMixin):
+            x: int
+            y: int
+    """
+
+    __slots__ = ()
+
+
+_MISSING = object()
+# id(instance) -> (weak reference to the instance, memo dict).  The weak
+# reference's callback drops the entry before the id can be reused.
+_abc_memos = {}
+
+
+def _memo_entry(obj):
+    """Start an empty memo for *obj*, or return ``None`` if it cannot have one."""
+    key = id(obj)
+    try:
+        wr = ref(obj, lambda _, memos=_abc_memos: memos.pop(key, None))
+    except TypeError:
+        return None
+    entry = _abc_memos[key] = (wr, {})
+    return entry
+
+
+def _memo_invalidating(method):
+    """Wrap ``__setattr__``/``__delattr__`` so that they drop the ABCMixin memo."""
+    def wrapper(self, name, *args):
+        method(self, name, *args)
+        if _abc_memos:
+            _abc_memos.pop(id(self), None)
+    wrapper.__name__ = method.__name__
+    wrapper.__qualname__ = method.__qualname__
+    wrapper.__abc_memo__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+# ======================================================================
+
+# ======================================================================
+# Batch helpers for large collections of ABCMixin instances.
+
+# Every batch helper accepts an optional `concurrent.futures.Executor`; the
+# input is cut into chunks of *chunksize* objects and each chunk is handled
+# by one task, so results come back in input order.  Chunk workers live at
+# module level so that a ProcessPoolExecutor can pickle them.
+def _chunked(iterable, size):
+    """Yield successive lists of at most *size* items from *iterable*."""
+    if size < 1:
+        raise ValueError("chunksize must be a positive integer")
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+def _run_chunks(func, objs, executor, chunksize):
+    if executor is None:
+        return [func(objs)]
+    return executor.map(func, _chunked(objs, chunksize))
+
+def _validate_chunk(objs):
+    return [obj.is_valid() for obj in objs]
+
+def _to_dicts_chunk(objs):
+    return [obj.to_dict() for obj in objs]
+
+def _to_columns_chunk(objs):
+    columns = {}
+    count = 0
+    for obj in objs:
+        row = obj.to_dict()
+        for key, value in row.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * count
+            column.append(value)
+        count += 1
+        if len(row) != len(columns):
+            for column in columns.values():
+                if len(column) < count:
+                    column.append(None)
+    return count, columns
+
+def validate_many(objs, executor=None, chunksize=4096):
+    """
+    Return ``[obj.is_valid() for obj in objs]``, optionally on a pool.
+
+    With an *executor* (thread or process pool) the objects are validated in
+    chunks of *chunksize*; results are returned in input order.
+    """
+    return list(chain.from_iterable(
+        _run_chunks(_validate_chunk, objs, executor, chunksize)))
+
+def to_dicts(objs, executor=None, chunksize=4096):
+    """Return ``[obj.to_dict() for obj in objs]``, optionally on a pool."""
+    return list(chain.from_iterable(
+        _run_chunks(_to_dicts_chunk, objs, executor, chunksize)))
+
+def to_columns(objs, executor=None, chunksize=4096):
+    """
+    Export ``obj.to_dict()`` of every object as one dict of lists.
+
+    Keys keep the order in which they are first seen; rows that lack a key
+    get ``None`` in that column.  Each row dict is dropped as soon as its
+    values are appended, so only one list per key stays alive.
+    """
+    columns = {}
+    total = 0
+    for count, part in _run_chunks(_to_columns_chunk, objs, executor, chunksize):
+        for key, values in part.items():
+            column = columns.get(key)
+            if column is None:
+                if not total:
+                    columns[key] = values
+                    continue
+                column = columns[key] = [None] * total
+            column.extend(values)
+        total += count
+        for column in columns.values():
+            if len(column) < total:
+                column.extend([None] * (total - len(column)))
+    return columns
 # ======================================================================
 
 # ======================================================================
@@ -161,7 +609,11 @@ def abstractproperty(read_only=True):
 
 # ======================================================================
 class ABCException(Exception, metaclass=ABCMeta):
-    """General Exception for ABC Scenarios."""
+    """General Exception for ABC Scenarios.
+
+    Subclasses may opt into :class:`FastABCMeta` with
+    ``class MyError(ABCException, metaclass=FastABCMeta)``.
+    """
 
     def __init__(self, cls=None):
         self.cls = cls
@@ -173,7 +625,11 @@ class ABCException(Exception, metaclass=ABCMeta):
         pass
 
 class ABCWarning(Warning, metaclass=ABCMeta):
-    """General Warning for ABC Scenarios."""
+    """General Warning for ABC Scenarios.
+
+    Subclasses may opt into :class:`FastABCMeta` with
+    ``class MyWarning(ABCWarning, metaclass=FastABCMeta)``.
+    """
 
     def __init__(self, cls=None):
         self.cls = cls
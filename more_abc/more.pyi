@@ -1,13 +1,34 @@
 from abc import ABCMeta, abstractmethod
-from typing import Any, Callable, Type
+from concurrent.futures import Executor
+from typing import Any, Callable, Iterable, Optional, Type
 
 __all__ = ["ABCMixin",
+           "SlottedABCMixin",
+           "FastABCMeta",
            "ABCclassType",
            "ABCMetaclassType",
            "ABCException",
            "ABCWarning",
            "abstract_class",
-           "abstractproperty"]
+           "abstractproperty",
+           "validate_many",
+           "to_dicts",
+           "to_columns"]
+
+class FastABCMeta(ABCMeta):
+    _fast_abc_cache_size: Optional[int]
+    def __new__(
+        mcls,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        /,
+        cache_size: Optional[int] = ...,
+        **kwargs: Any,
+    ) -> FastABCMeta: ...
+    def register(cls, subclass: Type[Any]) -> Type[Any]: ...
+    def _abc_caches_clear(cls) -> None: ...
+    def _abc_registry_clear(cls) -> None: ...
 
 class ABCMixin(metaclass=ABCMeta):
     @abstractmethod
@@ -19,12 +40,33 @@ class ABCMixin(metaclass=ABCMeta):
     @abstractmethod
     def to_dict(self) -> dict[str, Any]: ...
 
+    def __init_subclass__(cls, memoize: Optional[bool] = ..., **kwargs: Any) -> None: ...
+
     def is_valid(self) -> bool: ...
 
     def get_info(self) -> dict[str, Any]: ...
 
+    def memo_clear(self) -> None: ...
+
+    @classmethod
+    def memo_info(cls) -> dict[str, int]: ...
+
     def __repr__(self) -> str: ...
 
+class _SlottedABCMeta(ABCMeta): ...
+
+class SlottedABCMixin(ABCMixin, metaclass=_SlottedABCMeta): ...
+
+def validate_many(
+    objs: Iterable[ABCMixin], executor: Optional[Executor] = ..., chunksize: int = ...
+) -> list[bool]: ...
+def to_dicts(
+    objs: Iterable[ABCMixin], executor: Optional[Executor] = ..., chunksize: int = ...
+) -> list[dict[str, Any]]: ...
+def to_columns(
+    objs: Iterable[ABCMixin], executor: Optional[Executor] = ..., chunksize: int = ...
+) -> dict[str, list[Any]]: ...
+
 ABCclassType: type[ABCMeta]
 ABCMetaclassType: type[type]
 
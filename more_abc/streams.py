@@ -0,0 +1,654 @@
+"""Concrete streams built on the ABCs of `more_abc.abc_io`."""
+
+import io
+import mmap
+import os
+import threading
+
+from .abc_io import AbstractAsyncRawIO, AbstractBufferedIO, AbstractRawIO, _byte_views
+
+__all__ = ["MmapRawIO", "RingBufferedReader", "AsyncRawIOAdapter", "AsyncStreamIO"]
+
+
+class MmapRawIO(AbstractRawIO):
+    """
+    Raw binary file I/O served from a memory map.
+
+    *file* is a path or an open file descriptor (closed with the stream only
+    when *closefd* is true).  *mode* is ``"r"`` (read-only), ``"r+"``
+    (read/write an existing file) or ``"w+"`` (create or truncate).
+
+    :meth:`read` and :meth:`readinto` copy straight out of the mapping
+    without a system call; :meth:`view` returns a :class:`memoryview` of
+    the mapping itself, with no copy at all.  Writing past the end grows
+    the file geometrically (and remaps it); the spare capacity is trimmed
+    again on :meth:`close`.  While views handed out by :meth:`view` are
+    alive the mapping cannot move, so growing, truncating or closing the
+    stream raises :class:`BufferError` until they are released.
+
+    :meth:`writev` and :meth:`readv` copy to and from the mapping directly
+    (a vectored system call would bypass it).
+
+    As with :class:`io.FileIO`, :meth:`flush` does not force data to disk:
+    writes land in the shared page cache and are visible to other readers
+    of the file at once; call :func:`os.fsync` on :meth:`fileno` for
+    durability.
+
+    *advice* (e.g. ``mmap.MADV_SEQUENTIAL``) is passed to :meth:`madvise`
+    for every new mapping.
+    """
+
+    _modes = {"r": os.O_RDONLY, "r+": os.O_RDWR, "w+": os.O_RDWR | os.O_CREAT | os.O_TRUNC}
+    # Defaults so that close() (also run from __del__) works on a half-built object.
+    _fd = None
+    _closefd = False
+    _writable = False
+    _mmap = _buf = None
+
+    def __init__(self, file, mode="r", closefd=True, advice=None):
+        if mode not in self._modes:
+            raise ValueError(f"invalid mode: {mode!r}")
+        if isinstance(file, int):
+            self._fd = file
+            self._closefd = closefd
+        else:
+            self._fd = os.open(file, self._modes[mode] | getattr(os, "O_BINARY", 0), 0o666)
+            self._closefd = True
+        self.name = file
+        self.mode = mode
+        self._writable = mode != "r"
+        self._advice = advice
+        self._pos = 0
+        self._size = os.fstat(self._fd).st_size
+        self._map(self._size)
+
+    # -- mapping --------------------------------------------------------------
+
+    def _map(self, capacity):
+        """(Re)map the file at *capacity* bytes, growing the file if needed."""
+        self._unmap()
+        if capacity > os.fstat(self._fd).st_size:
+            os.ftruncate(self._fd, capacity)
+        if capacity:
+            access = mmap.ACCESS_WRITE if self._writable else mmap.ACCESS_READ
+            self._mmap = mmap.mmap(self._fd, capacity, access=access)
+            self._buf = memoryview(self._mmap)
+            if self._advice is not None:
+                self.madvise(self._advice)
+
+    def _unmap(self):
+        if self._mmap is not None:
+            self._buf.release()
+            try:
+                self._mmap.close()
+            except BufferError:
+                # User views are alive: keep the mapping usable.
+                self._buf = memoryview(self._mmap)
+                raise
+            self._mmap = self._buf = None
+
+    def _capacity(self):
+        return 0 if self._mmap is None else len(self._mmap)
+
+    def madvise(self, advice, start=0, length=None):
+        """Pass an ``mmap.MADV_*`` hint for the mapping (no-op where unsupported)."""
+        if self._mmap is not None and hasattr(self._mmap, "madvise"):
+            if length is None:
+                length = len(self._mmap) - start
+            self._mmap.madvise(advice, start, length)
+
+    # -- RawIOBase --------------------------------------------------------------
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return self._writable
+
+    def seekable(self):
+        return True
+
+    def fileno(self):
+        return self._fd
+
+    def tell(self):
+        self._checkClosed()
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence!r})")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def read(self, size=-1):
+        self._checkClosed()
+        start = self._pos
+        end = self._size if size is None or size < 0 else min(self._size, start + size)
+        if end <= start:
+            return b""
+        self._pos = end
+        return self._mmap[start:end]
+
+    readall = read
+
+    def readinto(self, b):
+        self._checkClosed()
+        start = self._pos
+        if type(b) is bytearray:
+            # Common case: skip the memoryview casts (noticeable on small reads).
+            n = max(0, min(len(b), self._size - start))
+            if n:
+                b[:n] = self._buf[start:start + n]
+                self._pos = start + n
+            return n
+        with memoryview(b) as target, target.cast("B") as target:
+            n = max(0, min(len(target), self._size - start))
+            if n:
+                target[:n] = self._buf[start:start + n]
+                self._pos = start + n
+            return n
+
+    def view(self, size=-1):
+        """
+        Return up to *size* bytes at the current position as a read-only
+        memoryview of the mapping (no copy), and advance past them.
+
+        Release the view (``with`` or ``.release()``) before the stream has
+        to grow, shrink or close.
+        """
+        self._checkClosed()
+        start = self._pos
+        end = self._size if size is None or size < 0 else min(self._size, start + size)
+        end = max(start, end)
+        self._pos = end
+        if self._mmap is None:
+            return memoryview(b"")
+        return self._buf[start:end].toreadonly()
+
+    def write(self, b):
+        self._checkClosed()
+        if not self._writable:
+            raise io.UnsupportedOperation("File not open for writing")
+        with memoryview(b) as data, data.cast("B") as data:
+            start = self._pos
+            end = start + len(data)
+            if end > self._capacity():
+                self._map(max(end, 2 * self._capacity(), mmap.PAGESIZE))
+            self._buf[start:end] = data
+            self._pos = end
+            if end > self._size:
+                self._size = end
+            return len(data)
+
+    def writev(self, buffers):
+        """Write *buffers* in order into the mapping, growing it at most once."""
+        self._checkClosed()
+        if not self._writable:
+            raise io.UnsupportedOperation("File not open for writing")
+        views = _byte_views(buffers)
+        pos = start = self._pos
+        end = start + sum(view.nbytes for view in views)
+        if end > self._capacity():
+            self._map(max(end, 2 * self._capacity(), mmap.PAGESIZE))
+        buf = self._buf
+        for view in views:
+            buf[pos:pos + view.nbytes] = view
+            pos += view.nbytes
+        self._pos = end
+        if end > self._size:
+            self._size = end
+        return end - start
+
+    def readv(self, buffers):
+        """Fill *buffers* in order from the mapping until EOF."""
+        self._checkClosed()
+        pos = start = self._pos
+        for view in _byte_views(buffers):
+            n = min(view.nbytes, self._size - pos)
+            if n <= 0:
+                break
+            view[:n] = self._buf[pos:pos + n]
+            pos += n
+        self._pos = pos
+        return pos - start
+
+    def truncate(self, size=None):
+        self._checkClosed()
+        if not self._writable:
+            raise io.UnsupportedOperation("File not open for writing")
+        size = self._pos if size is None else size
+        if size < 0:
+            raise ValueError(f"negative size value {size}")
+        if size > self._capacity():
+            self._map(size)
+        elif size < self._size:
+            # Zero the dropped tail so that growing again reads zeros.
+            self._buf[size:self._size] = bytes(self._size - size)
+        self._size = size
+        return size
+
+    def close(self):
+        if self.closed:
+            return
+        self._unmap()  # BufferError while views are alive: the stream stays open
+        try:
+            if self._writable and self._fd is not None and os.fstat(self._fd).st_size != self._size:
+                os.ftruncate(self._fd, self._size)  # drop spare capacity
+        finally:
+            if self._closefd and self._fd is not None:
+                os.close(self._fd)
+            super().close()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} name={self.name!r} mode={self.mode!r}>"
+
+
+class RingBufferedReader(AbstractBufferedIO):
+    """
+    Buffered reader over a raw stream, backed by a fixed ring buffer.
+
+    *raw* is any readable raw stream (an :class:`AbstractRawIO`, a
+    :class:`io.FileIO`, ...); the ring of *capacity* bytes is filled with
+    ``raw.readinto`` and never reallocated.  :meth:`peek_view` and
+    :meth:`read1_view` hand out :class:`memoryview` slices of the ring
+    instead of new ``bytes``; a view stays valid until the next read from
+    this reader.  Views never cross the wrap-around point, so they can be
+    shorter than what is buffered; use :meth:`read` or :meth:`readinto` for
+    exact lengths.
+
+    With *prefetch* true a background thread keeps the ring filled while
+    the caller parses, so raw reads overlap with the consumer.  The two
+    sides share no lock: the producer only moves the tail and the consumer
+    only moves the head, and they wait on events only when the ring is
+    full or empty.  Prefetching needs a blocking raw stream, and the
+    reader itself is then for a single consumer thread.
+    """
+
+    # Defaults so that close() (also run from __del__) works on a half-built object.
+    raw = None
+    _thread = None
+
+    def __init__(self, raw, capacity=16 * io.DEFAULT_BUFFER_SIZE, prefetch=False):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not raw.readable():
+            raise OSError('"raw" argument must be readable.')
+        self.raw = raw
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        # Monotonic byte counters; the data lives at [head, tail) modulo capacity.
+        self._head = self._tail = 0
+        self._pending = 0  # bytes handed out by read1_view(), consumed on the next call
+        self._eof = False
+        self._error = None
+        self._closing = False
+        if prefetch:
+            self._hungry = self._starved = False
+            self._data = threading.Event()
+            self._space = threading.Event()
+            self._thread = threading.Thread(target=self._produce, name=f"{type(self).__name__}-prefetch",
+                                            daemon=True)
+            self._thread.start()
+
+    # -- producer -----------------------------------------------------------
+
+    def _fill(self):
+        """Read once from the raw stream into the free space after the tail."""
+        capacity = self.capacity
+        head, tail = self._head, self._tail
+        if head == tail and self._thread is None:
+            head = tail = self._head = self._tail = 0  # empty: restart at the front
+        free = capacity - (tail - head)
+        if not free:
+            return -1
+        start = tail % capacity
+        n = self.raw.readinto(self._view[start:start + min(free, capacity - start)])
+        if n:
+            self._tail = tail + n
+        return n
+
+    def _produce(self):
+        try:
+            while not self._closing:
+                if self._tail - self._head == self.capacity:
+                    self._space.clear()
+                    self._starved = True
+                    if self._tail - self._head == self.capacity and not self._closing:
+                        self._space.wait()
+                    self._starved = False
+                    continue
+                if not self._fill():
+                    break
+                if self._hungry:
+                    self._data.set()
+        except BaseException as exc:
+            self._error = exc
+        finally:
+            self._eof = True
+            self._data.set()
+
+    # -- consumer -----------------------------------------------------------
+
+    def _advance(self, n):
+        self._head += n
+        if self._thread is not None and self._starved:
+            self._space.set()
+
+    def _available(self):
+        """
+        Contiguous bytes readable at the head, reading or waiting for more
+        when the ring is empty; 0 at EOF, None if a non-blocking raw stream
+        has nothing.
+        """
+        if self._pending:
+            self._advance(self._pending)
+            self._pending = 0
+        while True:
+            head, tail = self._head, self._tail
+            if tail != head:
+                return min(tail - head, self.capacity - head % self.capacity)
+            if self._thread is None:
+                n = self._fill()
+                if not n:
+                    return n
+            elif self._eof:
+                if self._tail != head:
+                    continue  # the last fill landed just before EOF was flagged
+                if self._error is not None:
+                    raise self._error
+                return 0
+            else:
+                self._data.clear()
+                self._hungry = True
+                if self._tail == self._head and not self._eof:
+                    self._data.wait()
+                self._hungry = False
+
+    def peek_view(self, size=-1):
+        """
+        Return buffered bytes at the current position as a memoryview into
+        the ring, without consuming them (at most one raw read if the ring
+        is empty).
+        """
+        self._checkClosed()
+        head = self._head
+        if self._pending or head == self._tail:
+            n = self._available()
+            if not n:
+                return self._view[:0]
+            head = self._head
+        else:
+            n = min(self._tail - head, self.capacity - head % self.capacity)
+        if size is not None and 0 <= size < n:
+            n = size
+        start = head % self.capacity
+        return self._view[start:start + n].toreadonly()
+
+    def read1_view(self, size=-1):
+        """
+        Like :meth:`read1`, but return a memoryview into the ring.
+
+        The bytes count as consumed from the next read on; the view must not
+        be used after that.
+        """
+        view = self.peek_view(size)
+        self._pending = len(view)
+        return view
+
+    def peek(self, size=0):
+        return self.peek_view().tobytes()
+
+    def read1(self, size=-1):
+        return self.read1_view(size).tobytes()
+
+    def read(self, size=-1):
+        self._checkClosed()
+        capacity = self.capacity
+        want = -1 if size is None or size < 0 else size
+        parts = []
+        while want:
+            n = self._available()
+            if not n:
+                if n is None and not parts:
+                    return None
+                break
+            if 0 < want < n:
+                n = want
+            start = self._head % capacity
+            parts.append(self._view[start:start + n].tobytes())
+            self._advance(n)
+            if want > 0:
+                want -= n
+        return b"".join(parts)
+
+    def readline(self, size=-1):
+        # The inherited readline() peeks, and peek() copies everything
+        # contiguous in the ring; search the ring in place instead.
+        self._checkClosed()
+        capacity = self.capacity
+        want = -1 if size is None or size < 0 else size
+        parts = []
+        while want:
+            head, tail = self._head, self._tail
+            if self._pending or head == tail:
+                n = self._available()
+                if not n:
+                    break
+                head = self._head
+            else:
+                n = min(tail - head, capacity - head % capacity)
+            if 0 < want < n:
+                n = want
+            start = head % capacity
+            end = self._buffer.find(b"\n", start, start + n)
+            if end >= 0:
+                n = end + 1 - start
+            line = self._buffer[start:start + n]
+            self._advance(n)
+            if end >= 0:
+                if not parts:
+                    return bytes(line)
+                parts.append(line)
+                break
+            parts.append(line)
+            if want > 0:
+                want -= n
+        return b"".join(parts)
+
+    def readinto(self, b):
+        return self._readinto(b, False)
+
+    def readinto1(self, b):
+        return self._readinto(b, True)
+
+    def _readinto(self, b, once):
+        self._checkClosed()
+        capacity = self.capacity
+        with memoryview(b) as target, target.cast("B") as target:
+            if (self._thread is None and not self._pending and self._head == self._tail
+                    and len(target) >= capacity):
+                return self.raw.readinto(target)  # large read into an empty ring: bypass it
+            done = 0
+            while done < len(target):
+                n = self._available()
+                if not n:
+                    if n is None and not done:
+                        return None
+                    break
+                n = min(n, len(target) - done)
+                start = self._head % capacity
+                target[done:done + n] = self._view[start:start + n]
+                self._advance(n)
+                done += n
+                if once and self._head == self._tail:
+                    break
+            return done
+
+    def write(self, b):
+        raise io.UnsupportedOperation("write")
+
+    def readable(self):
+        return True
+
+    def fileno(self):
+        return self.raw.fileno()
+
+    def close(self):
+        if self.raw is None or self.closed:
+            return
+        try:
+            if self._thread is not None:
+                self._closing = True
+                self._space.set()
+                self._thread.join()  # waits for an in-flight raw read
+        finally:
+            try:
+                self.raw.close()
+            finally:
+                super().close()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} raw={self.raw!r} capacity={self.capacity}>"
+
+
+class AsyncRawIOAdapter(AbstractAsyncRawIO):
+    """
+    :class:`AbstractAsyncRawIO` over a blocking raw stream.
+
+    Every call runs in *executor* (the loop's default thread pool when
+    None), so the event loop keeps running while *raw* blocks.  Calls are
+    serialised: a raw stream is not safe to use from two threads at once,
+    and a call whose awaiting task is cancelled still finishes in its
+    thread before the next one starts.
+    """
+
+    def __init__(self, raw, executor=None):
+        # Imported here, so that the synchronous streams do not pay for asyncio.
+        import asyncio
+
+        self.raw = raw
+        self._executor = executor
+        self._lock = asyncio.Lock()
+        self._running = None
+
+    async def _call(self, func, *args):
+        import asyncio
+
+        self._checkClosed()
+        async with self._lock:
+            if self._running is not None:
+                # Left behind by a cancelled caller: wait for it, then discard it.
+                await asyncio.wait((self._running,))
+                if not self._running.cancelled():
+                    self._running.exception()
+            loop = asyncio.get_running_loop()
+            self._running = future = loop.run_in_executor(self._executor, func, *args)
+            result = await asyncio.shield(future)
+            self._running = None
+            return result
+
+    def readable(self):
+        return self.raw.readable()
+
+    def writable(self):
+        return self.raw.writable()
+
+    async def read(self, size=-1):
+        return await self._call(self.raw.read, size)
+
+    async def readinto(self, b):
+        return await self._call(self.raw.readinto, b)
+
+    async def write(self, b):
+        return await self._call(self.raw.write, b)
+
+    async def readline(self, size=-1):
+        return await self._call(self.raw.readline, size)
+
+    async def readall(self):
+        return await self._call(self.raw.readall)
+
+    async def close(self):
+        if self.closed:
+            return
+        try:
+            await self._call(self.raw.close)
+        finally:
+            await super().close()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} raw={self.raw!r}>"
+
+
+class AsyncStreamIO(AbstractAsyncRawIO):
+    """
+    :class:`AbstractAsyncRawIO` over an asyncio ``StreamReader`` and/or
+    ``StreamWriter``, e.g. the pair returned by
+    :func:`asyncio.open_connection`.
+
+    :meth:`write` waits on ``drain()``, so a slow peer applies
+    back-pressure; :meth:`close` closes the writer and waits for it.
+    """
+
+    def __init__(self, reader=None, writer=None):
+        self.reader = reader
+        self.writer = writer
+
+    def readable(self):
+        return self.reader is not None
+
+    def writable(self):
+        return self.writer is not None
+
+    def _reader(self):
+        self._checkClosed()
+        if self.reader is None:
+            raise io.UnsupportedOperation("not readable")
+        return self.reader
+
+    async def read(self, size=-1):
+        return await self._reader().read(-1 if size is None else size)
+
+    async def readinto(self, b):
+        reader = self._reader()
+        with memoryview(b) as view, view.cast("B") as view:
+            data = await reader.read(len(view))
+            view[:len(data)] = data
+            return len(data)
+
+    async def readline(self, size=-1):
+        if size is None or size < 0:
+            return await self._reader().readline()
+        return await super().readline(size)
+
+    async def readall(self):
+        return await self._reader().read()
+
+    async def write(self, b):
+        self._checkClosed()
+        if self.writer is None:
+            raise io.UnsupportedOperation("not writable")
+        self.writer.write(b)
+        await self.writer.drain()
+        return memoryview(b).nbytes
+
+    async def close(self):
+        if self.closed:
+            return
+        try:
+            if self.writer is not None:
+                self.writer.close()
+                await self.writer.wait_closed()
+        finally:
+            await super().close()
@@ -0,0 +1,70 @@
+# """Type stubs for `more_abc.streams`."""
+
+import asyncio
+import io
+import os
+from concurrent.futures import Executor
+from typing import Iterable, Optional, Union
+from _typeshed import ReadableBuffer, WriteableBuffer
+
+from .abc_io import AbstractAsyncRawIO, AbstractBufferedIO, AbstractRawIO
+
+__all__ = ["MmapRawIO", "RingBufferedReader", "AsyncRawIOAdapter", "AsyncStreamIO"]
+
+
+class MmapRawIO(AbstractRawIO):
+    # """Raw binary file I/O served from a memory map."""
+    name: Union[str, bytes, os.PathLike, int]
+    mode: str
+    def __init__(
+        self,
+        file: Union[str, bytes, os.PathLike, int],
+        mode: str = ...,
+        closefd: bool = ...,
+        advice: Optional[int] = ...,
+    ) -> None: ...
+    def madvise(self, advice: int, start: int = ..., length: Optional[int] = ...) -> None: ...
+    def read(self, size: Optional[int] = ...) -> bytes: ...
+    def readall(self) -> bytes: ...
+    def readinto(self, b: WriteableBuffer) -> int: ...
+    def view(self, size: Optional[int] = ...) -> memoryview: ...
+    def write(self, b: ReadableBuffer) -> int: ...
+    def writev(self, buffers: Iterable[ReadableBuffer]) -> int: ...
+    def readv(self, buffers: Iterable[WriteableBuffer]) -> int: ...
+    def seek(self, offset: int, whence: int = ...) -> int: ...
+    def tell(self) -> int: ...
+    def truncate(self, size: Optional[int] = ...) -> int: ...
+    def fileno(self) -> int: ...
+
+
+class RingBufferedReader(AbstractBufferedIO):
+    # """Buffered reader over a raw stream, backed by a fixed ring buffer."""
+    raw: io.RawIOBase
+    capacity: int
+    def __init__(self, raw: io.RawIOBase, capacity: int = ..., prefetch: bool = ...) -> None: ...
+    def peek_view(self, size: Optional[int] = ...) -> memoryview: ...
+    def read1_view(self, size: Optional[int] = ...) -> memoryview: ...
+    def peek(self, size: int = ...) -> bytes: ...
+    def read(self, size: Optional[int] = ...) -> Optional[bytes]: ...  # type: ignore[override]
+    def read1(self, size: int = ...) -> bytes: ...
+    def readinto(self, b: WriteableBuffer) -> Optional[int]: ...  # type: ignore[override]
+    def readinto1(self, b: WriteableBuffer) -> Optional[int]: ...  # type: ignore[override]
+    def write(self, b: ReadableBuffer) -> int: ...
+    def fileno(self) -> int: ...
+
+
+class AsyncRawIOAdapter(AbstractAsyncRawIO):
+    # """AbstractAsyncRawIO over a blocking raw stream, run in a thread pool."""
+    raw: io.RawIOBase
+    def __init__(self, raw: io.RawIOBase, executor: Optional[Executor] = ...) -> None: ...
+
+
+class AsyncStreamIO(AbstractAsyncRawIO):
+    # """AbstractAsyncRawIO over an asyncio StreamReader and/or StreamWriter."""
+    reader: Optional[asyncio.StreamReader]
+    writer: Optional[asyncio.StreamWriter]
+    def __init__(
+        self,
+        reader: Optional[asyncio.StreamReader] = ...,
+        writer: Optional[asyncio.StreamWriter] = ...,
+    ) -> None: ...
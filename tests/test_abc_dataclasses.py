@@ -0,0 +1,214 @@
+import abc
+import copy
+import pickle
+import unittest
+import weakref
+from dataclasses import InitVar, field, fields
+
+from more_abc import RecordTable, abstractdataclass
+
+
+@abstractdataclass
+class Point:
+    x: float
+    y: float = 0.0
+    tags: list = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.x < 0:
+            raise ValueError("negative x")
+
+
+@abstractdataclass
+class Scaled:
+    x: float
+    factor: InitVar[float] = 1.0
+
+    def __post_init__(self, factor):
+        self.x *= factor
+
+
+@abstractdataclass(slots=True, frozen=True)
+class FrozenSlotted:
+    a: int
+    b: tuple = ()
+
+
+@abstractdataclass(slots=True)
+class WithHiddenDefault:
+    a: int
+    hidden: int = field(default=7, init=False)
+
+
+@abstractdataclass(slots=True)
+class InheritsHiddenDefault(WithHiddenDefault):
+    b: str = "b"
+
+
+class SlottedDataclassTest(unittest.TestCase):
+    def test_layout(self):
+        @abstractdataclass(slots=True)
+        class Plain:
+            a: int
+            b: float = 1.0
+
+        self.assertIsInstance(Plain, abc.ABCMeta)
+        self.assertEqual(Plain.__slots__, ("a", "b"))
+        self.assertFalse(hasattr(Plain(1), "__dict__"))
+        self.assertEqual(Plain(1), Plain(1, 1.0))
+        self.assertEqual(Plain.__qualname__,
+                         "SlottedDataclassTest.test_layout.<locals>.Plain")
+        with self.assertRaises(AttributeError):
+            Plain(1).c = 3
+
+    def test_abstract_methods_are_enforced(self):
+        @abstractdataclass(slots=True)
+        class Shape:
+            name: str
+
+            @abc.abstractmethod
+            def area(self): ...
+
+        @abstractdataclass(slots=True)
+        class Square(Shape):
+            side: float = 1.0
+
+            def area(self):
+                return self.side ** 2
+
+        with self.assertRaises(TypeError):
+            Shape("s")
+        self.assertEqual(Square("sq", 2.0).area(), 4.0)
+        self.assertEqual(Square.__slots__, ("side",))
+
+    def test_frozen_pickle_and_copy(self):
+        obj = FrozenSlotted(1, (2, 3))
+        self.assertEqual(pickle.loads(pickle.dumps(obj)), obj)
+        self.assertEqual(copy.deepcopy(obj), obj)
+        with self.assertRaises(Exception):
+            obj.a = 2
+
+    def test_init_false_default(self):
+        self.assertEqual(WithHiddenDefault(1).hidden, 7)
+        obj = InheritsHiddenDefault(1)
+        self.assertEqual((obj.a, obj.hidden, obj.b), (1, 7, "b"))
+        self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_weakref_slot(self):
+        @abstractdataclass(slots=True, weakref_slot=True)
+        class Ref:
+            a: int
+
+        obj = Ref(1)
+        self.assertIs(weakref.ref(obj)(), obj)
+        with self.assertRaises(TypeError):
+            abstractdataclass(weakref_slot=True)(type("X", (), {"__annotations__": {"a": int}}))
+
+    def test_field_order_matches_dataclass(self):
+        self.assertEqual([f.name for f in fields(InheritsHiddenDefault)], ["a", "hidden", "b"])
+
+
+class BulkConstructorTest(unittest.TestCase):
+    def test_post_init_false_skips_validation(self):
+        [point] = Point.from_tuples([(-1.0, 2.0)], post_init=False)
+        self.assertEqual((point.x, point.y, point.tags), (-1.0, 2.0, []))
+        with self.assertRaises(ValueError):
+            Point.from_tuples([(-1.0,)])
+
+    def test_initvar_runs_post_init(self):
+        self.assertEqual([p.x for p in Scaled.from_tuples([(2.0, 3.0)])], [6.0])
+        self.assertEqual([p.x for p in Scaled.from_dicts([{"x": 2.0}])], [2.0])
+
+    def test_initvar_rejects_post_init_false(self):
+        for build in (lambda: Scaled.from_tuples([(2.0, 3.0)], post_init=False),
+                      lambda: Scaled.from_dicts([{"x": 2.0}], post_init=False),
+                      lambda: Scaled.from_columns({"x": [2.0]}, post_init=False)):
+            with self.assertRaises(ValueError):
+                build()
+
+    def test_string_annotations(self):
+        class NotInitVar:
+            pass
+
+        @abstractdataclass
+        class Deferred:
+            x: "float"
+            factor: "InitVar[float]" = 1.0
+
+            def __post_init__(self, factor):
+                self.x *= factor
+
+        @abstractdataclass
+        class Lookalike:
+            x: "NotInitVar"
+            y: "list[NotInitVar]" = field(default_factory=list)
+
+            def __post_init__(self):
+                raise AssertionError("post_init=False was ignored")
+
+        with self.assertRaises(ValueError):
+            Deferred.from_tuples([(2.0, 3.0)], post_init=False)
+        [obj] = Lookalike.from_tuples([("a",)], post_init=False)
+        self.assertEqual((obj.x, obj.y), ("a", []))
+
+    def test_from_columns(self):
+        points = Point.from_columns({"x": [1.0, 2.0], "y": (3.0, 4.0)})
+        self.assertEqual([(p.x, p.y) for p in points], [(1.0, 3.0), (2.0, 4.0)])
+        points = Point.from_columns({"y": [3.0], "x": [1.0]})
+        self.assertEqual([(p.x, p.y) for p in points], [(1.0, 3.0)])
+        self.assertEqual(Point.from_columns({"x": []}), [])
+
+    def test_from_columns_without_columns(self):
+        self.assertEqual(Point.from_columns({}), [])
+        self.assertEqual(Point.from_columns({}, post_init=False), [])
+
+    def test_from_columns_rejects_ragged_columns(self):
+        for columns in ({"x": [1.0, 2.0], "y": [3.0]}, {"y": [3.0], "x": [1.0, 2.0]},
+                        {"x": [], "y": [1.0]}):
+            with self.subTest(columns=columns):
+                with self.assertRaisesRegex(ValueError, "same length"):
+                    Point.from_columns(columns)
+
+
+@abstractdataclass(frozen=True, order=True)
+class Frozen:
+    a: int
+    b: str
+
+
+@abstractdataclass(eq=False)
+class Identity:
+    a: int
+
+
+class RecordTableViewTest(unittest.TestCase):
+    def test_view_equals_record(self):
+        table = RecordTable(Point, [(1.0, 2.0, []), Point(3.0, 4.0, ["t"])])
+        self.assertEqual(table[1], Point(3.0, 4.0, ["t"]))
+        self.assertEqual(Point(3.0, 4.0, ["t"]), table[1])
+        self.assertNotEqual(table[0], table[1])
+        self.assertEqual(table[0], RecordTable(Point, [(1.0, 2.0, [])])[0])
+        self.assertEqual(repr(table[1]), repr(Point(3.0, 4.0, ["t"])))
+
+    def test_view_follows_writes(self):
+        table = RecordTable(Point, [(1.0, 2.0, [])])
+        view = table[0]
+        view.x = 5.0
+        self.assertEqual(view, Point(5.0, 2.0))
+        self.assertIsNone(type(view).__hash__)
+
+    def test_frozen_view_hash_and_order(self):
+        table = RecordTable(Frozen, [(1, "a"), (2, "b")])
+        self.assertEqual(hash(table[0]), hash(Frozen(1, "a")))
+        self.assertIn(table[1], {Frozen(2, "b")})
+        self.assertLess(table[0], table[1])
+        self.assertLess(table[0], Frozen(2, "a"))
+
+    def test_identity_record_keeps_identity_semantics(self):
+        table = RecordTable(Identity, [(1,)])
+        self.assertNotEqual(table[0], Identity(1))
+        hash(table[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,388 @@
+import fcntl
+import io
+import os
+import tempfile
+import unittest
+from array import array
+
+from more_abc import AbstractBufferedIO, AbstractRawIO, AbstractTextIO
+from more_abc.abc_io import _IOV_MAX
+
+
+def parts(n, seed=1):
+    """*n* buffers of assorted types and sizes (some empty), and their bytes."""
+    buffers = []
+    for i in range(n):
+        size = (i * seed * 7919) % 23
+        data = bytes((i + j) % 256 for j in range(size))
+        kind = i % 4
+        if kind == 0:
+            buffers.append(data)
+        elif kind == 1:
+            buffers.append(bytearray(data))
+        elif kind == 2:
+            buffers.append(memoryview(data))
+        else:
+            buffers.append(array("B", data))
+    return buffers, b"".join(map(bytes, buffers))
+
+
+class LimitedRaw(AbstractRawIO):
+    """A raw stream without a descriptor that moves at most *limit* bytes per call.
+
+    After *budget* bytes have been written, writes report that they would block.
+    """
+
+    def __init__(self, data=b"", limit=7, budget=None):
+        self.data = bytearray(data)
+        self.pos = 0
+        self.limit = limit
+        self.budget = budget
+        self.calls = 0
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return True
+
+    def read(self, size=-1):
+        raise io.UnsupportedOperation("use readinto")
+
+    def readinto(self, b):
+        self.calls += 1
+        with memoryview(b).cast("B") as view:
+            n = min(self.limit, view.nbytes, len(self.data) - self.pos)
+            view[:n] = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+    def write(self, b):
+        self.calls += 1
+        with memoryview(b) as view:
+            n = min(self.limit, view.nbytes)
+            if self.budget is not None:
+                if not self.budget:
+                    return None
+                n = min(n, self.budget)
+                self.budget -= n
+            self.data += view[:n]
+            return n
+
+
+class FdRaw(AbstractRawIO):
+    """A raw stream over a file descriptor, so that readv/writev use os.readv/os.writev."""
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    def fileno(self):
+        return self.fd
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return True
+
+    def read(self, size=-1):
+        return os.read(self.fd, size)
+
+    def readinto(self, b):
+        return os.readv(self.fd, [b])
+
+    def write(self, b):
+        return os.write(self.fd, b)
+
+
+class VectoredRawIOTest(unittest.TestCase):
+    def test_writev_resumes_short_writes(self):
+        buffers, expected = parts(200)
+        for limit in (1, 5, 64, 1 << 20):
+            with self.subTest(limit=limit):
+                raw = LimitedRaw(limit=limit)
+                self.assertEqual(raw.writev(buffers), len(expected))
+                self.assertEqual(bytes(raw.data), expected)
+        self.assertEqual(LimitedRaw().writev([]), 0)
+        self.assertEqual(LimitedRaw().writev(iter([b"ab", b"", b"c"])), 3)
+
+    def test_writev_stops_when_it_would_block(self):
+        buffers, expected = parts(50)
+        raw = LimitedRaw(limit=5, budget=33)
+        self.assertEqual(raw.writev(buffers), 33)
+        self.assertEqual(bytes(raw.data), expected[:33])
+        self.assertIsNone(LimitedRaw(budget=0).writev([b"abc"]))
+
+    def test_readv_resumes_short_reads(self):
+        data = bytes(range(256)) * 3
+        for limit in (1, 5, 1 << 20):
+            with self.subTest(limit=limit):
+                raw = LimitedRaw(data, limit=limit)
+                bufs = [bytearray(10), bytearray(0), array("H", [0] * 50), bytearray(1000)]
+                self.assertEqual(raw.readv(bufs), len(data))
+                self.assertEqual(b"".join(map(bytes, bufs))[:len(data)], data)
+                self.assertEqual(raw.readv([bytearray(4)]), 0)
+
+    def test_vectored_calls_on_a_file(self):
+        buffers, expected = parts(3 * _IOV_MAX + 5)
+        fd, path = tempfile.mkstemp()
+        self.addCleanup(os.remove, path)
+        with FdRaw(fd) as raw:
+            self.assertEqual(raw.writev(buffers), len(expected))
+            os.lseek(fd, 0, os.SEEK_SET)
+            sizes = [len(bytes(b)) for b in buffers] + [100]
+            bufs = [bytearray(size) for size in sizes]
+            self.assertEqual(raw.readv(bufs), len(expected))
+            self.assertEqual(b"".join(bufs), expected + bytes(100))
+            os.close(fd)
+
+    def test_writev_on_a_full_non_blocking_pipe(self):
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+        self.addCleanup(os.close, w)
+        fcntl.fcntl(w, fcntl.F_SETFL, fcntl.fcntl(w, fcntl.F_GETFL) | os.O_NONBLOCK)
+        chunk = bytes(range(256)) * 64
+        buffers = [chunk[:1000], chunk, memoryview(chunk)[3:]] * 40
+        expected = b"".join(buffers)
+        raw = FdRaw(w)
+        written = raw.writev(buffers)
+        self.assertLess(written, len(expected))
+        received = bytearray()
+        while len(received) < written:
+            received += os.read(r, 1 << 16)
+        self.assertEqual(bytes(received), expected[:written])
+        # With the pipe full, nothing can be written at all.
+        while True:
+            try:
+                os.write(w, chunk)
+            except BlockingIOError:
+                break
+        self.assertIsNone(raw.writev([b"abc", b"def"]))
+
+    def test_closed_stream_raises(self):
+        raw = LimitedRaw()
+        raw.close()
+        with self.assertRaises(ValueError):
+            raw.writev([b"x"])
+        with self.assertRaises(ValueError):
+            raw.readv([bytearray(1)])
+
+
+class Buffered(AbstractBufferedIO):
+    """A minimal write-only buffered writer over *raw*."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.pending = bytearray()
+        self.writes = 0
+
+    def writable(self):
+        return True
+
+    def read(self, size=None):
+        raise io.UnsupportedOperation("read")
+
+    def read1(self, size=-1):
+        raise io.UnsupportedOperation("read")
+
+    def write(self, b):
+        self.writes += 1
+        with memoryview(b) as view:
+            self.pending += view
+            return view.nbytes
+
+    def flush(self):
+        while self.pending:
+            n = self.raw.write(self.pending)
+            del self.pending[:n]
+
+
+class VectoredBufferedIOTest(unittest.TestCase):
+    def test_small_batches_go_through_write(self):
+        raw = LimitedRaw(limit=3)
+        f = Buffered(raw)
+        buffers, expected = parts(20)
+        self.assertEqual(f.writev(buffers), len(expected))
+        self.assertEqual(raw.calls, 0)
+        f.flush()
+        self.assertEqual(bytes(raw.data), expected)
+
+    def test_large_batches_flush_then_bypass_the_buffer(self):
+        raw = LimitedRaw(limit=1000)
+        f = Buffered(raw)
+        f.write(b"head:")
+        big = [bytes([i]) * 3000 for i in range(10)]
+        self.assertEqual(f.writev(big), 30000)
+        self.assertEqual(f.writes, 1)
+        self.assertEqual(bytes(raw.data), b"head:" + b"".join(big))
+
+    def test_large_batch_that_would_block(self):
+        f = Buffered(LimitedRaw(limit=1000, budget=5000))
+        with self.assertRaises(BlockingIOError) as cm:
+            f.writev([b"x" * 20000])
+        self.assertEqual(cm.exception.characters_written, 5000)
+
+    def test_readv_through_readinto(self):
+        class Reader(AbstractBufferedIO):
+            def __init__(self, data):
+                self.source = io.BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def read(self, size=None):
+                return self.source.read(size)
+
+            def read1(self, size=-1):
+                return self.source.read1(size)
+
+            def write(self, b):
+                raise io.UnsupportedOperation("write")
+
+        bufs = [bytearray(3), bytearray(0), bytearray(5)]
+        self.assertEqual(Reader(b"abcdefg").readv(bufs), 7)
+        self.assertEqual(bufs, [b"abc", b"", b"defg\0"])
+
+
+class DecodingText(AbstractTextIO):
+    """A read-only text stream over a binary *buffer*, like io.TextIOWrapper."""
+
+    def __init__(self, data, encoding="utf-8", errors=None):
+        self.buffer = io.BytesIO(data)
+        self._encoding = encoding
+        self._errors = errors
+
+    @property
+    def encoding(self):
+        return self._encoding
+
+    @property
+    def errors(self):
+        return self._errors
+
+    def readable(self):
+        return True
+
+    def read(self, size=None):
+        raise AssertionError("the batched readers should decode from buffer")
+
+    def readline(self, size=-1):
+        raise AssertionError("the batched readers should not call readline()")
+
+    def write(self, s):
+        raise io.UnsupportedOperation("write")
+
+
+class PlainText(AbstractTextIO):
+    """A text stream with no buffer, so the batched readers fall back to read()."""
+
+    def __init__(self, text):
+        self.source = io.StringIO(text, newline="")
+        self.sizes = []
+
+    def readable(self):
+        return True
+
+    def read(self, size=None):
+        self.sizes.append(size)
+        return self.source.read(size)
+
+    def readline(self, size=-1):
+        raise AssertionError("the batched readers should not call readline()")
+
+    def write(self, s):
+        raise io.UnsupportedOperation("write")
+
+
+class BatchedLinesTest(unittest.TestCase):
+    # Multibyte characters of every UTF-8 length, CRLF, lone CR and blank lines.
+    text = ("h\u00e9llo w\u00f6rld\r\n\u20ac\u20ac\u20ac\n\n\U0001f600 emoji\r\n"
+            "lone\rcr\n" + "x" * 40 + "\r\n\u00e9\r\n\r\n\u0394\u00e9\U0001f600") * 3
+
+    def flatten(self, batches):
+        batches = list(batches)
+        for batch in batches:
+            self.assertTrue(batch)
+        return [line for batch in batches for line in batch]
+
+    def test_decoded_chunks_match_text_io_wrapper(self):
+        data = self.text.encode("utf-8")
+        expected = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").readlines()
+        self.assertIn("lone\n", expected)
+        # Every chunk size up to the length of the longest line and some beyond
+        # splits multibyte characters and "\r\n" pairs at every offset.
+        for chunk_size in list(range(1, 50)) + [len(data) - 1, len(data), 1 << 18]:
+            with self.subTest(chunk_size=chunk_size):
+                f = DecodingText(data)
+                chunks = list(f.readlines_chunked(chunk_size))
+                self.assertEqual(self.flatten(chunks), expected)
+                for line in self.flatten(chunks)[:-1]:
+                    self.assertTrue(line.endswith("\n"))
+                f = DecodingText(data)
+                self.assertEqual(self.flatten(f.iter_lines_batched(3, chunk_size)), expected)
+
+    def test_other_encodings(self):
+        for encoding in ("utf-16", "utf-16-le", "utf-32", "utf-8-sig", "gb18030"):
+            data = self.text.encode(encoding)
+            expected = io.TextIOWrapper(io.BytesIO(data), encoding=encoding).readlines()
+            for chunk_size in (1, 3, 7, 1 << 18):
+                with self.subTest(encoding=encoding, chunk_size=chunk_size):
+                    f = DecodingText(data, encoding)
+                    self.assertEqual(self.flatten(f.readlines_chunked(chunk_size)), expected)
+
+    def test_decode_errors(self):
+        data = "caf\u00e9\n".encode("utf-8")[:-2] + b"\n"
+        with self.assertRaises(UnicodeDecodeError):
+            list(DecodingText(data).readlines_chunked(2))
+        lines = self.flatten(DecodingText(data, errors="replace").readlines_chunked(2))
+        self.assertEqual(lines, ["caf\ufffd\n"])
+
+    def test_read_fallback(self):
+        text = self.text.replace("\r", "")
+        expected = io.StringIO(text, newline="").readlines()
+        for chunk_size in (1, 2, 5, 17, len(text), 1 << 18):
+            with self.subTest(chunk_size=chunk_size):
+                f = PlainText(text)
+                self.assertEqual(self.flatten(f.readlines_chunked(chunk_size)), expected)
+                self.assertEqual(set(f.sizes), {chunk_size})
+                f = PlainText(text)
+                self.assertEqual(self.flatten(f.iter_lines_batched(4, chunk_size)), expected)
+
+    def test_read_fallback_splits_on_newlines_only(self):
+        text = "a\rb\x0cc\u2028d\ne\x1cf\n\u0085g"
+        self.assertEqual(self.flatten(PlainText(text).readlines_chunked(3)),
+                         ["a\rb\x0cc\u2028d\n", "e\x1cf\n", "\u0085g"])
+
+    def test_missing_final_newline_and_empty_stream(self):
+        for text in ("last", "a\nlast", "a\nb\n"):
+            with self.subTest(text=text):
+                expected = io.StringIO(text).readlines()
+                self.assertEqual(self.flatten(PlainText(text).readlines_chunked(2)), expected)
+                lines = self.flatten(DecodingText(text.encode()).readlines_chunked(2))
+                self.assertEqual(lines, expected)
+        self.assertEqual(list(PlainText("").readlines_chunked()), [])
+        self.assertEqual(list(DecodingText(b"").iter_lines_batched()), [])
+
+    def test_batch_sizes(self):
+        text = "".join(f"line {i}\n" for i in range(103))
+        expected = io.StringIO(text).readlines()
+        for batch_size in (1, 7, 100, 103, 1000):
+            for chunk_size in (5, 64, 1 << 18):
+                with self.subTest(batch_size=batch_size, chunk_size=chunk_size):
+                    batches = list(PlainText(text).iter_lines_batched(batch_size, chunk_size))
+                    self.assertEqual(self.flatten(batches), expected)
+                    self.assertTrue(all(len(b) == batch_size for b in batches[:-1]))
+                    self.assertLessEqual(len(batches[-1]), batch_size)
+        for batch_size in (0, -1):
+            with self.assertRaises(ValueError):
+                next(PlainText(text).iter_lines_batched(batch_size))
+
+    def test_closed_stream_raises(self):
+        f = PlainText("a\n")
+        f.close()
+        with self.assertRaises(ValueError):
+            next(f.readlines_chunked())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,277 @@
+import io
+import json
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from more_abc import AbstractJSONDecoder, AbstractJSONEncoder, AbstractRawIO
+
+
+class Encoder(AbstractJSONEncoder):
+    def default(self, o):
+        if isinstance(o, complex):
+            return [o.real, o.imag]
+        return json.JSONEncoder.default(self, o)
+
+    def encode(self, o):
+        return json.JSONEncoder.encode(self, o)
+
+    def iterencode(self, o, _one_shot=False):
+        return json.JSONEncoder.iterencode(self, o, _one_shot)
+
+
+class ShortWriteRaw(AbstractRawIO):
+    """A raw stream that accepts at most *limit* bytes per write."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def read(self, size=-1):
+        raise io.UnsupportedOperation("read")
+
+    def readinto(self, b):
+        raise io.UnsupportedOperation("read")
+
+    def write(self, b):
+        with memoryview(b) as view:
+            n = min(self.limit, view.nbytes)
+            self.data += view[:n]
+            return n
+
+
+class Decoder(AbstractJSONDecoder):
+    def decode(self, s):
+        return json.JSONDecoder.decode(self, s)
+
+    def raw_decode(self, s, idx=0):
+        return json.JSONDecoder.raw_decode(self, s, idx)
+
+
+class CountingReader(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.consumed = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.consumed += len(data)
+        return data
+
+
+class NonBlockingRaw(AbstractRawIO):
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        return None
+
+    def readinto(self, b):
+        return None
+
+    def write(self, b):
+        raise io.UnsupportedOperation("write")
+
+
+def ndjson(docs):
+    return "".join(json.dumps(doc) + "\n" for doc in docs)
+
+
+def sample():
+    big_list = [{"i": i, "z": complex(i, -i), "s": "ünï\u2603" * (i % 3)} for i in range(700)]
+    big_dict = {f"k{i:04d}": [i, float(i) / 3, None, True] for i in range(600)}
+    return {
+        "zeta": "last?",
+        "alpha": big_list,
+        "nested": {"dict": big_dict, "tuple": tuple(range(300)), "empty": [], "e": {}},
+        "1": [[], [[]], {"a": {"b": {"c": [1, 2, 3]}}}],
+        "scalars": [0, -1, 1.5e300, float("inf"), "\n\t\"", "😀"],
+        "list of lists": [list(range(i)) for i in range(400)],
+    }
+
+
+class DumpToTest(unittest.TestCase):
+    options = [
+        {},
+        {"sort_keys": True},
+        {"ensure_ascii": False},
+        {"separators": (",", ":")},
+        {"indent": 2},
+        {"indent": "\t", "sort_keys": True, "ensure_ascii": False},
+    ]
+
+    def dump(self, obj, stream, chunk_size=1 << 16, **options):
+        return Encoder(**options).dump_to(obj, stream, chunk_size=chunk_size)
+
+    def test_matches_dumps(self):
+        obj = sample()
+        for options in self.options:
+            expected = json.dumps(obj, cls=Encoder, **options)
+            for chunk_size in (1, 100, 1 << 16):
+                with self.subTest(options=options, chunk_size=chunk_size):
+                    text = io.StringIO()
+                    self.assertEqual(self.dump(obj, text, chunk_size, **options), len(expected))
+                    self.assertEqual(text.getvalue(), expected)
+                    binary = io.BytesIO()
+                    written = self.dump(obj, binary, chunk_size, **options)
+                    self.assertEqual(binary.getvalue(), expected.encode())
+                    self.assertEqual(written, len(expected.encode()))
+
+    def test_top_level_scalars_and_small_containers(self):
+        for obj in (None, 3, "x", [], {}, [1, [2, [3]]], {"a": {"b": []}}, complex(1, 2)):
+            with self.subTest(obj=obj):
+                text = io.StringIO()
+                self.dump(obj, text)
+                self.assertEqual(text.getvalue(), json.dumps(obj, cls=Encoder))
+
+    def test_skipkeys(self):
+        obj = {"a": 1, (1, 2): "dropped", "b": {(3,): 4, "c": 5}}
+        obj["big"] = {**{f"k{i}": i for i in range(300)}, (5,): "dropped"}
+        text = io.StringIO()
+        self.dump(obj, text, skipkeys=True)
+        self.assertEqual(text.getvalue(), json.dumps(obj, cls=Encoder, skipkeys=True))
+        with self.assertRaises(TypeError):
+            self.dump(obj, io.StringIO())
+
+    def test_circular_references(self):
+        loop = [1, 2]
+        loop.append(loop)
+        deep = {"big": [{"i": i} for i in range(300)]}
+        deep["big"].append(deep)
+        for obj in (loop, deep):
+            with self.subTest(obj=type(obj).__name__):
+                with self.assertRaises(ValueError) as expected:
+                    json.dumps(obj, cls=Encoder)
+                with self.assertRaises(ValueError) as got:
+                    self.dump(obj, io.StringIO())
+                self.assertEqual(str(got.exception), str(expected.exception))
+
+    def test_shared_values_are_not_circular(self):
+        shared = list(range(300))
+        obj = [shared, shared, {"a": shared}]
+        text = io.StringIO()
+        self.dump(obj, text)
+        self.assertEqual(text.getvalue(), json.dumps(obj, cls=Encoder))
+
+    def test_short_writes_on_raw_stream(self):
+        obj = sample()
+        raw = ShortWriteRaw(7)
+        written = self.dump(obj, raw, chunk_size=1000)
+        expected = json.dumps(obj, cls=Encoder).encode()
+        self.assertEqual(bytes(raw.data), expected)
+        self.assertEqual(written, len(expected))
+
+    def test_whole_document_iterencode_override_needs_indent(self):
+        class Prefixed(Encoder):
+            def iterencode(self, o, _one_shot=False):
+                if not _one_shot:
+                    yield ")]}'\n"
+                yield from json.JSONEncoder.iterencode(self, o, _one_shot)
+
+        text = io.StringIO()
+        Prefixed(indent=1).dump_to([1, 2], text)
+        self.assertEqual(text.getvalue(), ")]}'\n" + json.dumps([1, 2], indent=1))
+        text = io.StringIO()
+        Prefixed().dump_to([1, 2], text)
+        self.assertEqual(text.getvalue(), "[1, 2]")
+
+    def test_other_encodings(self):
+        obj = {"s": "ünï😀" * 100}
+        binary = io.BytesIO()
+        Encoder(ensure_ascii=False).dump_to(obj, binary, chunk_size=3, encoding="utf-16")
+        self.assertEqual(binary.getvalue().decode("utf-16"),
+                         json.dumps(obj, ensure_ascii=False))
+
+
+class IterDecodeTest(unittest.TestCase):
+    docs = [{"id": i, "name": f"user {i}", "score": i * -1.5e10, "tags": ["a b", "é"]}
+            for i in range(200)]
+
+    def test_round_trip(self):
+        text = ndjson(self.docs)
+        for chunk_size in (1, 2, 3, 7, 64, 1 << 20):
+            with self.subTest(chunk_size=chunk_size):
+                got = list(Decoder().iter_decode(io.BytesIO(text.encode()), chunk_size))
+                self.assertEqual(got, self.docs)
+                self.assertEqual(list(Decoder().iter_decode(io.StringIO(text), chunk_size)),
+                                 self.docs)
+
+    def expected_error(self, text, start):
+        with self.assertRaises(json.JSONDecodeError) as cm:
+            json.JSONDecoder().raw_decode(text, start)
+        return cm.exception
+
+    def test_malformed_line_raises_at_once_with_stream_position(self):
+        lines = ndjson(self.docs).splitlines(True)
+        bad = '{"id": 1,, "name": "x"}\n'
+        text = "".join(lines[:50]) + "  " + bad + "".join(lines[50:]) * 50
+        expected = self.expected_error(text, len("".join(lines[:50])) + 2)
+        stream = CountingReader(text.encode())
+        decoded = []
+        with self.assertRaises(json.JSONDecodeError) as cm:
+            for doc in Decoder().iter_decode(stream, chunk_size=4096):
+                decoded.append(doc)
+        err = cm.exception
+        self.assertEqual(decoded, self.docs[:50])
+        self.assertEqual((err.pos, err.lineno, err.colno), (expected.pos, expected.lineno,
+                                                            expected.colno))
+        self.assertEqual(str(err), str(expected))
+        self.assertLess(stream.consumed, 3 * 4096)
+
+    def test_malformed_line_with_executor(self):
+        lines = ndjson(self.docs).splitlines(True)
+        text = "".join(lines[:120]) + '{"id": tru}\n' + "".join(lines[120:])
+        expected = self.expected_error(text, len("".join(lines[:120])))
+        for executor in (ThreadPoolExecutor(2), ProcessPoolExecutor(2)):
+            with executor, self.subTest(executor=type(executor).__name__):
+                decoded = []
+                with self.assertRaises(json.JSONDecodeError) as cm:
+                    for doc in Decoder().iter_decode(io.BytesIO(text.encode()), 1000,
+                                                     executor=executor):
+                        decoded.append(doc)
+                self.assertEqual(decoded, self.docs[:120])
+                self.assertEqual(str(cm.exception), str(expected))
+                self.assertEqual(cm.exception.pos, expected.pos)
+
+    def test_concatenated_documents_split_anywhere(self):
+        docs = [12, 345, -6.5e3, "a b", "é😀", True, False, None, [], {}, [1, [2, "x"]],
+                {"k": "v w", "n": {"m": [1e-7]}}, 7]
+        texts = [
+            " ".join(json.dumps(doc) for doc in docs),
+            "".join(json.dumps(doc, separators=(",", ":")) + "\r\n" for doc in docs),
+            "\n\t " + "  \n\n".join(json.dumps(doc, indent=2) for doc in docs) + " \n",
+            "".join(json.dumps(doc) if isinstance(doc, (list, dict, str)) else f" {json.dumps(doc)} "
+                    for doc in docs),
+        ]
+        for text in texts:
+            for chunk_size in (1, 2, 3, 5, 8, 13, 1 << 20):
+                with self.subTest(text=text[:30], chunk_size=chunk_size):
+                    self.assertEqual(list(Decoder().iter_decode(io.StringIO(text), chunk_size)),
+                                     docs)
+                    data = text.encode("utf-8")
+                    self.assertEqual(list(Decoder().iter_decode(io.BytesIO(data), chunk_size)),
+                                     docs)
+
+    def test_other_encoding(self):
+        text = '{"s": "ünï😀"} ["é"]\n"x"'
+        got = Decoder().iter_decode(io.BytesIO(text.encode("utf-16")), 3, encoding="utf-16")
+        self.assertEqual(list(got), [{"s": "ünï😀"}, ["é"], "x"])
+
+    def test_empty_and_blank_streams(self):
+        for text in ("", " ", "\n\n\t"):
+            with self.subTest(text=text):
+                self.assertEqual(list(Decoder().iter_decode(io.StringIO(text), 2)), [])
+
+    def test_truncated_document_at_end_of_stream(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(Decoder().iter_decode(io.StringIO('{"a": 1}\n{"b": "x y'), chunk_size=4))
+
+    def test_non_blocking_stream_raises(self):
+        with self.assertRaises(BlockingIOError):
+            list(Decoder().iter_decode(NonBlockingRaw()))
+
+
+if __name__ == "__main__":
+    unittest.main()
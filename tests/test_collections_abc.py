@@ -0,0 +1,539 @@
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from abc import ABCMeta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from more_abc import (F, ArrayContainer, FastABCMeta, Filterable, IndexedFilterable,
+                      LazyPipeline, PersistentVector, PickleCodec, Sortable, SortableMixin,
+                      SortedList, Transformable, async_filter, async_map, external_sort,
+                      parallel_map, structural_hook)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WINDOW = 2 * (os.cpu_count() or 1)
+
+
+def square(x):
+    return x * x
+
+
+def tagged_square(x):
+    return os.getpid(), x * x
+
+
+def fail_on_three(x):
+    if x == 3:
+        raise ValueError("three")
+    return x
+
+
+def sleepy(x):
+    time.sleep(0.001 * (x % 4))
+    return x
+
+
+class CountingExecutor:
+    """Forward to *inner*, counting the submitted tasks."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        return self.inner.submit(fn, *args)
+
+
+class Bag(Filterable, Transformable):
+    """A list-backed container without ``__collect__`` that logs its calls."""
+
+    def __init__(self, items=(), calls=None):
+        self.items = list(items)
+        self.calls = [] if calls is None else calls
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __filter__(self, predicate):
+        self.calls.append("__filter__")
+        return Bag(filter(predicate, self.items), self.calls)
+
+    def reject(self, predicate):
+        self.calls.append("reject")
+        return super().reject(predicate)
+
+    def __transform__(self, func):
+        self.calls.append("__transform__")
+        return Bag(map(func, self.items), self.calls)
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+def is_big(x):
+    return x > 10
+
+
+def triple(x):
+    return 3 * x
+
+
+class RecordingCodec(PickleCodec):
+    """A PickleCodec that remembers the files it wrote runs to."""
+
+    def __init__(self, fail_on_load=False):
+        super().__init__(batch_size=3)
+        self.files = []
+        self.fail_on_load = fail_on_load
+
+    def dump(self, items, fp):
+        self.files.append(fp)
+        super().dump(items, fp)
+
+    def load(self, fp):
+        if self.fail_on_load:
+            raise OSError("run lost")
+        return super().load(fp)
+
+
+class Box(Sortable):
+    def __init__(self, items):
+        self.items = list(items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __sort__(self, reverse=False):
+        self.items.sort(reverse=reverse)
+
+    def __copy__(self):
+        return Box(self.items)
+
+
+class StructuralHookTest(unittest.TestCase):
+    def test_mutation_is_seen_after_invalidate(self):
+        class C:
+            pass
+
+        self.assertFalse(isinstance(C(), Sortable))
+        C.__sort__ = lambda self, reverse=False: None
+        Sortable.__subclasshook__.invalidate()
+        self.assertTrue(isinstance(C(), Sortable))
+        self.assertTrue(issubclass(C, Sortable))
+
+        C.__sort__ = None
+        Sortable.__subclasshook__.invalidate()
+        self.assertFalse(issubclass(C, Sortable))
+
+    def test_invalidate_on_fast_abc(self):
+        class Queryable(metaclass=FastABCMeta):
+            __subclasshook__ = structural_hook("query")
+
+        class C:
+            pass
+
+        self.assertFalse(issubclass(C, Queryable))
+        C.query = lambda self: None
+        Queryable.__subclasshook__.invalidate()
+        self.assertTrue(issubclass(C, Queryable))
+
+    def test_registered_subclass_survives_invalidate(self):
+        class Queryable(metaclass=ABCMeta):
+            __subclasshook__ = structural_hook("query")
+
+        class C:
+            pass
+
+        Queryable.register(C)
+        Queryable.__subclasshook__.invalidate()
+        self.assertTrue(issubclass(C, Queryable))
+
+
+class SortableTest(unittest.TestCase):
+    def test_copy_is_declared_abstract(self):
+        class NoCopy(Sortable):
+            def __sort__(self, reverse=False):
+                pass
+
+        self.assertTrue(getattr(SortableMixin.__copy__, "__isabstractmethod__", False))
+        with self.assertRaises(NotImplementedError):
+            NoCopy().sorted()
+
+    def test_sorted_uses_copy(self):
+        box = Box([3, 1, 2])
+        self.assertEqual(box.sorted().items, [1, 2, 3])
+        self.assertEqual(box.items, [3, 1, 2])
+        self.assertEqual(box.nsmallest(2), [1, 2])
+
+
+class ExternalSortTest(unittest.TestCase):
+    def records(self, n, seed=0):
+        rng = random.Random(seed)
+        return [(rng.randrange(10), i) for i in range(n)]
+
+    def test_matches_sorted_and_is_stable(self):
+        items = self.records(500)
+        for reverse in (False, True):
+            for run_size, fan_in in ((7, 64), (7, 2), (10, 3), (500, 64), (1000, 64)):
+                with self.subTest(reverse=reverse, run_size=run_size, fan_in=fan_in):
+                    got = list(Box(items).iter_sorted(key=lambda r: r[0], reverse=reverse,
+                                                      external=True, run_size=run_size,
+                                                      fan_in=fan_in))
+                    self.assertEqual(got, sorted(items, key=lambda r: r[0], reverse=reverse))
+
+    def test_runs_are_spilled_and_merged(self):
+        codec = RecordingCodec()
+        got = list(external_sort(range(95, 0, -1), run_size=10, codec=codec, fan_in=3))
+        self.assertEqual(got, list(range(1, 96)))
+        # Ten runs merged three at a time (the tenth is carried over) give four
+        # runs, and those give two more (the fourth is carried over again).
+        self.assertEqual(len(codec.files), 10 + 3 + 1)
+        self.assertTrue(all(fp.closed for fp in codec.files))
+
+    def test_single_run_stays_in_memory(self):
+        codec = RecordingCodec()
+        self.assertEqual(list(external_sort([3, 1, 2], run_size=10, codec=codec)), [1, 2, 3])
+        self.assertEqual(codec.files, [])
+        self.assertEqual(list(external_sort([], codec=codec)), [])
+
+    def test_files_are_closed_when_the_consumer_stops(self):
+        codec = RecordingCodec()
+        it = external_sort(range(100), run_size=10, codec=codec)
+        self.assertEqual(next(it), 0)
+        it.close()
+        self.assertEqual(len(codec.files), 10)
+        self.assertTrue(all(fp.closed for fp in codec.files))
+
+    def test_files_are_closed_on_errors(self):
+        def items():
+            yield from range(25)
+            raise RuntimeError("source failed")
+
+        codec = RecordingCodec()
+        with self.assertRaisesRegex(RuntimeError, "source failed"):
+            list(external_sort(items(), run_size=10, codec=codec))
+        self.assertEqual(len(codec.files), 2)
+        self.assertTrue(all(fp.closed for fp in codec.files))
+
+        codec = RecordingCodec(fail_on_load=True)
+        with self.assertRaisesRegex(OSError, "run lost"):
+            list(external_sort(range(30), run_size=10, codec=codec))
+        self.assertTrue(all(fp.closed for fp in codec.files))
+
+        def bad_key(x):
+            if x == 17:
+                raise ValueError("bad key")
+            return x
+
+        codec = RecordingCodec()
+        with self.assertRaisesRegex(ValueError, "bad key"):
+            list(external_sort(range(30), key=bad_key, run_size=10, codec=codec))
+        self.assertEqual(len(codec.files), 1)
+        self.assertTrue(all(fp.closed for fp in codec.files))
+
+    def test_tmpdir_is_left_empty(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            it = external_sort(range(50, 0, -1), run_size=10, tmpdir=tmpdir)
+            self.assertEqual(next(it), 1)
+            it.close()
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            external_sort([], run_size=0)
+        with self.assertRaises(ValueError):
+            external_sort([], fan_in=1)
+
+    def test_pickle_is_imported_lazily(self):
+        code = "import sys, more_abc.collections_abc; print('pickle' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH=ROOT),
+                             check=True, capture_output=True, text=True).stdout
+        self.assertEqual(out.strip(), "False")
+
+
+class ParallelMapTest(unittest.TestCase):
+    def test_without_executor_is_map(self):
+        self.assertEqual(list(parallel_map(square, range(5))), [0, 1, 4, 9, 16])
+
+    def test_ordered_results(self):
+        with ThreadPoolExecutor(4) as pool:
+            out = list(parallel_map(sleepy, range(40), pool, chunksize=3))
+        self.assertEqual(out, list(range(40)))
+
+    def test_unordered_results(self):
+        with ThreadPoolExecutor(4) as pool:
+            out = list(parallel_map(sleepy, range(40), pool, chunksize=3, ordered=False))
+        self.assertEqual(sorted(out), list(range(40)))
+
+    def test_one_task_per_chunk(self):
+        with ThreadPoolExecutor(2) as pool:
+            counting = CountingExecutor(pool)
+            self.assertEqual(list(parallel_map(square, range(10), counting, chunksize=3)),
+                             [x * x for x in range(10)])
+        self.assertEqual(counting.submitted, 4)
+
+    def test_process_pool_chunks(self):
+        with ProcessPoolExecutor(2) as pool:
+            out = list(parallel_map(tagged_square, range(20), pool, chunksize=5))
+        self.assertEqual([value for _, value in out], [x * x for x in range(20)])
+        for start in range(0, 20, 5):
+            self.assertEqual(len({pid for pid, _ in out[start:start + 5]}), 1)
+
+    def test_input_is_read_lazily(self):
+        consumed = []
+
+        def source():
+            for x in range(10_000):
+                consumed.append(x)
+                yield x
+
+        with ThreadPoolExecutor(2) as pool:
+            results = parallel_map(square, source(), pool, chunksize=10)
+            self.assertEqual(next(results), 0)
+            self.assertLessEqual(len(consumed), (WINDOW + 1) * 10)
+            results.close()
+
+    def test_errors_propagate_and_stop_submitting(self):
+        with ThreadPoolExecutor(2) as pool:
+            counting = CountingExecutor(pool)
+            with self.assertRaisesRegex(ValueError, "three"):
+                list(parallel_map(fail_on_three, range(10_000), counting, chunksize=1))
+        self.assertLess(counting.submitted, 10_000)
+
+    def test_map_with_executor(self):
+        with ProcessPoolExecutor(2) as pool:
+            self.assertEqual(list(PersistentVector(range(50)).map(square, executor=pool,
+                                                                  chunksize=7)),
+                             [x * x for x in range(50)])
+            self.assertEqual(list(SortedList([3, -1, 2]).map(square, executor=pool)), [1, 4, 9])
+            with self.assertRaisesRegex(ValueError, "three"):
+                SortedList(range(10)).map(fail_on_three, executor=pool, chunksize=2)
+
+    def test_map_unordered_into_sorted_list(self):
+        with ThreadPoolExecutor(4) as pool:
+            out = SortedList(range(30)).map(sleepy, executor=pool, chunksize=2, ordered=False)
+        self.assertEqual(list(out), list(range(30)))
+
+
+class LazyPipelineTest(unittest.TestCase):
+    def test_iteration_matches_eager_chain(self):
+        bag = Bag(range(40))
+        pipeline = bag.lazy().filter(is_even).map(triple).reject(is_big).map(str)
+        self.assertIsInstance(pipeline, LazyPipeline)
+        self.assertEqual(list(pipeline),
+                         [str(3 * x) for x in range(40) if x % 2 == 0 and not 3 * x > 10])
+        self.assertEqual(bag.calls, [])
+
+    def test_steps_run_in_one_pass_and_stop_early(self):
+        seen = []
+
+        def source():
+            for x in range(1_000):
+                seen.append(x)
+                yield x
+
+        pipeline = LazyPipeline(source()).filter(is_even).map(triple).reject(is_big)
+        self.assertEqual(pipeline.first(), 0)
+        self.assertEqual(seen, [0])
+        self.assertEqual(LazyPipeline(range(100)).filter(is_big).take(3), [11, 12, 13])
+        self.assertTrue(LazyPipeline(range(100)).map(triple).any(is_big))
+        self.assertFalse(LazyPipeline([0, 0]).any())
+        self.assertIsNone(LazyPipeline([]).first(None))
+        with self.assertRaises(ValueError):
+            LazyPipeline([1]).filter(is_even).first()
+
+    def test_pipelines_are_immutable(self):
+        base = LazyPipeline(range(10)).filter(is_even)
+        tripled = base.map(triple)
+        self.assertEqual(list(base), [0, 2, 4, 6, 8])
+        self.assertEqual(list(tripled), [0, 6, 12, 18, 24])
+        self.assertEqual(list(base.reject(is_even)), [])
+
+    def test_filter_chain_runs_eagerly_through_the_source(self):
+        bag = Bag(range(30))
+        out = bag.lazy().filter(is_even).reject(is_big).collect()
+        self.assertIsInstance(out, Bag)
+        self.assertEqual(out.items, [0, 2, 4, 6, 8, 10])
+        self.assertEqual(bag.calls, ["__filter__", "reject", "__filter__"])
+
+    def test_predicate_chain_is_one_filter_call(self):
+        bag = Bag({"n": n} for n in range(30))
+        out = bag.lazy().filter(F["n"] >= 5).reject(F["n"] > 8).collect()
+        self.assertEqual(out.items, [{"n": n} for n in range(5, 9)])
+        self.assertEqual(bag.calls, ["__filter__"])
+
+    def test_map_chain_is_one_transform_call(self):
+        for funcs in ([triple], [triple, str], [triple, triple, str]):
+            with self.subTest(n=len(funcs)):
+                bag = Bag([1, 2])
+                pipeline = bag.lazy()
+                for func in funcs:
+                    pipeline = pipeline.map(func)
+                out = pipeline.collect()
+                self.assertIsInstance(out, Bag)
+                self.assertEqual(out.items, list(pipeline))
+                self.assertEqual(bag.calls, ["__transform__"])
+
+    def test_mixed_chain_uses_collect(self):
+        sources = [SortedList([5, 1, 4, 2, 3]), PersistentVector(range(6)),
+                   ArrayContainer([1.0, 2.0, 3.0, 4.0])]
+        for source in sources:
+            with self.subTest(source=type(source).__name__):
+                pipeline = source.lazy().filter(is_even).map(triple)
+                out = pipeline.collect()
+                self.assertIs(type(out), type(source))
+                self.assertEqual(list(out), sorted(pipeline) if isinstance(source, SortedList)
+                                 else list(pipeline))
+        self.assertEqual(list(SortedList([3, 1, 2]).lazy().map(lambda x: -x).filter(is_big)
+                              .collect()), [])
+        self.assertEqual(list(SortedList([3, 1, 2]).lazy().reject(is_big).map(lambda x: -x)
+                              .collect()), [-3, -2, -1])
+
+    def test_mixed_chain_keeps_indexes(self):
+        rows = IndexedFilterable(({"k": i % 3, "n": i} for i in range(12)), hash_index=[F["k"]])
+        out = rows.lazy().filter(F["n"] > 5).map(lambda row: {**row, "n": -row["n"]}).collect()
+        self.assertIsInstance(out, IndexedFilterable)
+        self.assertEqual([row["n"] for row in out.filter(F["k"] == 0)], [-6, -9])
+
+    def test_mixed_chain_without_collect_gives_list(self):
+        bag = Bag(range(6))
+        self.assertEqual(bag.lazy().map(triple).filter(is_even).collect(), [0, 6, 12])
+        self.assertEqual(bag.calls, [])
+
+    def test_collect_with_factory(self):
+        pipeline = SortedList([3, 1, 2]).lazy().map(triple)
+        self.assertEqual(pipeline.collect(set), {3, 6, 9})
+        self.assertEqual(pipeline.collect(tuple), (3, 6, 9))
+        self.assertEqual(SortedList([1]).lazy().collect(list), [1])
+
+
+class Tracker:
+    """An async function that sleeps a little and records its concurrency."""
+
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.active = 0
+        self.peak = 0
+        self.started = []
+        self.finished = []
+        self.cancelled = []
+
+    async def __call__(self, x):
+        self.started.append(x)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.rng.random() * 0.002)
+        except asyncio.CancelledError:
+            self.cancelled.append(x)
+            raise
+        finally:
+            self.active -= 1
+        self.finished.append(x)
+        return x * 10
+
+
+async def counted(n, read):
+    for x in range(n):
+        read.append(x)
+        yield x
+
+
+class AsyncMapTest(unittest.TestCase):
+    def test_input_order_and_concurrency_bound(self):
+        for concurrency in (1, 2, 5):
+            with self.subTest(concurrency=concurrency):
+                tracker = Tracker(concurrency)
+
+                async def main():
+                    return [x async for x in async_map(tracker, counted(60, []), concurrency)]
+
+                self.assertEqual(asyncio.run(main()), [x * 10 for x in range(60)])
+                self.assertEqual(tracker.peak, concurrency)
+
+    def test_plain_functions_and_sync_iterables_of_awaitables(self):
+        async def main():
+            out = [x async for x in async_map(str, counted(5, []), 3)]
+            kept = [x async for x in async_filter(lambda x: x % 2, counted(7, []), 3)]
+            return out, kept
+
+        self.assertEqual(asyncio.run(main()), (["0", "1", "2", "3", "4"], [1, 3, 5]))
+
+    def test_source_is_not_read_far_ahead(self):
+        read = []
+        concurrency = 4
+
+        async def main():
+            results = async_map(Tracker(), counted(1000, read), concurrency)
+            consumed = 0
+            async for _ in results:
+                consumed += 1
+                await asyncio.sleep(0.001)
+                self.assertLessEqual(len(read), consumed + concurrency + 1)
+                if consumed == 20:
+                    break
+            await results.aclose()
+
+        asyncio.run(main())
+        self.assertLess(len(read), 30)
+
+    def test_aclose_cancels_pending_calls(self):
+        started, cancelled = [], []
+        read = []
+
+        async def stuck_after_two(x):
+            started.append(x)
+            if x > 2:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(x)
+                    raise
+            return x
+
+        async def main():
+            results = async_map(stuck_after_two, counted(1000, read), 8)
+            self.assertEqual([await results.__anext__() for _ in range(3)], [0, 1, 2])
+            await asyncio.sleep(0.01)
+            await results.aclose()
+            self.assertEqual(started, list(range(11)))
+            self.assertEqual(sorted(cancelled), list(range(3, 11)))
+
+        asyncio.run(main())
+        self.assertEqual(len(read), 12)
+
+    def test_errors_surface_in_order(self):
+        async def fail_on_seven(x):
+            await asyncio.sleep(0.001 * (x % 3))
+            if x == 7:
+                raise ValueError("seven")
+            return x
+
+        async def broken_source():
+            for x in range(5):
+                yield x
+            raise OSError("source failed")
+
+        async def main(func, source, out):
+            async for x in async_map(func, source, 4):
+                out.append(x)
+
+        out = []
+        with self.assertRaisesRegex(ValueError, "seven"):
+            asyncio.run(main(fail_on_seven, counted(100, []), out))
+        self.assertEqual(out, list(range(7)))
+        out = []
+        with self.assertRaisesRegex(OSError, "source failed"):
+            asyncio.run(main(Tracker(), broken_source(), out))
+        self.assertEqual(out, [0, 10, 20, 30, 40])
+
+
+if __name__ == "__main__":
+    unittest.main()
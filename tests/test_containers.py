@@ -0,0 +1,480 @@
+import asyncio
+import copy
+import random
+import unittest
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+
+from more_abc import (F, ArrayContainer, AsyncFilterable, AsyncStream, AsyncTransformable,
+                      IndexedFilterable, PersistentVector, SortedList, Transformable)
+from more_abc.abc_dataclasses import _numpy
+
+np = _numpy()
+
+
+class Row:
+    def __init__(self, key, n, tag):
+        self.key = key
+        self.n = n
+        self.tag = tag
+
+    def __repr__(self):
+        return f"Row({self.key!r}, {self.n!r}, {self.tag!r})"
+
+
+class SmallSortedList(SortedList):
+    """Tiny sublists, so that a few hundred elements split and merge them often."""
+
+    _load = 4
+
+
+class SortedListTest(unittest.TestCase):
+    """SortedList against a plain list kept sorted by the same key."""
+
+    def check(self, sl, ref, key=None):
+        key = key or (lambda x: x)
+        view = ref[::-1] if sl._reverse else ref
+        self.assertEqual(list(sl), view)
+        self.assertEqual(list(reversed(sl)), view[::-1])
+        self.assertEqual(len(sl), len(ref))
+        # Layout invariants: sublists are non-empty, maxes match, offsets add up.
+        self.assertTrue(all(sl._lists))
+        self.assertEqual(sl._maxes, [chunk[-1] for chunk in sl._keys])
+        self.assertEqual([list(map(key, chunk)) for chunk in sl._lists], sl._keys)
+        offsets = [sl._offset(pos) for pos in range(len(sl._lists))]
+        self.assertEqual(offsets, [sum(map(len, sl._lists[:pos])) for pos in range(len(sl._lists))])
+
+    def run_model(self, key, seed):
+        rng = random.Random(seed)
+        sl = SmallSortedList(key=key)
+        ref = []
+        rkey = key or (lambda x: x)
+
+        def insert(value):
+            keys = [rkey(v) for v in ref]
+            ref.insert(bisect_right(keys, rkey(value)), value)
+
+        for step in range(600):
+            op = rng.random()
+            if op < 0.4:
+                value = rng.randrange(-50, 50)
+                sl.add(value)
+                insert(value)
+            elif op < 0.45:
+                values = [rng.randrange(-50, 50) for _ in range(rng.choice((1, 3, 60)))]
+                sl.update(values)
+                if len(values) * 4 < len(ref):
+                    for value in values:
+                        insert(value)
+                else:
+                    ref = sorted(ref + values, key=rkey)
+            elif op < 0.6:
+                value = rng.randrange(-50, 50)
+                if value in ref:
+                    sl.remove(value)
+                    ref.remove(value)
+                else:
+                    with self.assertRaises(ValueError):
+                        sl.remove(value)
+                    sl.discard(value)
+            elif op < 0.7 and ref:
+                index = rng.randrange(-len(ref), len(ref))
+                view_index = index if not sl._reverse else -1 - index
+                self.assertEqual(sl.pop(index), ref.pop(view_index))
+            elif op < 0.72:
+                sl.sort(reverse=rng.random() < 0.5)
+            else:
+                view = ref[::-1] if sl._reverse else ref
+                value = rng.randrange(-55, 55)
+                self.assertEqual(value in sl, value in ref)
+                self.assertEqual(sl.count(value), ref.count(value))
+                keys = [rkey(v) for v in ref]
+                self.assertEqual(sl.bisect_left(value), bisect_left(keys, rkey(value)))
+                self.assertEqual(sl.bisect_right(value), bisect_right(keys, rkey(value)))
+                if value in ref:
+                    self.assertEqual(view[sl.index(value)], value)
+                    if not sl._reverse:
+                        self.assertEqual(sl.index(value), ref.index(value))
+                else:
+                    with self.assertRaises(ValueError):
+                        sl.index(value)
+                if view:
+                    i = rng.randrange(-len(view), len(view))
+                    self.assertEqual(sl[i], view[i])
+                a, b = sorted(rng.randrange(-5, len(view) + 5) for _ in range(2))
+                for sl_slice in (slice(a, b), slice(b, a, -1), slice(None, None, -1),
+                                 slice(a, None, 2)):
+                    self.assertEqual(sl[sl_slice], view[sl_slice])
+            if step % 10 == 0:
+                self.check(sl, ref, key)
+        self.check(sl, ref, key)
+        with self.assertRaises(IndexError):
+            sl[len(ref)]
+        return sl, ref
+
+    def test_natural_order(self):
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                self.run_model(None, seed)
+
+    def test_key_with_ties(self):
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                self.run_model(lambda x: abs(x) // 3, seed)
+
+    def test_key_is_computed_once_per_element(self):
+        calls = []
+
+        def key(x):
+            calls.append(x)
+            return -x
+
+        sl = SmallSortedList(range(20), key=key)
+        sl.add(5)
+        self.assertEqual(len(calls), 21)
+        list(sl.filter(lambda x: x % 2))
+        sl.sort(reverse=True)
+        sl.sorted()
+        sl.nsmallest(3, key=key)
+        self.assertEqual(len(calls), 21)
+
+    def test_copies_are_independent(self):
+        sl = SmallSortedList(range(30), key=lambda x: x % 7)
+        clone = copy.copy(sl)
+        ordered = sl.sorted(reverse=True)
+        sl.add(100)
+        sl.remove(3)
+        self.assertEqual(list(clone), sorted(range(30), key=lambda x: x % 7))
+        self.assertEqual(list(ordered), sorted(range(30), key=lambda x: x % 7)[::-1])
+        self.assertNotIn(100, clone)
+
+    def test_sortable_queries_match_sorted(self):
+        rng = random.Random(10)
+        values = [rng.randrange(100) for _ in range(200)]
+        sl = SmallSortedList(values)
+        ref = sorted(values)
+        for k in (0, 1, 5, 200, 300):
+            self.assertEqual(sl.nsmallest(k), ref[:k])
+            self.assertEqual(sl.nlargest(k), ref[::-1][:k])
+            self.assertEqual(sl.nsmallest(k, key=lambda x: -x), ref[::-1][:k])
+        self.assertEqual(list(sl.iter_sorted()), ref)
+        self.assertEqual(list(sl.iter_sorted(reverse=True)), ref[::-1])
+        self.assertEqual(list(sl.iter_sorted(key=lambda x: x % 10)),
+                         sorted(ref, key=lambda x: x % 10))
+        self.assertEqual(sl.partition(50)[50], ref[50])
+        self.assertEqual(list(sl.filter(lambda x: x > 50)), [x for x in ref if x > 50])
+        self.assertEqual(list(sl.map(lambda x: -x)), sorted(-x for x in ref))
+
+
+class AsyncStreamTest(unittest.TestCase):
+    def test_chain_keeps_order(self):
+        async def slow_double(x):
+            await asyncio.sleep(0.001 * (x % 4))
+            return 2 * x
+
+        async def is_multiple_of_three(x):
+            return x % 3 == 0
+
+        async def main():
+            stream = (AsyncStream(range(40))
+                      .afilter(lambda x: x % 2 == 0)
+                      .amap(slow_double, concurrency=8)
+                      .areject(is_multiple_of_three, concurrency=3))
+            self.assertIsInstance(stream, AsyncFilterable)
+            self.assertIsInstance(stream, AsyncTransformable)
+            return await stream.collect()
+
+        expected = [2 * x for x in range(0, 40, 2) if (2 * x) % 3]
+        self.assertEqual(asyncio.run(main()), expected)
+
+    def test_async_source_and_factory(self):
+        async def source():
+            for x in (3, 1, 2):
+                yield x
+
+        async def main():
+            return await AsyncStream(source()).amap(str).collect(tuple)
+
+        self.assertEqual(asyncio.run(main()), ("3", "1", "2"))
+
+
+def tree_leaves(vec):
+    """The leaf tuples of *vec*, after checking the shape of its tree."""
+    from more_abc.containers import _WIDTH, _Branch
+
+    leaves, depths = [], set()
+
+    def walk(node, depth):
+        if type(node) is not _Branch:
+            assert 0 < len(node) <= _WIDTH or vec._root is node == (), node
+            leaves.append(node)
+            depths.add(depth)
+            return len(node)
+        assert 0 < len(node.children) <= _WIDTH
+        sizes = [walk(child, depth + 1) for child in node.children]
+        assert list(node.ends) == [sum(sizes[:i + 1]) for i in range(len(sizes))]
+        return node.ends[-1]
+
+    assert walk(vec._root, 0) == len(vec)
+    assert len(depths) == 1, "leaves at different depths"
+    return leaves
+
+
+class PersistentVectorTest(unittest.TestCase):
+    def test_snapshots_are_isolated(self):
+        rng = random.Random(18)
+        vec = PersistentVector()
+        ref = []
+        snapshots = []
+        for step in range(3000):
+            op = rng.random()
+            if op < 0.35:
+                index = rng.randrange(-len(ref) - 3, len(ref) + 3)
+                value = rng.randrange(1000)
+                vec.insert(index, value)
+                ref.insert(index, value)
+            elif op < 0.45:
+                vec.append(step)
+                ref.append(step)
+            elif op < 0.65 and ref:
+                index = rng.randrange(-len(ref), len(ref))
+                vec[index] = -step
+                ref[index] = -step
+            elif op < 0.85 and ref:
+                index = rng.randrange(-len(ref), len(ref))
+                if rng.random() < 0.5:
+                    self.assertEqual(vec.pop(index), ref.pop(index))
+                else:
+                    del vec[index]
+                    del ref[index]
+            elif op < 0.87:
+                values = list(range(rng.choice((1, 5, 300))))
+                vec.extend(values)
+                ref.extend(values)
+            elif op < 0.95:
+                snapshots.append((copy.copy(vec), list(ref)))
+            elif op < 0.97:
+                snapshots.append((vec.sorted(), sorted(ref)))
+                snapshots.append((vec.filter(lambda x: x % 3), [x for x in ref if x % 3]))
+                snapshots.append((vec.map(lambda x: x // 2), [x // 2 for x in ref]))
+            if step % 100 == 0:
+                self.assertEqual(list(vec), ref)
+                tree_leaves(vec)
+        self.assertEqual(list(vec), ref)
+        self.assertGreater(len(snapshots), 100)
+        for snapshot, expected in snapshots:
+            self.assertEqual(list(snapshot), expected)
+            self.assertEqual(len(snapshot), len(expected))
+            if expected:
+                self.assertEqual(snapshot[len(expected) // 2], expected[len(expected) // 2])
+            tree_leaves(snapshot)
+
+    def test_edits_copy_only_one_path(self):
+        vec = PersistentVector(range(10_000))
+        clone = copy.copy(vec)
+        self.assertIs(clone._root, vec._root)
+        vec[5000] = "x"
+        before, after = tree_leaves(clone), tree_leaves(vec)
+        self.assertEqual(sum(a is not b for a, b in zip(before, after)), 1)
+        self.assertEqual(clone[5000], 5000)
+        vec.insert(0, "y")
+        vec.pop()
+        self.assertEqual(list(clone), list(range(10_000)))
+
+    def test_sorted_filter_map_share_structure(self):
+        vec = PersistentVector(range(1000))
+        self.assertIs(vec.sorted()._root, vec._root)
+        shared = set(map(id, tree_leaves(vec)))
+        kept = vec.filter(lambda x: x != 500)
+        self.assertEqual(list(kept), [x for x in range(1000) if x != 500])
+        self.assertEqual(sum(id(leaf) in shared for leaf in tree_leaves(kept)),
+                         len(shared) - 1)
+        bumped = vec.map(lambda x: x + 1 if x < 32 else x)
+        self.assertEqual(sum(id(leaf) in shared for leaf in tree_leaves(bumped)),
+                         len(shared) - 1)
+        reversed_vec = vec.sorted(reverse=True)
+        self.assertEqual(list(reversed_vec), list(range(999, -1, -1)))
+        self.assertEqual(list(vec), list(range(1000)))
+
+    def test_list_behaviour(self):
+        vec = PersistentVector("abcdef")
+        self.assertEqual(vec[1:4], PersistentVector("bcd"))
+        self.assertEqual(vec[::-2].tolist(), ["f", "d", "b"])
+        self.assertEqual(vec[-1], "f")
+        for bad in (6, -7):
+            with self.assertRaises(IndexError):
+                vec[bad]
+        empty = PersistentVector()
+        with self.assertRaises(IndexError):
+            empty.pop()
+        empty.insert(-5, 1)
+        self.assertEqual(empty.tolist(), [1])
+        del empty[0]
+        self.assertEqual((len(empty), empty.tolist()), (0, []))
+        self.assertNotEqual(vec, PersistentVector("abcdeg"))
+
+
+class ArrayContainerTest(unittest.TestCase):
+    def test_map_with_executor_calls_function_per_element(self):
+        with ThreadPoolExecutor(2) as pool:
+            out = ArrayContainer([1.0, 2.0, 3.0, 4.0]).map(lambda x: x * 10, executor=pool,
+                                                            chunksize=2)
+        self.assertEqual(list(out), [10.0, 20.0, 30.0, 40.0])
+
+    def test_map_without_executor(self):
+        self.assertEqual(list(ArrayContainer([1.0, 4.0]).map(lambda x: x * 10)), [10.0, 40.0])
+
+    def test_callables_run_per_element_by_default(self):
+        seen = []
+
+        def double(x):
+            seen.append(type(x))
+            return x * 2
+
+        out = ArrayContainer([1.0, 2.0, 3.0]).map(double)
+        self.assertEqual(list(out), [2.0, 4.0, 6.0])
+        self.assertEqual(seen, [float] * 3)
+        self.assertEqual(list(ArrayContainer([1.0, -2.0]).filter(lambda x: x > 0)), [1.0])
+
+    def test_vectorize_opt_in(self):
+        calls = []
+
+        def double(x):
+            calls.append(x)
+            return x * 2
+
+        a = ArrayContainer([1.0, 2.0, 3.0], vectorize=True)
+        self.assertEqual(list(a.map(double)), [2.0, 4.0, 6.0])
+        self.assertEqual(len(calls), 1 if np is not None else 3)
+        self.assertEqual(list(a.filter(lambda x: x > 1)), [2.0, 3.0])
+        self.assertTrue(a[1:]._vectorize)
+        self.assertTrue(a.map(double)._vectorize)
+
+    @unittest.skipIf(np is None, "needs NumPy")
+    def test_cumsum_is_not_applied_to_the_whole_array(self):
+        a = ArrayContainer([1.0, 2.0, 3.0])
+        self.assertEqual(a.map(np.cumsum).data.tolist(), [[1.0], [2.0], [3.0]])
+        self.assertEqual(list(a.map(np.sqrt)), [1.0, 2.0 ** 0.5, 3.0 ** 0.5])
+        self.assertEqual(list(ArrayContainer([1.0, np.inf]).filter(np.isfinite)), [1.0])
+
+    def test_executor_results_are_collected_not_replayed(self):
+        calls = []
+
+        def probe(x):
+            calls.append(x)
+            return x + 1
+
+        a = ArrayContainer([1.0, 2.0, 3.0], vectorize=True)
+        with ThreadPoolExecutor(2) as pool:
+            out = a.map(probe, executor=pool, chunksize=1)
+        self.assertEqual(list(out), [2.0, 3.0, 4.0])
+        self.assertEqual(sorted(calls), [1.0, 2.0, 3.0])
+        self.assertTrue(out._vectorize)
+
+
+class CollectTest(unittest.TestCase):
+    def test_map_with_executor_keeps_container_settings(self):
+        with ThreadPoolExecutor(2) as pool:
+            desc = SortedList([3, 1, 2], key=lambda x: -x)
+            desc.sort(reverse=True)
+            out = desc.map(lambda x: x * 10, executor=pool, chunksize=1)
+            self.assertEqual(list(out), list(desc.map(lambda x: x * 10)))
+            self.assertIs(out.key, desc.key)
+            vec = PersistentVector(range(100))
+            self.assertEqual(list(vec.map(str, executor=pool)), list(map(str, range(100))))
+
+    def test_containers_without_collect_get_a_replay(self):
+        class Plain(Transformable):
+            def __init__(self, data):
+                self.data = list(data)
+
+            def __iter__(self):
+                return iter(self.data)
+
+            def __transform__(self, func):
+                return Plain([func(x) for x in self.data])
+
+        with ThreadPoolExecutor(2) as pool:
+            out = Plain([1, 2, 3]).map(lambda x: x * 2, executor=pool, chunksize=2)
+        self.assertEqual(out.data, [2, 4, 6])
+
+
+class IndexedFilterableTest(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(14)
+        self.rows = [Row(i, rng.randrange(20), rng.choice("abc")) for i in range(300)]
+        self.index = IndexedFilterable(self.rows, hash_index=["tag"], sorted_index=["n"])
+        self.predicates = [
+            F.tag == "a",
+            F.tag != "b",
+            F.tag.isin(["a", "c"]),
+            F.n < 5,
+            F.n <= 5,
+            F.n > 15,
+            F.n >= 15,
+            F.n.between(3, 7),
+            (F.n > 10) & (F.tag == "c"),
+            (F.n < 3) | (F.tag == "b"),
+            ~(F.n >= 10),
+            (F.n > 4) & (F.key < 100),
+            lambda row: row.n % 3 == 0,
+        ]
+
+    def assertMatchesScan(self, index, rows):
+        for pred in self.predicates:
+            with self.subTest(pred=pred):
+                self.assertEqual(list(index.filter(pred)), [row for row in rows if pred(row)])
+
+    def test_filter_matches_scan(self):
+        self.assertMatchesScan(self.index, self.rows)
+
+    def test_filter_after_add_discard_refresh(self):
+        rows = list(self.rows)
+        for row in rows[::7]:
+            self.index.discard(row)
+        rows = [row for pos, row in enumerate(rows) if pos % 7]
+        for row in rows[::5]:
+            row.n = (row.n * 7) % 23
+            row.tag = "c" if row.tag == "a" else "a"
+            self.index.refresh(row)
+        extra = [Row(1000 + i, i, "b") for i in range(10)]
+        for row in extra:
+            self.index.add(row)
+        self.assertMatchesScan(self.index, rows + extra)
+
+    def test_failed_refresh_keeps_old_entries(self):
+        row = self.rows[10]
+        old = row.n
+        row.n = "not comparable"
+        with self.assertRaises(TypeError):
+            self.index.refresh(row)
+        row.n = old
+        self.assertMatchesScan(self.index, self.rows)
+        self.index.discard(row)
+        self.assertMatchesScan(self.index, self.rows[:10] + self.rows[11:])
+
+    def test_failed_refresh_of_unhashable_value(self):
+        row = self.rows[3]
+        old = row.tag
+        row.tag = ["unhashable"]
+        with self.assertRaises(TypeError):
+            self.index.refresh(row)
+        row.tag = old
+        self.index.remove(row)
+        self.assertMatchesScan(self.index, self.rows[:3] + self.rows[4:])
+
+    def test_refresh_of_record_stored_twice(self):
+        row = self.rows[0]
+        self.index.add(row)
+        row.n = 99
+        self.index.refresh(row)
+        self.assertEqual(list(self.index.filter(F.n == 99)), [row, row])
+        row.n = object()
+        with self.assertRaises(TypeError):
+            self.index.refresh(row)
+        row.n = 99
+        self.assertEqual(list(self.index.filter(F.n >= 99)), [row, row])
+
+
+if __name__ == "__main__":
+    unittest.main()
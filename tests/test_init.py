@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("json", "logging", "dataclasses")
+
+
+def imported_after(code):
+    """Run *code* in a fresh interpreter and return which HEAVY modules it loaded."""
+    probe = f"import sys\n{code}\nprint(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    out = subprocess.run([sys.executable, "-c", probe], env=env, cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return out.split()
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_import_does_not_load_heavy_modules(self):
+        self.assertEqual(imported_after("import more_abc"), [])
+
+    def test_attribute_access_loads_submodule(self):
+        self.assertIn("json", imported_after("import more_abc; more_abc.AbstractJSONEncoder"))
+
+    def test_attribute_access_loads_named_submodule_only(self):
+        self.assertEqual(imported_after("import more_abc; more_abc.abc_json"), ["json"])
+        self.assertEqual(imported_after("import more_abc; more_abc.abc_dataclasses"),
+                         ["dataclasses"])
+
+    def test_submodule_attributes(self):
+        import importlib
+
+        import more_abc
+
+        for name in sorted(more_abc._submodules):
+            with self.subTest(name=name):
+                module = getattr(more_abc, name)
+                self.assertIs(module, importlib.import_module(f"more_abc.{name}"))
+                self.assertIn(name, dir(more_abc))
+        self.assertIs(more_abc.more.ABCMixin, more_abc.ABCMixin)
+        self.assertIs(more_abc.collections_abc.F, more_abc.F)
+        with self.assertRaises(AttributeError):
+            more_abc.no_such_submodule
+
+    def test_importtime_report(self):
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        err = subprocess.run([sys.executable, "-X", "importtime", "-c", "import more_abc"],
+                             env=env, cwd=ROOT, check=True, capture_output=True,
+                             text=True).stderr
+        loaded = {line.rsplit("|", 1)[-1].strip() for line in err.splitlines()
+                  if line.startswith("import time:")}
+        self.assertIn("more_abc", loaded)
+        self.assertFalse(loaded & set(HEAVY))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,452 @@
+import copy
+import gc
+import pickle
+import unittest
+from abc import ABCMeta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from more_abc import (ABCMixin, FastABCMeta, SlottedABCMixin, to_columns, to_dicts,
+                      validate_many)
+from more_abc.collections_abc import structural_hook
+
+
+class User(ABCMixin, memoize=True):
+    def __init__(self, name, tags=()):
+        self.name = name
+        self.tags = list(tags)
+        self.calls = 0
+
+    def initialize(self):
+        pass
+
+    def validate(self):
+        return bool(self.name) and "bad" not in self.tags
+
+    def to_dict(self):
+        object.__setattr__(self, "calls", self.calls + 1)
+        return dict(vars(self))
+
+
+class SlottedUser(SlottedABCMixin, memoize=True):
+    name: str
+
+    def __init__(self, name):
+        self.name = name
+
+    def initialize(self):
+        pass
+
+    def validate(self):
+        return bool(self.name)
+
+    def to_dict(self):
+        return {"name": self.name}
+
+
+class Record(ABCMixin):
+    """A record whose keys vary: *fields* maps key to value."""
+
+    def __init__(self, **fields):
+        self.fields = fields
+
+    def initialize(self):
+        pass
+
+    def validate(self):
+        return self.fields.get("ok", True)
+
+    def to_dict(self):
+        return dict(self.fields)
+
+
+class FastABCMetaTest(unittest.TestCase):
+    def test_register_invalidates_registering_abcs(self):
+        class E(metaclass=FastABCMeta):
+            pass
+
+        class A(metaclass=FastABCMeta):
+            pass
+
+        class X:
+            pass
+
+        E.register(A)
+        self.assertFalse(issubclass(X, E))
+        A.register(X)
+        self.assertTrue(issubclass(X, A))
+        self.assertTrue(issubclass(X, E))
+        self.assertTrue(isinstance(X(), E))
+
+    def test_register_matches_abcmeta_through_plain_abc(self):
+        class E(metaclass=FastABCMeta):
+            pass
+
+        class M(metaclass=ABCMeta):
+            pass
+
+        class A(metaclass=FastABCMeta):
+            pass
+
+        class X:
+            pass
+
+        E.register(M)
+        M.register(A)
+        self.assertFalse(issubclass(X, E))
+        A.register(X)
+        self.assertTrue(issubclass(X, E))
+
+    def test_instancecheck_proxy_after_cached_miss(self):
+        class A(metaclass=FastABCMeta):
+            pass
+
+        class Impl(A):
+            pass
+
+        class Proxy:
+            @property
+            def __class__(self):
+                return Impl
+
+        self.assertFalse(issubclass(Proxy, A))
+        self.assertTrue(isinstance(Proxy(), A))
+        self.assertEqual(isinstance(Proxy(), A), ABCMeta.__instancecheck__(A, Proxy()))
+
+    def test_unrelated_register_keeps_table(self):
+        class Base(metaclass=FastABCMeta):
+            pass
+
+        class Sub(Base):
+            pass
+
+        class Unrelated(metaclass=FastABCMeta):
+            pass
+
+        class X:
+            pass
+
+        self.assertFalse(issubclass(X, Base))
+        self.assertIn(id(X), Base._fast_abc_cache)
+        Unrelated.register(type("R", (), {}))
+        self.assertFalse(issubclass(X, Base))
+        self.assertIn(id(X), Base._fast_abc_cache)
+
+    def test_plain_register_clears_table(self):
+        class Base(metaclass=FastABCMeta):
+            pass
+
+        class Sub(Base):
+            pass
+
+        class Plain(metaclass=ABCMeta):
+            pass
+
+        class X:
+            pass
+
+        Base.register(Plain)
+        self.assertFalse(issubclass(X, Base))
+        Plain.register(X)
+        self.assertTrue(issubclass(X, Base))
+
+    def test_new_subclass_hook_is_seen(self):
+        class Base(metaclass=FastABCMeta):
+            pass
+
+        class Sub(Base):
+            pass
+
+        class Unrelated(metaclass=FastABCMeta):
+            pass
+
+        class X:
+            pass
+
+        self.assertFalse(issubclass(X, Base))
+
+        class Claims(Base):
+            @classmethod
+            def __subclasshook__(cls, C):
+                return True if C is X else NotImplemented
+
+        Unrelated.register(type("R", (), {}))
+        self.assertTrue(issubclass(X, Base))
+
+    def test_leaf_keeps_plain_hook(self):
+        class Base(metaclass=FastABCMeta):
+            pass
+
+        class Leaf(Base):
+            pass
+
+        self.assertNotIsInstance(Leaf.__dict__["__subclasshook__"], type(Base.__dict__["__subclasshook__"]))
+        self.assertTrue(issubclass(Leaf, Base))
+        self.assertFalse(issubclass(int, Leaf))
+
+    def test_cache_size_evicts_oldest(self):
+        class Base(metaclass=FastABCMeta, cache_size=2):
+            pass
+
+        class Sub(Base):
+            pass
+
+        types = [type(f"T{i}", (), {}) for i in range(3)]
+        for t in types:
+            self.assertFalse(issubclass(t, Base))
+        self.assertEqual(list(Base._fast_abc_cache), [id(types[1]), id(types[2])])
+        self.assertEqual(Sub._fast_abc_cache_size, 2)
+        with self.assertRaises(ValueError):
+            FastABCMeta("Bad", (), {}, cache_size=0)
+
+    def test_structural_hook_invalidate(self):
+        class Sized(metaclass=FastABCMeta):
+            __subclasshook__ = structural_hook("__len__")
+
+        class Sub(Sized):
+            pass
+
+        class C:
+            pass
+
+        self.assertFalse(issubclass(C, Sized))
+        C.__len__ = lambda self: 0
+        Sized.__subclasshook__.invalidate()
+        self.assertTrue(issubclass(C, Sized))
+        self.assertFalse(issubclass(int, Sub))
+
+
+class ABCMixinMemoTest(unittest.TestCase):
+    def test_hits_and_misses(self):
+        class Counted(User):
+            pass
+
+        user = Counted("ada")
+        user.get_info()
+        user.get_info()
+        repr(user)
+        self.assertEqual(Counted.memo_info(), {"hits": 3, "misses": 2})
+        self.assertEqual(user.calls, 1)
+
+    def test_setattr_and_delattr_invalidate(self):
+        user = User("ada")
+        self.assertTrue(user.is_valid())
+        user.name = ""
+        self.assertFalse(user.is_valid())
+        self.assertEqual(user.get_info()["data"]["name"], "")
+        del user.tags
+        self.assertNotIn("tags", user.get_info()["data"])
+
+    def test_memo_clear_after_in_place_mutation(self):
+        user = User("ada", ["x"])
+        self.assertTrue(user.is_valid())
+        user.tags.append("bad")
+        self.assertTrue(user.is_valid())
+        user.memo_clear()
+        self.assertFalse(user.is_valid())
+
+    def test_memo_stays_out_of_vars(self):
+        user = User("ada")
+        user.get_info()
+        data = user.get_info()["data"]
+        self.assertEqual(set(vars(user)), {"name", "tags", "calls"})
+        self.assertEqual(set(data), {"name", "tags", "calls"})
+
+    def test_get_info_returns_a_copy(self):
+        user = User("ada")
+        user.get_info()["data"]["name"] = "eve"
+        self.assertEqual(user.get_info()["data"]["name"], "ada")
+
+    def test_pickle_and_copy_start_cold(self):
+        user = User("ada")
+        user.get_info()
+        for clone in (pickle.loads(pickle.dumps(user)), copy.copy(user), copy.deepcopy(user)):
+            self.assertEqual(set(vars(clone)), {"name", "tags", "calls"})
+            clone.name = "eve"
+            self.assertEqual(clone.get_info()["data"]["name"], "eve")
+        self.assertEqual(user.get_info()["data"]["name"], "ada")
+
+    def test_slotted_memo(self):
+        user = SlottedUser("ada")
+        self.assertTrue(user.is_valid())
+        self.assertFalse(hasattr(user, "__dict__"))
+        self.assertNotIn("_abc_memo", SlottedUser.__slots__)
+        user.name = ""
+        self.assertFalse(user.is_valid())
+        clone = pickle.loads(pickle.dumps(user))
+        self.assertEqual(clone.name, "")
+        self.assertFalse(clone.is_valid())
+
+    def test_entry_dropped_with_instance(self):
+        from more_abc import more
+
+        user = User("ada")
+        user.get_info()
+        key = id(user)
+        self.assertIn(key, more._abc_memos)
+        del user
+        gc.collect()
+        self.assertNotIn(key, more._abc_memos)
+
+
+class SlottedPoint(SlottedABCMixin):
+    x: int
+    y: int
+
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+    def initialize(self):
+        pass
+
+    def validate(self):
+        return self.x >= 0
+
+    def to_dict(self):
+        return {"x": self.x, "y": self.y}
+
+
+class PlainPoint(ABCMixin):
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+    def initialize(self):
+        pass
+
+    def validate(self):
+        return self.x >= 0
+
+    def to_dict(self):
+        return {"x": self.x, "y": self.y}
+
+
+class SlottedABCMixinTest(unittest.TestCase):
+    def test_layout(self):
+        point = SlottedPoint(1, 2)
+        self.assertEqual(SlottedPoint.__slots__, ("x", "y"))
+        self.assertFalse(hasattr(point, "__dict__"))
+        with self.assertRaises(AttributeError):
+            point.z = 3
+
+    def test_matches_abcmixin(self):
+        for x in (1, -1):
+            slotted, plain = SlottedPoint(x, 2), PlainPoint(x, 2)
+            self.assertEqual(slotted.is_valid(), plain.is_valid())
+            info = slotted.get_info()
+            self.assertEqual(info, dict(plain.get_info(), class_name="SlottedPoint"))
+            self.assertEqual(repr(slotted), repr(plain).replace("PlainPoint", "SlottedPoint"))
+
+    def test_abstract_methods_are_enforced(self):
+        class Partial(SlottedABCMixin):
+            a: int
+
+            def initialize(self):
+                pass
+
+        with self.assertRaises(TypeError):
+            Partial()
+
+    def test_subclass_adds_only_new_fields(self):
+        class Point3(SlottedPoint):
+            x: int
+            z: int
+
+        self.assertEqual(Point3.__slots__, ("z",))
+        point = Point3(1, 2)
+        point.z = 3
+        self.assertEqual((point.x, point.y, point.z), (1, 2, 3))
+        self.assertFalse(hasattr(point, "__dict__"))
+
+    def test_classvars_are_skipped(self):
+        from typing import ClassVar
+
+        class Counted(SlottedPoint):
+            instances: ClassVar[int] = 0
+            label: "ClassVar[str]" = "counted"
+            extra: int
+
+        self.assertEqual(Counted.__slots__, ("extra",))
+        self.assertEqual((Counted.instances, Counted.label), (0, "counted"))
+
+    def test_class_level_default_is_rejected(self):
+        with self.assertRaisesRegex(TypeError, "class-level default"):
+            class Defaulted(SlottedABCMixin):
+                a: int = 1
+
+    def test_explicit_slots_are_kept(self):
+        class Explicit(SlottedABCMixin):
+            __slots__ = "a"
+            b: int
+
+        self.assertEqual(Explicit.__slots__, ("a",))
+
+    def test_memoize_adds_one_weakref_slot(self):
+        class Memo(SlottedPoint, memoize=True):
+            pass
+
+        class MemoChild(Memo):
+            z: int
+
+        self.assertEqual(Memo.__slots__, ("__weakref__",))
+        self.assertEqual(MemoChild.__slots__, ("z",))
+        self.assertFalse(hasattr(MemoChild(1, 2), "__dict__"))
+        self.assertEqual(SlottedPoint.__weakrefoffset__, 0)
+
+    def test_pickle_and_copy(self):
+        point = SlottedPoint(1, [2])
+        for clone in (pickle.loads(pickle.dumps(point)), copy.copy(point), copy.deepcopy(point)):
+            self.assertEqual(clone.to_dict(), {"x": 1, "y": [2]})
+        self.assertIsNot(copy.deepcopy(point).y, point.y)
+
+
+class BatchHelpersTest(unittest.TestCase):
+    records = [Record(i=i, ok=i % 3 != 0) for i in range(50)]
+
+    def executors(self):
+        return (None, ThreadPoolExecutor(4), ProcessPoolExecutor(2))
+
+    def test_results_in_input_order(self):
+        expected_flags = [r.is_valid() for r in self.records]
+        expected_dicts = [r.to_dict() for r in self.records]
+        for executor in self.executors():
+            with self.subTest(executor=type(executor).__name__):
+                for chunksize in (1, 7, 4096):
+                    self.assertEqual(validate_many(self.records, executor, chunksize),
+                                     expected_flags)
+                    self.assertEqual(to_dicts(iter(self.records), executor, chunksize),
+                                     expected_dicts)
+                    self.assertEqual(to_columns(self.records, executor, chunksize),
+                                     {"i": list(range(50)),
+                                      "ok": [i % 3 != 0 for i in range(50)]})
+                if executor is not None:
+                    executor.shutdown()
+
+    def test_to_columns_fills_missing_keys(self):
+        records = [Record(a=1), Record(a=2, b="x"), Record(c=3.0), Record(b="y", a=4),
+                   Record(), Record(d=None)]
+        expected = {"a": [1, 2, None, 4, None, None],
+                    "b": [None, "x", None, "y", None, None],
+                    "c": [None, None, 3.0, None, None, None],
+                    "d": [None, None, None, None, None, None]}
+        with ThreadPoolExecutor(2) as pool:
+            for executor in (None, pool):
+                for chunksize in (1, 2, 4, 100):
+                    with self.subTest(executor=executor, chunksize=chunksize):
+                        columns = to_columns(records, executor, chunksize)
+                        self.assertEqual(columns, expected)
+                        self.assertEqual(list(columns), ["a", "b", "c", "d"])
+
+    def test_empty_input(self):
+        with ThreadPoolExecutor(2) as pool:
+            for executor in (None, pool):
+                self.assertEqual(validate_many([], executor), [])
+                self.assertEqual(to_dicts([], executor), [])
+                self.assertEqual(to_columns([], executor), {})
+
+    def test_invalid_chunksize(self):
+        with ThreadPoolExecutor(2) as pool:
+            with self.assertRaises(ValueError):
+                validate_many(self.records, pool, chunksize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,440 @@
+import asyncio
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from array import array
+
+from more_abc import AsyncRawIOAdapter, AsyncStreamIO, MmapRawIO, RingBufferedReader
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def temp_path(test, data=b""):
+    fd, path = tempfile.mkstemp()
+    os.write(fd, data)
+    os.close(fd)
+    test.addCleanup(os.remove, path)
+    return path
+
+
+class MmapRawIOTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def test_close_trims_spare_capacity(self):
+        with MmapRawIO(self.path, "w+") as f:
+            f.write(b"hello")
+        self.assertEqual(os.path.getsize(self.path), 5)
+
+    def test_close_with_live_view_keeps_stream_open(self):
+        f = MmapRawIO(self.path, "w+")
+        f.write(b"hello")
+        f.seek(0)
+        view = f.view(2)
+        with self.assertRaises(BufferError):
+            f.close()
+        self.assertFalse(f.closed)
+        self.assertEqual(bytes(view), b"he")
+        self.assertEqual(f.read(), b"llo")
+        view.release()
+        f.close()
+        self.assertTrue(f.closed)
+        self.assertEqual(os.path.getsize(self.path), 5)
+        with open(self.path, "rb") as g:
+            self.assertEqual(g.read(), b"hello")
+
+    def test_grow_with_live_view_keeps_mapping(self):
+        with MmapRawIO(self.path, "w+") as f:
+            f.write(b"ab")
+            f.seek(0)
+            view = f.view(1)
+            with self.assertRaises(BufferError):
+                f.write(b"x" * 1_000_000)
+            f.write(b"c")
+            view.release()
+            f.seek(0)
+            self.assertEqual(f.read(), b"ac")
+
+    def test_read_write_seek(self):
+        with MmapRawIO(self.path, "w+") as f:
+            self.assertEqual(f.write(b"hello world"), 11)
+            self.assertEqual(f.tell(), 11)
+            self.assertEqual(f.seek(-5, io.SEEK_END), 6)
+            self.assertEqual(f.read(), b"world")
+            self.assertEqual(f.read(), b"")
+            f.seek(0)
+            self.assertEqual(f.read(5), b"hello")
+            self.assertEqual(f.seek(1, io.SEEK_CUR), 6)
+            with self.assertRaises(ValueError):
+                f.seek(-1)
+        with MmapRawIO(self.path) as f:
+            self.assertEqual(f.read(), b"hello world")
+            with self.assertRaises(io.UnsupportedOperation):
+                f.write(b"x")
+
+    def test_readinto_targets(self):
+        with open(self.path, "wb") as g:
+            g.write(bytes(range(16)))
+        with MmapRawIO(self.path) as f:
+            buf = bytearray(5)
+            self.assertEqual(f.readinto(buf), 5)
+            self.assertEqual(buf, bytes(range(5)))
+            words = array("H", [0, 0])
+            self.assertEqual(f.readinto(words), 4)
+            self.assertEqual(words.tobytes(), bytes(range(5, 9)))
+            big = bytearray(100)
+            self.assertEqual(f.readinto(big), 7)
+            self.assertEqual(bytes(big[:7]), bytes(range(9, 16)))
+            self.assertEqual(f.readinto(big), 0)
+
+    def test_view_is_zero_copy_and_read_only(self):
+        with MmapRawIO(self.path, "w+") as f:
+            f.write(b"abcdef")
+            f.seek(1)
+            with f.view(3) as view:
+                self.assertEqual(bytes(view), b"bcd")
+                self.assertTrue(view.readonly)
+                f.seek(1)
+                f.write(b"X")
+                self.assertEqual(bytes(view), b"Xcd")
+            self.assertEqual(f.tell(), 2)
+
+    def test_truncate_and_regrow_reads_zeros(self):
+        with MmapRawIO(self.path, "w+") as f:
+            f.write(b"abcdef")
+            self.assertEqual(f.truncate(2), 2)
+            f.seek(4)
+            f.write(b"z")
+            f.seek(0)
+            self.assertEqual(f.read(), b"ab\0\0z")
+        self.assertEqual(os.path.getsize(self.path), 5)
+
+    def test_file_descriptor_without_closefd(self):
+        fd = os.open(self.path, os.O_RDWR)
+        self.addCleanup(os.close, fd)
+        with MmapRawIO(fd, "r+", closefd=False) as f:
+            f.write(b"fd")
+            self.assertEqual(f.fileno(), fd)
+        os.lseek(fd, 0, os.SEEK_SET)
+        self.assertEqual(os.read(fd, 10), b"fd")
+
+    def test_closed_stream_raises(self):
+        f = MmapRawIO(self.path, "w+")
+        f.close()
+        f.close()
+        for call in (f.read, f.tell, lambda: f.write(b"x")):
+            with self.assertRaises(ValueError):
+                call()
+
+
+class SlowRaw(io.RawIOBase):
+    """A raw stream over *data* whose reads block until *gate* is set."""
+
+    def __init__(self, data, gate=None, error=None):
+        self.data = memoryview(data)
+        self.pos = 0
+        self.gate = gate
+        self.error = error
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self.gate is not None:
+            self.gate.wait()
+        self.reads += 1
+        n = min(len(b), len(self.data) - self.pos)
+        if not n and self.error is not None:
+            raise self.error
+        b[:n] = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+
+class RingBufferedReaderTest(unittest.TestCase):
+    """RingBufferedReader over io.FileIO, checked against the file's bytes."""
+
+    def setUp(self):
+        rng = random.Random(21)
+        lines = [bytes(rng.randrange(97, 123) for _ in range(rng.randrange(0, 300))) + b"\n"
+                 for _ in range(300)]
+        self.data = b"".join(lines) + b"no newline at the end"
+        self.path = temp_path(self, self.data)
+
+    def open(self, capacity, prefetch):
+        return RingBufferedReader(io.FileIO(self.path, "r"), capacity=capacity, prefetch=prefetch)
+
+    def test_random_reads_match_the_file(self):
+        data = self.data
+        for capacity in (1, 7, 100, 4096, len(data) + 10):
+            for prefetch in (False, True):
+                with self.subTest(capacity=capacity, prefetch=prefetch):
+                    rng = random.Random(capacity)
+                    reader = self.open(capacity, prefetch)
+                    pos = 0
+                    while pos < len(data):
+                        op = rng.randrange(8)
+                        n = rng.choice((0, 1, 3, 50, 700, capacity, 2 * capacity + 1))
+                        if op == 0:
+                            got = reader.read(n)
+                            self.assertEqual(got, data[pos:pos + n])
+                        elif op == 1:
+                            got = reader.read1(n)
+                            if n:
+                                self.assertTrue(got)
+                            self.assertLessEqual(len(got), n)
+                            self.assertEqual(got, data[pos:pos + len(got)])
+                        elif op == 2:
+                            buf = bytearray(n)
+                            k = reader.readinto(buf)
+                            self.assertEqual(k, len(data[pos:pos + n]))
+                            got = bytes(buf[:k])
+                            self.assertEqual(got, data[pos:pos + n])
+                        elif op == 3:
+                            buf = bytearray(n)
+                            k = reader.readinto1(buf)
+                            got = bytes(buf[:k])
+                            self.assertEqual(got, data[pos:pos + k])
+                        elif op == 4:
+                            view = reader.peek_view(n)
+                            self.assertEqual(bytes(view), data[pos:pos + len(view)])
+                            self.assertTrue(view.readonly)
+                            self.assertEqual(reader.peek(), data[pos:pos + len(reader.peek())])
+                            got = b""
+                        elif op == 5:
+                            view = reader.read1_view(n)
+                            self.assertLessEqual(len(view), n if n else 0)
+                            got = bytes(view)
+                            self.assertEqual(got, data[pos:pos + len(got)])
+                        elif op == 6:
+                            got = reader.readline()
+                            end = data.find(b"\n", pos)
+                            self.assertEqual(got, data[pos:len(data) if end < 0 else end + 1])
+                        else:
+                            got = reader.read(0)
+                            self.assertEqual(got, b"")
+                        pos += len(got)
+                    self.assertEqual(reader.read(), b"")
+                    self.assertEqual(reader.read1(10), b"")
+                    self.assertEqual(reader.readinto(bytearray(5)), 0)
+                    self.assertEqual(len(reader.peek_view()), 0)
+                    reader.close()
+
+    def test_lines_match_fileio(self):
+        with io.FileIO(self.path) as f:
+            expected = f.readlines()
+        for capacity in (5, 64, 1 << 16):
+            for prefetch in (False, True):
+                with self.subTest(capacity=capacity, prefetch=prefetch):
+                    with self.open(capacity, prefetch) as reader:
+                        self.assertEqual(list(reader), expected)
+                    with self.open(capacity, prefetch) as reader:
+                        self.assertEqual(reader.read(), self.data)
+                    reference = io.BytesIO(self.data)
+                    with self.open(capacity, prefetch) as reader:
+                        for size in (0, 1, 7, 1000, -1, 3, None) * 20:
+                            self.assertEqual(reader.readline(size), reference.readline(size))
+
+    def test_views_never_cross_the_wrap_around(self):
+        with self.open(16, False) as reader:
+            self.assertEqual(reader.read(10), self.data[:10])
+            view = reader.read1_view()
+            self.assertEqual(bytes(view), self.data[10:16])
+            self.assertEqual(bytes(reader.read1_view(3)), self.data[16:19])
+
+    def test_read_all_and_fileno(self):
+        with self.open(64, False) as reader:
+            self.assertEqual(reader.fileno(), reader.raw.fileno())
+            self.assertEqual(reader.read(5), self.data[:5])
+            self.assertEqual(reader.read(-1), self.data[5:])
+            self.assertTrue(reader.readable())
+            with self.assertRaises(io.UnsupportedOperation):
+                reader.write(b"x")
+        self.assertTrue(reader.closed)
+        self.assertTrue(reader.raw.closed)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RingBufferedReader(io.BytesIO(b""), capacity=0)
+        with io.FileIO(self.path, "w") as f:
+            with self.assertRaises(OSError):
+                RingBufferedReader(f)
+
+
+class RingBufferedReaderPrefetchTest(unittest.TestCase):
+    def test_prefetch_reads_everything(self):
+        data = bytes(range(256)) * 40
+        for capacity in (1, 7, 256, 1 << 16):
+            with self.subTest(capacity=capacity):
+                reader = RingBufferedReader(SlowRaw(data), capacity=capacity, prefetch=True)
+                parts = []
+                sizes = [1, 3, 100, 7]
+                while True:
+                    chunk = reader.read(sizes[len(parts) % len(sizes)])
+                    if not chunk:
+                        break
+                    parts.append(chunk)
+                reader.close()
+                self.assertEqual(b"".join(parts), data)
+
+    def test_prefetch_fills_ring_ahead_of_consumer(self):
+        raw = SlowRaw(b"x" * 1000)
+        with RingBufferedReader(raw, capacity=64, prefetch=True) as reader:
+            self.assertEqual(reader.read(1), b"x")
+            deadline = time.monotonic() + 5
+            while reader._tail - reader._head < 63 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            self.assertEqual(reader._tail - reader._head, 63)
+
+    def test_close_with_full_ring_stops_producer(self):
+        raw = SlowRaw(b"x" * 10_000)
+        reader = RingBufferedReader(raw, capacity=16, prefetch=True)
+        self.assertEqual(reader.read(1), b"x")
+        thread = reader._thread
+        reader.close()
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(raw.closed)
+        self.assertTrue(reader.closed)
+        with self.assertRaises(ValueError):
+            reader.read(1)
+
+    def test_close_waits_for_in_flight_read(self):
+        gate = threading.Event()
+        raw = SlowRaw(b"abc", gate=gate)
+        reader = RingBufferedReader(raw, capacity=16, prefetch=True)
+        timer = threading.Timer(0.05, gate.set)
+        timer.start()
+        reader.close()
+        timer.join()
+        self.assertFalse(reader._thread.is_alive())
+        self.assertTrue(raw.closed)
+
+    def test_producer_error_surfaces_after_buffered_data(self):
+        raw = SlowRaw(b"abc", error=OSError("disk gone"))
+        with RingBufferedReader(raw, capacity=16, prefetch=True) as reader:
+            self.assertEqual(reader.read(3), b"abc")
+            with self.assertRaisesRegex(OSError, "disk gone"):
+                reader.read(1)
+
+
+class FakeWriter:
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+        self.closed = False
+
+    def write(self, b):
+        self.data += b
+
+    async def drain(self):
+        self.drains += 1
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+class AsyncAdapterTest(unittest.TestCase):
+    def test_streams_module_does_not_import_asyncio(self):
+        code = "import sys, more_abc.streams; print('asyncio' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH=ROOT),
+                             check=True, capture_output=True, text=True).stdout
+        self.assertEqual(out.strip(), "False")
+
+    def test_raw_adapter_round_trip(self):
+        path = temp_path(self)
+
+        async def main():
+            async with AsyncRawIOAdapter(io.FileIO(path, "w")) as f:
+                self.assertTrue(f.writable())
+                self.assertEqual(await f.write(b"one\ntwo\n"), 8)
+            f = AsyncRawIOAdapter(io.FileIO(path, "r"))
+            self.assertTrue(f.readable())
+            self.assertEqual(await f.readline(), b"one\n")
+            buf = bytearray(2)
+            self.assertEqual(await f.readinto(buf), 2)
+            self.assertEqual(buf, b"tw")
+            self.assertEqual(await f.readall(), b"o\n")
+            await f.close()
+            self.assertTrue(f.raw.closed)
+            with self.assertRaises(ValueError):
+                await f.read()
+
+        asyncio.run(main())
+
+    def test_raw_adapter_serialises_calls(self):
+        path = temp_path(self, b"abcdefgh")
+
+        async def main():
+            f = AsyncRawIOAdapter(io.FileIO(path, "r"))
+            parts = await asyncio.gather(*(f.read(2) for _ in range(4)))
+            self.assertEqual(sorted(parts), [b"ab", b"cd", b"ef", b"gh"])
+            await f.close()
+
+        asyncio.run(main())
+
+    def test_raw_adapter_cancelled_call_finishes_first(self):
+        gate = threading.Event()
+        raw = SlowRaw(b"abcdef", gate=gate)
+
+        async def main():
+            f = AsyncRawIOAdapter(raw)
+            task = asyncio.ensure_future(f.read(2))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            asyncio.get_running_loop().call_later(0.02, gate.set)
+            self.assertEqual(await f.read(2), b"cd")
+            self.assertEqual(raw.reads, 2)
+
+        asyncio.run(main())
+
+    def test_stream_io(self):
+        async def main():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"line one\nline two\nrest")
+            reader.feed_eof()
+            writer = FakeWriter()
+            f = AsyncStreamIO(reader, writer)
+            self.assertEqual(await f.readline(), b"line one\n")
+            self.assertEqual(await f.readline(4), b"line")
+            buf = bytearray(5)
+            self.assertEqual(await f.readinto(buf), 5)
+            self.assertEqual(buf, b" two\n")
+            self.assertEqual(await f.readall(), b"rest")
+            self.assertEqual(await f.write(memoryview(b"ping")), 4)
+            self.assertEqual((writer.data, writer.drains), (b"ping", 1))
+            await f.close()
+            self.assertTrue(writer.closed)
+            with self.assertRaises(ValueError):
+                await f.read()
+
+        asyncio.run(main())
+
+    def test_stream_io_one_direction(self):
+        async def main():
+            f = AsyncStreamIO(writer=FakeWriter())
+            self.assertFalse(f.readable())
+            with self.assertRaises(io.UnsupportedOperation):
+                await f.read()
+            g = AsyncStreamIO(reader=asyncio.StreamReader())
+            with self.assertRaises(io.UnsupportedOperation):
+                await g.write(b"x")
+
+        asyncio.run(main())
+
+
+if __name__ == "__main__":
+    unittest.main()